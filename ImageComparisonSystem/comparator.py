@@ -96,6 +96,8 @@ class ImageComparator:
             try:
                 shutil.rmtree(self.config.html_path)
                 self.config.html_path.mkdir(parents=True, exist_ok=True)
+                # Shared assets (scripts, stylesheets) must be rewritten for this run
+                self.report_generator.reset_assets()
                 logger.debug("Cleaned reports directory")
             except Exception as e:
                 logger.warning(f"Could not clean reports directory: {e}")
@@ -188,7 +190,7 @@ class ImageComparator:
                 results = self.history_manager.enrich_with_history(results)
 
                 # Log anomaly detection results
-                anomalies = [r for r in results if hasattr(r, 'is_anomaly') and r.is_anomaly]
+                anomalies = [r for r in results if getattr(r, 'is_anomaly', False)]
                 if anomalies:
                     logger.info(f"Detected {len(anomalies)} statistical anomalies:")
                     for result in anomalies[:5]:  # Show first 5
@@ -511,7 +513,7 @@ class ImageComparator:
                 results = self.history_manager.enrich_with_history(results)
 
                 # Log anomalies if any were detected
-                anomalies = [r for r in results if hasattr(r, 'is_anomaly') and r.is_anomaly]
+                anomalies = [r for r in results if getattr(r, 'is_anomaly', False)]
                 if anomalies:
                     logger.warning(f"Detected {len(anomalies)} statistical anomalies:")
                     for result in anomalies[:5]:  # Show first 5
@@ -658,13 +660,12 @@ class ImageComparator:
             )
 
         # Generate individual detail reports with subdirectory-specific navigation
-        for subdirectory, subdir_results in grouped.items():
-            for result in subdir_results:
-                # Pass only results from the same subdirectory for prev/next navigation
-                self.report_generator.generate_detail_report(result, subdir_results)
+        self.report_generator.generate_all_detail_reports(results)
 
         # Generate summary reports (HTML) - now shows subdirectories
         self.report_generator.generate_summary_report(results)
+        # Trend charts are done; free the chart figure
+        self.report_generator.close()
 
         # Generate markdown summary for CI/CD pipeline integration
         markdown_exporter = MarkdownExporter(self.config.html_path)
@@ -673,7 +674,9 @@ class ImageComparator:
         # Save results as JSON for potential later use
         json_path = self.config.html_path / "results.json"
         try:
-            with open(json_path, "w") as f:
+            # json.dump issues one small write per token; a large buffer
+            # turns those into a few syscalls
+            with open(json_path, "w", encoding="utf-8", buffering=1 << 20) as f:
                 json.dump(
                     [r.to_dict(self.config.new_path) for r in results], f, indent=2
                 )
@@ -167,6 +167,14 @@ class Config:
     show_dimension_visualization: bool = True
     """Whether to include dimension check visualizations in reports."""
 
+    # Report output
+    gzip_reports: bool = False
+    """Whether to write HTML report pages gzip-compressed (<name>.html.gz) for serving with Content-Encoding: gzip."""
+    chart_generation_policy: str = "all"
+    """Which detail pages get a trend chart: "all", or "interesting" (anomalies and scores above chart_score_threshold)."""
+    chart_score_threshold: float = 50.0
+    """Composite score above which a result gets a trend chart under the "interesting" policy."""
+
     def __post_init__(self) -> None:
         """Convert string paths to Path objects and validate.
 
@@ -187,6 +195,13 @@ class Config:
         if isinstance(self.history_db_path, str):
             self.history_db_path = Path(self.history_db_path)
 
+        # Validate trend chart policy
+        if self.chart_generation_policy not in {"all", "interesting"}:
+            raise ValueError(
+                f"Invalid chart_generation_policy: '{self.chart_generation_policy}'. "
+                f"Valid options: 'all', 'interesting'"
+            )
+
         # Validate FLIP colormap settings
         if self.enable_flip:
             valid_colormaps = {"viridis", "jet", "turbo", "magma"}
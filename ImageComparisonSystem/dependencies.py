@@ -87,7 +87,13 @@ class DependencyChecker:
     ]
 
     # Optional dependencies (not required for core functionality)
-    OPTIONAL_DEPENDENCIES = []
+    OPTIONAL_DEPENDENCIES = [
+        Dependency(
+            package_name="ciso8601",
+            import_name="ciso8601",
+            description="Faster timestamp parsing for historical trend charts",
+        ),
+    ]
 
     @staticmethod
     def check_package(dep: Dependency) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -179,6 +185,18 @@ class DependencyChecker:
                     )
 
         if verbose:
+            # Optional packages only speed things up; they are reported but
+            # never counted as missing
+            for dep in cls.OPTIONAL_DEPENDENCIES:
+                status = (
+                    "installed"
+                    if importlib.util.find_spec(dep.import_name) is not None
+                    else "optional"
+                )
+                logger.info(
+                    f"[{status:8s}] {dep.package_name:20s} {'(optional)':15s} - {dep.description}"
+                )
+
             logger.info("=" * 70)
 
             if all_satisfied:
@@ -383,6 +383,102 @@ class HistoryManager:
             logger.error(f"Failed to get history for image {filename}: {e}")
             return []
 
+    def get_history_for_images(
+        self, images: List[Tuple[str, Optional[str]]], limit: int = 100
+    ) -> Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]]:
+        """
+        Retrieve historical results for many images in one round-trip.
+
+        Batch equivalent of get_history_for_image(). Rows for all requested
+        filenames are fetched together and split per image, so report
+        generation does not issue one query per result.
+
+        Args:
+            images: List of (filename, subdirectory) pairs. A subdirectory of
+                None matches the filename in any subdirectory, as in
+                get_history_for_image().
+            limit: Maximum number of results to keep per image (default: 100)
+
+        Returns:
+            Dictionary mapping each requested (filename, subdirectory) pair to
+            its result dictionaries ordered by timestamp (newest first).
+            Images without history map to an empty list.
+
+        Example:
+            >>> history = history_manager.get_history_for_images(
+            ...     [("scene1.png", "renders"), ("scene2.png", None)], limit=50
+            ... )
+            >>> history[("scene1.png", "renders")][0]["composite_score"]
+        """
+        history: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {
+            key: [] for key in images
+        }
+        if not history:
+            return history
+
+        filenames = sorted({filename for filename, _ in history})
+
+        # Rank each filename's rows newest first, and also per subdirectory
+        # when specific subdirectories are asked for, so SQLite returns at
+        # most `limit` rows per requested image instead of the full history
+        rank_columns = [
+            "ROW_NUMBER() OVER (PARTITION BY r.filename "
+            "ORDER BY runs.timestamp DESC) AS file_rank"
+        ]
+        rank_filter = ["ranked.file_rank <= ?"]
+        if any(subdirectory is not None for _, subdirectory in history):
+            rank_columns.append(
+                "ROW_NUMBER() OVER (PARTITION BY r.filename, r.subdirectory "
+                "ORDER BY runs.timestamp DESC) AS subdir_rank"
+            )
+            rank_filter.append("ranked.subdir_rank <= ?")
+
+        try:
+            rows = []
+            # Stay well under SQLite's bound-parameter limit
+            chunk_size = 500
+            for start in range(0, len(filenames), chunk_size):
+                chunk = filenames[start:start + chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                query = f"""
+                    WITH ranked AS (
+                        SELECT r.result_id, {", ".join(rank_columns)}
+                        FROM results r
+                        JOIN runs ON r.run_id = runs.run_id
+                        WHERE r.filename IN ({placeholders})
+                    )
+                    SELECT r.*, runs.build_number, runs.timestamp
+                    FROM ranked
+                    JOIN results r ON r.result_id = ranked.result_id
+                    JOIN runs ON r.run_id = runs.run_id
+                    WHERE {" OR ".join(rank_filter)}
+                    ORDER BY runs.timestamp DESC
+                """
+                params = tuple(chunk) + (limit,) * len(rank_filter)
+                rows.extend(self.db.execute_query(query, params))
+
+            # Rows from separate chunks never share a filename, so per-image
+            # lists stay ordered newest first
+            for row in rows:
+                filename = row["filename"]
+                keys = {(filename, row["subdirectory"]), (filename, None)}
+                buckets = [
+                    bucket
+                    for bucket in (history.get(key) for key in keys)
+                    if bucket is not None and len(bucket) < limit
+                ]
+                if not buckets:
+                    continue
+                record = dict(row)
+                for bucket in buckets:
+                    bucket.append(record)
+
+            return history
+
+        except Exception as e:
+            logger.error(f"Failed to get history for {len(history)} images: {e}")
+            return {key: [] for key in history}
+
     def get_all_runs(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Retrieve all runs, ordered by timestamp (newest first).
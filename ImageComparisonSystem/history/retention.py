@@ -6,6 +6,7 @@ preserving important data like anomalies and annotated results.
 """
 
 import logging
+import sys
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -17,6 +18,14 @@ try:
 except ImportError:
     from database import Database  # type: ignore
 
+# Run timestamps are ISO 8601; fromisoformat accepts a trailing 'Z' only
+# from Python 3.11 on, so older versions rewrite it first
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class RetentionPolicy:
     """
@@ -184,16 +193,13 @@ class RetentionPolicy:
 
             for run in runs:
                 try:
-                    # Parse timestamp (ISO format)
-                    run_timestamp = datetime.fromisoformat(
-                        run["timestamp"].replace("Z", "+00:00")
-                    )
+                    run_timestamp = _parse_timestamp(run["timestamp"])
 
                     if run_timestamp < cutoff_date:
                         if run["run_id"] not in eligible:
                             eligible.append(run["run_id"])
                             age_eligible += 1
-                except (ValueError, AttributeError) as e:
+                except (ValueError, TypeError, AttributeError) as e:
                     logger.warning(f"Failed to parse timestamp for run {run['run_id']}: {e}")
                     continue
 
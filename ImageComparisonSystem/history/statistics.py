@@ -140,7 +140,7 @@ class StatisticsCalculator:
             >>> print(f"Anomaly: {result.is_anomaly}, Deviation: {result.std_dev_from_mean:.2f}σ")
         """
         # Ensure we have a composite score
-        if not hasattr(result, 'composite_score') or result.composite_score is None:
+        if getattr(result, 'composite_score', None) is None:
             logger.warning(f"Result {result.filename} has no composite_score, skipping statistics")
             return result
 
@@ -235,20 +235,20 @@ class StatisticsCalculator:
         # Count results with statistics
         with_stats = sum(
             1 for r in results
-            if hasattr(r, 'historical_mean') and r.historical_mean is not None
+            if getattr(r, 'historical_mean', None) is not None
         )
 
         # Count anomalies
         anomalies = sum(
             1 for r in results
-            if hasattr(r, 'is_anomaly') and r.is_anomaly
+            if getattr(r, 'is_anomaly', False)
         )
 
         # Find worst deviations
         deviations = [
             (r.filename, r.std_dev_from_mean, r.composite_score)
             for r in results
-            if hasattr(r, 'std_dev_from_mean') and r.std_dev_from_mean is not None
+            if getattr(r, 'std_dev_from_mean', None) is not None
         ]
         deviations.sort(key=lambda x: abs(x[1]), reverse=True)
 
@@ -286,12 +286,12 @@ class StatisticsCalculator:
         if include_non_anomalies:
             return [
                 r for r in results
-                if hasattr(r, 'is_anomaly') and not r.is_anomaly
+                if not getattr(r, 'is_anomaly', True)
             ]
         else:
             return [
                 r for r in results
-                if hasattr(r, 'is_anomaly') and r.is_anomaly
+                if getattr(r, 'is_anomaly', False)
             ]
 
     def get_trend_direction(
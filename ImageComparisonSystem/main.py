@@ -11,10 +11,11 @@ from pathlib import Path
 from typing import Optional
 import webbrowser
 from config import Config
-from ui import ComparisonUI
 
 # Don't import ImageComparator here - it requires skimage
 # We'll import it later when we actually need it
+# ComparisonUI is likewise imported only when the UI is launched, so
+# command-line runs never load tkinter
 
 # Setup logging as early as possible
 from logging_config import setup_logging, LOG_LEVELS
@@ -341,8 +342,34 @@ def parse_arguments() -> Optional[tuple]:
         help="Hide dimension check visualizations in reports",
     )
 
+    # Report output
+    parser.add_argument(
+        "--gzip-reports",
+        action="store_true",
+        help="Write HTML report pages gzip-compressed (.html.gz) for web servers",
+    )
+    parser.add_argument(
+        "--chart-policy",
+        dest="chart_generation_policy",
+        choices=["all", "interesting"],
+        default="all",
+        help="Render trend charts for all results, or only anomalies and high scores (default: all)",
+    )
+    parser.add_argument(
+        "--chart-score-threshold",
+        type=float,
+        default=50.0,
+        help="Composite score above which trend charts are rendered with --chart-policy interesting (default: 50.0)",
+    )
+
     args = parser.parse_args()
 
+    if args.open_report and args.gzip_reports:
+        parser.error(
+            "--open-report cannot be combined with --gzip-reports: "
+            "browsers do not open local .html.gz pages"
+        )
+
     # If --gui flag is set, skip CLI mode and return None to trigger GUI
     if args.gui:
         return None
@@ -410,6 +437,10 @@ def parse_arguments() -> Optional[tuple]:
                 show_color_distance_visualization=args.show_color_distance_visualization,
                 show_histogram_visualization=args.show_histogram_visualization,
                 show_dimension_visualization=args.show_dimension_visualization,
+                # Report output
+                gzip_reports=args.gzip_reports,
+                chart_generation_policy=args.chart_generation_policy,
+                chart_score_threshold=args.chart_score_threshold,
             ),
             args,
         )
@@ -661,6 +692,8 @@ def main():
 
         # Launch UI if not all arguments provided
         logger.info("Launching UI (not all command line arguments provided)...")
+        from ui import ComparisonUI
+
         ui = ComparisonUI()
         config = ui.run()
 
@@ -714,11 +747,13 @@ def main():
     logger.info(f"{len(results)} image pairs compared")
     report_dir = config.base_dir / config.html_dir
     logger.info(f"Reports saved to: {report_dir}")
-    logger.info("Open 'summary.html' to view results")
+    # With gzip_reports the pages are written as .html.gz
+    summary_name = "summary.html.gz" if config.gzip_reports else "summary.html"
+    logger.info(f"Open '{summary_name}' to view results")
 
     # Open report in browser if --open-report flag was provided
     if open_report_flag and results:
-        summary_path = report_dir / "summary.html"
+        summary_path = report_dir / summary_name
         if summary_path.exists():
             try:
                 # Convert to absolute path and open in browser
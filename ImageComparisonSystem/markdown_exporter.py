@@ -163,8 +163,7 @@ class MarkdownExporter:
 
             markdown_content = "\n".join(md_lines)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            output_path.write_text(markdown_content, encoding="utf-8")
             logger.info(f"Generated markdown summary: {output_path.name}")
 
             return output_path
@@ -5,9 +5,23 @@ Provides functionality to generate detailed HTML reports for individual
 image comparisons and summary pages showing all results.
 """
 
+import base64
+import binascii
+import bisect
+import functools
+import gzip
+import hashlib
+import itertools
 import logging
+import math
+import multiprocessing
+import os
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import numpy as np
 
 # Handle both package and direct module imports
@@ -29,8 +43,169 @@ except ImportError:
     except (ImportError, ValueError):
         TrendChartGenerator = None  # type: ignore
 
+# Prefer markupsafe's C-accelerated escape when installed (optional)
+try:
+    from markupsafe import escape as _markupsafe_escape
+
+    def _escape(value) -> str:
+        """Escape a dynamic value for safe insertion into HTML."""
+        return str(_markupsafe_escape(value))
+except ImportError:
+    from html import escape as _html_escape
+
+    def _escape(value) -> str:
+        """Escape a dynamic value for safe insertion into HTML."""
+        return _html_escape(str(value))
+
 logger = logging.getLogger("ImageComparison")
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# Status bands by percent difference: below 0.1, 1.0, 5.0, and above. Both
+# tables are indexed by bisect_right(_STATUS_THRESHOLDS, percent_diff).
+_STATUS_THRESHOLDS = (0.1, 1.0, 5.0)
+_STATUS_CLASSES = ("status-identical", "status-minor", "status-moderate", "status-major")
+_STATUS_TEXTS = (
+    "Nearly Identical",
+    "Minor Differences",
+    "Moderate Differences",
+    "Major Differences",
+)
+
+# Per-result CSS class / badge choices, indexed by a bool (False -> 0, True -> 1)
+_DEVIATION_CLASSES = ("deviation-normal", "deviation-high")
+_ANOMALY_BADGES = (
+    "",
+    ' <span class="anomaly-badge" title="Statistical anomaly detected">⚠️ ANOMALY</span>',
+)
+
+
+def _format_float(value: float) -> str:
+    """Format a float metric value to four decimal places."""
+    return format(value, ".4f")
+
+
+# Metric value formatters keyed by exact type; values of other types fall
+# back to an isinstance check so float subclasses still get four decimals
+_VALUE_FORMATTERS = {
+    float: _format_float,
+    np.float64: _format_float,
+    int: str,
+    bool: str,
+    str: str,
+    tuple: str,
+    list: str,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _format_metric_key(key: str) -> str:
+    """Format a metric key for display (cached; keys repeat in every report)."""
+    return key.replace("_", " ").title()
+
+
+# Path separators become underscores in subdirectory index page names
+_SUBDIR_NAME_TABLE = str.maketrans("/\\", "__")
+
+
+def _subdir_page_name(subdirectory: str) -> str:
+    """Return the index page filename for a subdirectory.
+
+    Args:
+        subdirectory: Subdirectory path relative to the new images directory
+            (empty string for root-level images)
+
+    Returns:
+        Filename such as "subdir_ui_buttons.html" or "subdir_root.html"
+    """
+    if not subdirectory:
+        return "subdir_root.html"
+    return f"subdir_{subdirectory.translate(_SUBDIR_NAME_TABLE)}.html"
+
+
+def _split_template(template: str) -> List[str]:
+    """Split a template into alternating literal text and placeholder names.
+
+    Even indices hold literal text and odd indices hold placeholder names,
+    so a template can be filled in one pass by _fill_template().
+
+    Args:
+        template: Template text containing {{NAME}} placeholders
+
+    Returns:
+        List of literal and placeholder-name segments
+    """
+    return _PLACEHOLDER_PATTERN.split(template)
+
+
+def _encode_literals(parts: List[str]) -> List[Union[str, bytes]]:
+    """Pre-encode the literal segments of a pre-split template to UTF-8.
+
+    Placeholder names (odd indices) are kept as str so the result can still
+    be filled by _fill_segments(); only substituted values then need
+    encoding when a page is written.
+
+    Args:
+        parts: Template segments from _split_template()
+
+    Returns:
+        Segments with literal text as bytes and placeholder names as str
+    """
+    return [part if i % 2 else part.encode("utf-8") for i, part in enumerate(parts)]
+
+
+def _fill_segments(
+    parts: List[Union[str, bytes]], values: Dict[str, str]
+) -> List[Union[str, bytes]]:
+    """Return the segments of a pre-split template with placeholders filled.
+
+    All placeholders are substituted in one batch (a single slice
+    assignment over the odd positions) rather than one segment at a time.
+    Placeholders without a value are left as-is, matching the behaviour of
+    repeated str.replace() calls.
+
+    Args:
+        parts: Template segments from _split_template() or _encode_literals()
+        values: Mapping of placeholder name to replacement text
+
+    Returns:
+        Literal text and substituted values, in document order
+    """
+    segments = parts[:]
+    segments[1::2] = [
+        values.get(name, f"{{{{{name}}}}}") for name in parts[1::2]
+    ]
+    return segments
+
+
+def _fill_template(parts: List[str], values: Dict[str, str]) -> str:
+    """Fill a pre-split template in a single pass.
+
+    Args:
+        parts: Template segments from _split_template()
+        values: Mapping of placeholder name to replacement text
+
+    Returns:
+        Rendered template
+    """
+    return "".join(_fill_segments(parts, values))
+
+
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SPACE_PATTERN = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    Applied once at import time to the static stylesheets so every run
+    writes the compact form.
+    """
+    css = _CSS_COMMENT_PATTERN.sub("", css)
+    css = " ".join(css.split())
+    css = _CSS_SPACE_PATTERN.sub(r"\1", css)
+    return css.replace(";}", "}")
+
 
 class ReportGenerator:
     """Generates HTML reports for comparison results.
@@ -64,6 +239,37 @@ class ReportGenerator:
         ),
     }
 
+    # Number of past runs shown in detail-page trend charts
+    HISTORY_LIMIT = 50
+
+    # Below this many reports, process pool start-up costs more than it saves
+    PARALLEL_MIN_REPORTS = 5
+
+    # Rendered trend charts kept in memory; detail pages are also rendered
+    # in batches of this size so a batch's charts are still cached when its
+    # pages are assembled
+    CHART_CACHE_SIZE = 256
+
+    # Part of the chart cache key; bump when chart rendering changes
+    CHART_RENDER_VERSION = 2
+
+    # Write buffer for report files; most pages fit in a single write
+    _WRITE_BUFFER_SIZE = 1 << 20
+
+    # gzip level for config.gzip_reports. Pages are mostly base64 PNG data
+    # and repeated markup; level 1 gets nearly all of the size reduction at
+    # a fraction of the CPU cost of higher levels.
+    _GZIP_COMPRESSLEVEL = 1
+
+    # One summary table row per subdirectory (formatted with str.format)
+    _SUMMARY_ROW_FMT = (
+        '<tr class="{status}"><td>{idx}</td>'
+        '<td><a href="{link}">{name}</a></td>'
+        "<td>{count}</td><td>{avg:.4f}%</td><td>{max:.4f}%</td>"
+        "<td>{composite}</td><td>{anomalies}</td>"
+        '<td><a href="{link}" class="btn-view">View Directory</a></td></tr>'
+    )
+
     def __init__(self, config: Config, history_manager=None) -> None:
         """Initialize report generator.
 
@@ -74,6 +280,30 @@ class ReportGenerator:
         self.config: Config = config
         self.history_manager = history_manager
 
+        # Shared static assets are written lazily, once per run
+        self._assets_written: bool = False
+
+        # Rendered trend charts keyed by a digest of their input data,
+        # least recently used first (bounded by CHART_CACHE_SIZE)
+        self._chart_cache: "OrderedDict[str, str]" = OrderedDict()
+
+        # Image directory -> path relative to the HTML output directory
+        self._relative_dirs: Dict[str, str] = {}
+
+        # Opening HTML of each analyzer's metric group, keyed by analyzer name
+        self._metric_headers: Dict[str, str] = {}
+
+        # Detail-page (subdir_link, breadcrumb_middle) HTML per subdirectory
+        self._breadcrumbs: Dict[str, Tuple[str, str]] = {}
+
+        # Composite score weights block, formatted on first use
+        self._composite_explanation: Optional[str] = None
+
+        # Optional detail-page sections, resolved once from the config so
+        # disabled sections cost nothing per report
+        self._render_flip: bool = bool(config.show_flip_visualization)
+        self._render_histogram: bool = bool(config.show_histogram_visualization)
+
         # Initialize chart generator if available
         self.chart_generator = None
         if TrendChartGenerator is not None:
@@ -85,7 +315,11 @@ class ReportGenerator:
                 self.chart_generator = None
 
     def generate_detail_report(
-        self, result: ComparisonResult, results: Optional[List[ComparisonResult]] = None
+        self,
+        result: ComparisonResult,
+        results: Optional[List[ComparisonResult]] = None,
+        historical_data: Optional[List[Dict[str, Any]]] = None,
+        index: Optional[int] = None,
     ) -> None:
         """Generate detailed HTML report for a single comparison.
 
@@ -95,6 +329,11 @@ class ReportGenerator:
         Args:
             result: Comparison result to generate report for
             results: Optional list of all results for navigation links
+            historical_data: Optional pre-fetched history records for this image
+                (as returned by HistoryManager). When None, history is queried
+                from the history manager.
+            index: Optional position of result in results; avoids searching
+                the list for it when building navigation links
         """
         output_path: Path = self.config.html_path / f"{result.filename}.html"
 
@@ -105,65 +344,69 @@ class ReportGenerator:
             diff_rel: str = self._get_relative_path(result.diff_image_path)
             annotated_rel: str = self._get_relative_path(result.annotated_image_path)
 
-            # Get subdirectory for breadcrumb and back link
-            subdir = result.get_subdirectory(self.config.new_path)
-            if subdir:
-                safe_subdir = subdir.replace("/", "_").replace("\\", "_")
-                subdir_link = f"subdir_{safe_subdir}.html"
-                breadcrumb_middle = f'<a href="{subdir_link}">{subdir}</a>'
-            else:
-                subdir_link = "subdir_root.html"
-                breadcrumb_middle = '<a href="subdir_root.html">Ungrouped</a>'
+            # Get subdirectory for breadcrumb and back link (shared by all
+            # results in the directory, so built once per subdirectory)
+            subdir = self._get_subdirectory(result)
+            breadcrumb = self._breadcrumbs.get(subdir)
+            if breadcrumb is None:
+                subdir_link = _escape(_subdir_page_name(subdir))
+                label = _escape(subdir) if subdir else "Ungrouped"
+                breadcrumb = (subdir_link, f'<a href="{subdir_link}">{label}</a>')
+                self._breadcrumbs[subdir] = breadcrumb
+            subdir_link, breadcrumb_middle = breadcrumb
 
             # Generate navigation links
             prev_link: str = ""
             next_link: str = ""
             if results and len(results) > 1:
                 # Find current result index
-                try:
-                    current_idx: int = next(
-                        i
-                        for i, r in enumerate(results)
-                        if r.filename == result.filename
+                current_idx: Optional[int] = index
+                if current_idx is None:
+                    current_idx = next(
+                        (
+                            i
+                            for i, r in enumerate(results)
+                            if r.filename == result.filename
+                        ),
+                        None,
                     )
 
+                if current_idx is not None:
                     # Previous link
                     if current_idx > 0:
                         prev_result: ComparisonResult = results[current_idx - 1]
-                        prev_link = f'<a href="{prev_result.filename}.html" class="btn">← Previous</a>'
+                        prev_link = f'<a href="{_escape(prev_result.filename)}.html" class="btn">← Previous</a>'
 
                     # Next link
                     if current_idx < len(results) - 1:
                         next_result: ComparisonResult = results[current_idx + 1]
-                        next_link = f'<a href="{next_result.filename}.html" class="btn">Next →</a>'
-                except StopIteration:
-                    pass
+                        next_link = f'<a href="{_escape(next_result.filename)}.html" class="btn">Next →</a>'
 
             # Generate historical section if available
+            history_records = historical_data
             historical_data = None
-            if self.history_manager and hasattr(result, 'composite_score') and result.composite_score is not None:
+            if result.composite_score is not None and (
+                history_records is not None or self.history_manager
+            ):
                 try:
-                    # Get subdirectory for this result
-                    subdirectory = result.get_subdirectory(self.config.new_path)
-
-                    # Query historical data for trend charts
-                    history_records = self.history_manager.get_history_for_image(
+                    if history_records is None:
+                        # Get subdirectory for this result
+                        subdirectory = self._get_subdirectory(result)
+
+                        # Query historical data for trend charts
+                        history_records = self.history_manager.get_history_for_image(
+                            result.filename,
+                            subdirectory=subdirectory if subdirectory else None,
+                            limit=self.HISTORY_LIMIT
+                        )
+
+                    historical_data = self._to_trend_data(history_records)
+
+                    logger.debug(
+                        "Retrieved %d historical data points for %s",
+                        len(historical_data),
                         result.filename,
-                        subdirectory=subdirectory if subdirectory else None,
-                        limit=50  # Last 50 runs for trend visualization
                     )
-
-                    # Format for trend chart: list of dicts with 'timestamp' and 'composite_score'
-                    historical_data = [
-                        {
-                            'timestamp': h['timestamp'],
-                            'composite_score': h['composite_score']
-                        }
-                        for h in history_records
-                        if h.get('composite_score') is not None
-                    ]
-
-                    logger.debug(f"Retrieved {len(historical_data)} historical data points for {result.filename}")
                 except Exception as e:
                     logger.warning(f"Failed to retrieve historical data for {result.filename}: {e}")
                     historical_data = None
@@ -171,137 +414,304 @@ class ReportGenerator:
             historical_section = self._generate_historical_section(result, historical_data=historical_data)
 
             # Generate FLIP section if available
-            flip_section = self._generate_flip_section(result)
+            flip_section = self._generate_flip_section(result) if self._render_flip else ""
 
             # Generate histogram section (conditional on config)
             histogram_section = ""
-            if self.config.show_histogram_visualization and result.histogram_data:
+            if self._render_histogram and result.histogram_data:
                 histogram_section = f'''
                 <div class="metrics">
                     <h2>Histogram Comparison</h2>
-                    <img src="data:image/png;base64,{result.histogram_data}" alt="Histograms" style="width: 100%; max-width: 1000px; margin: 20px 0;">
+                    <img src="{self._write_histogram_image(result)}" alt="Histograms" style="width: 100%; max-width: 1000px; margin: 20px 0;">
                 </div>
                 '''
 
-            html: str = self._get_html_template()
-            html = html.replace("{{TITLE}}", f"Comparison: {result.filename}")
-            html = html.replace("{{FILENAME}}", result.filename)
-            html = html.replace("{{PERCENT_DIFF}}", f"{result.percent_different:.4f}")
-            html = html.replace("{{NEW_IMAGE}}", new_img_rel)
-            html = html.replace("{{KNOWN_GOOD_IMAGE}}", known_good_rel)
-            html = html.replace("{{DIFF_IMAGE}}", diff_rel)
-            html = html.replace("{{ANNOTATED_IMAGE}}", annotated_rel)
-            html = html.replace("{{METRICS}}", self._format_metrics(result.metrics))
-            html = html.replace("{{FLIP_SECTION}}", flip_section)
-            html = html.replace("{{HISTOGRAM_SECTION}}", histogram_section)
-            html = html.replace("{{HISTORICAL_SECTION}}", historical_section)
-            html = html.replace("{{BREADCRUMB_MIDDLE}}", breadcrumb_middle)
-            html = html.replace("{{SUBDIR_LINK}}", subdir_link)
-            html = html.replace("{{PREV_LINK}}", prev_link)
-            html = html.replace("{{NEXT_LINK}}", next_link)
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            logger.info(f"Generated report: {output_path.name}")
+            safe_filename: str = _escape(result.filename)
+            segments = _fill_segments(
+                _HTML_TEMPLATE_BYTES,
+                {
+                    "TITLE": f"Comparison: {safe_filename}",
+                    "FILENAME": safe_filename,
+                    "PERCENT_DIFF": f"{result.percent_different:.4f}",
+                    "NEW_IMAGE": new_img_rel,
+                    "KNOWN_GOOD_IMAGE": known_good_rel,
+                    "DIFF_IMAGE": diff_rel,
+                    "ANNOTATED_IMAGE": annotated_rel,
+                    "METRICS": self._format_metrics(result.metrics),
+                    "FLIP_SECTION": flip_section,
+                    "HISTOGRAM_SECTION": histogram_section,
+                    "HISTORICAL_SECTION": historical_section,
+                    "BREADCRUMB_MIDDLE": breadcrumb_middle,
+                    "SUBDIR_LINK": subdir_link,
+                    "PREV_LINK": prev_link,
+                    "NEXT_LINK": next_link,
+                },
+            )
+
+            self._write_assets()
+            self._write_report_segments(output_path, segments)
+            # Per-page progress stays off the console; batches log one summary
+            logger.debug("Generated report: %s", output_path.name)
         except Exception as e:
             logger.error(
                 f"Error generating report for {result.filename}: {e}", exc_info=True
             )
 
-    def generate_summary_report(self, results: List[ComparisonResult]):
-        """Generate summary HTML report listing all comparisons grouped by subdirectory."""
-        output_path = self.config.html_path / "summary.html"
-
-        try:
-            # Group results by subdirectory
-            grouped = self._group_by_subdirectory(results)
+    def generate_all_detail_reports(self, results: List[ComparisonResult]) -> None:
+        """Generate detail reports for all results with a single history query.
 
-            # Sort subdirectories: empty string (root) first, then alphabetically
-            sorted_subdirs = sorted(grouped.keys(), key=lambda x: (x != "", x))
+        Results are grouped by subdirectory so prev/next navigation stays
+        within each directory. Historical data for every image is fetched in
+        one batch up front instead of one query per report. When
+        config.enable_parallel is set, pages are rendered across worker
+        processes.
 
-            rows_html = []
-            for idx, subdir in enumerate(sorted_subdirs):
-                subdir_results = grouped[subdir]
+        Args:
+            results: List of all comparison results
+        """
+        grouped = self._group_by_subdirectory(results)
+
+        history: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
+        if self.history_manager:
+            keys = [
+                (result.filename, subdirectory or None)
+                for subdirectory, subdir_results in grouped.items()
+                for result in subdir_results
+                if result.composite_score is not None
+            ]
+            if keys:
+                try:
+                    history = self.history_manager.get_history_for_images(
+                        keys, limit=self.HISTORY_LIMIT
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to retrieve historical data: {e}")
 
-                # Calculate statistics
-                image_count = len(subdir_results)
-                avg_diff = (
-                    sum(r.percent_different for r in subdir_results) / image_count
-                )
-                max_diff = max(r.percent_different for r in subdir_results)
-
-                # Calculate composite score statistics if available
-                composite_scores = [
-                    r.composite_score for r in subdir_results
-                    if hasattr(r, 'composite_score') and r.composite_score is not None
-                ]
-                avg_composite = (
-                    sum(composite_scores) / len(composite_scores)
-                    if composite_scores else None
+        if self.config.enable_parallel and len(results) >= self.PARALLEL_MIN_REPORTS:
+            self._generate_detail_reports_parallel(grouped, history)
+        else:
+            for subdir_results in grouped.values():
+                # Pass only results from the same subdirectory for prev/next navigation
+                _render_detail_chunk(
+                    self, subdir_results, range(len(subdir_results)), history
                 )
 
-                # Count anomalies
-                anomaly_count = sum(
-                    1 for r in subdir_results
-                    if hasattr(r, 'is_anomaly') and r.is_anomaly
+        logger.info(
+            "Finished %d detail reports in %d directories",
+            len(results),
+            len(grouped),
+        )
+
+    def _generate_detail_reports_parallel(
+        self,
+        grouped: Dict[str, List[ComparisonResult]],
+        history: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]],
+    ) -> None:
+        """Render detail reports across worker processes.
+
+        Each subdirectory is split into contiguous chunks so the workers
+        share the load evenly. A task carries only its chunk (plus the
+        neighbours needed for prev/next links) and the matching history
+        records, so the full result list is never pickled. Every worker
+        rebuilds its own ReportGenerator (and chart generator) from the
+        config. Workers are started with the "spawn" method because
+        Matplotlib state is not fork-safe. Chunks that fail in a worker are
+        rendered serially here.
+
+        Args:
+            grouped: Results grouped by subdirectory
+            history: Pre-fetched history records keyed by (filename, subdirectory)
+        """
+        max_workers = self.config.max_workers or os.cpu_count() or 1
+
+        # Workers skip asset writing, so write shared assets up front
+        self._write_assets()
+
+        tasks = []
+        for subdirectory, subdir_results in grouped.items():
+            subdir_key = subdirectory or None
+            chunk_size = max(1, math.ceil(len(subdir_results) / max_workers))
+            for start in range(0, len(subdir_results), chunk_size):
+                stop = min(start + chunk_size, len(subdir_results))
+                # Ship only the chunk plus one neighbour on each side, which
+                # is all prev/next navigation needs
+                lo = max(0, start - 1)
+                window = subdir_results[lo:stop + 1]
+                window_history = {
+                    (r.filename, subdir_key): history[(r.filename, subdir_key)]
+                    for r in window
+                    if (r.filename, subdir_key) in history
+                }
+                tasks.append(
+                    (
+                        self.config,
+                        window,
+                        range(start - lo, stop - lo),
+                        window_history,
+                    )
                 )
 
-                # Determine status class based on max difference
-                status_class = self._get_status_class(max_diff)
-
-                # Display name and link
-                if subdir:
-                    display_name = subdir
-                    safe_subdir = subdir.replace("/", "_").replace("\\", "_")
-                    subdir_link = f"subdir_{safe_subdir}.html"
-                else:
-                    display_name = "Ungrouped"
-                    subdir_link = "subdir_root.html"
-
-                # Format composite score cell
-                composite_cell = ""
-                if avg_composite is not None:
-                    composite_cell = f"{avg_composite:.1f}"
-                else:
-                    composite_cell = "N/A"
-
-                # Format anomaly cell
-                anomaly_cell = ""
-                if anomaly_count > 0:
-                    anomaly_cell = f'<span class="anomaly-count">{anomaly_count}</span>'
-                else:
-                    anomaly_cell = "0"
-
-                row = f"""
-                <tr class="{status_class}">
-                    <td>{idx + 1}</td>
-                    <td><a href="{subdir_link}">{display_name}</a></td>
-                    <td>{image_count}</td>
-                    <td>{avg_diff:.4f}%</td>
-                    <td>{max_diff:.4f}%</td>
-                    <td>{composite_cell}</td>
-                    <td>{anomaly_cell}</td>
-                    <td>
-                        <a href="{subdir_link}" class="btn-view">View Directory</a>
-                    </td>
-                </tr>
-            """
-                rows_html.append(row)
+        logger.info(
+            f"Generating detail reports in {len(tasks)} chunks using {max_workers} workers..."
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [
+                (executor.submit(_detail_report_worker, task), task) for task in tasks
+            ]
+
+            for future, task in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Detail report worker failed, rendering chunk serially: {e}"
+                    )
+                    _render_detail_chunk(self, *task[1:4])
+
+    def generate_summary_report(self, results: List[ComparisonResult]):
+        """Generate summary HTML report listing all comparisons grouped by subdirectory."""
+        output_path = self.config.html_path / "summary.html"
+
+        try:
+            # Group results by subdirectory
+            grouped = self._group_by_subdirectory(results)
 
             # Generate configuration section
             config_section = self._generate_config_section()
 
-            summary_html = self._get_summary_template()
-            summary_html = summary_html.replace("{{TOTAL_COUNT}}", str(len(results)))
-            summary_html = summary_html.replace("{{ROWS}}", "\n".join(rows_html))
-            summary_html = summary_html.replace("{{CONFIG_SECTION}}", config_section)
+            segments = _fill_segments(
+                _SUMMARY_TEMPLATE_BYTES,
+                {
+                    "TOTAL_COUNT": str(len(results)),
+                    "CONFIG_SECTION": config_section,
+                },
+            )
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(summary_html)
+            # Rows are built before the file is opened, so a failing row
+            # cannot leave a truncated summary.html; they are written as
+            # separate segments in place of {{ROWS}} rather than joined
+            rows = list(self._iter_summary_rows(grouped))
+
+            self._write_assets()
+            self._write_report_segments(
+                output_path,
+                itertools.chain(
+                    segments[:_SUMMARY_ROWS_INDEX],
+                    rows,
+                    segments[_SUMMARY_ROWS_INDEX + 1:],
+                ),
+            )
             logger.info("Generated summary report: summary.html")
         except Exception as e:
             logger.error(f"Error generating summary report: {e}", exc_info=True)
 
+    def _iter_summary_rows(
+        self, grouped: Dict[str, List[ComparisonResult]]
+    ) -> Iterator[str]:
+        """Yield summary table rows, one per subdirectory.
+
+        Args:
+            grouped: Results grouped by subdirectory
+
+        Yields:
+            Table row HTML fragments
+        """
+        # Sort subdirectories: empty string (root) first, then alphabetically
+        sorted_subdirs = sorted(grouped.keys(), key=lambda x: (x != "", x))
+
+        for idx, subdir in enumerate(sorted_subdirs):
+            subdir_results = grouped[subdir]
+
+            # Calculate statistics in a single pass
+            (
+                image_count,
+                avg_diff,
+                max_diff,
+                avg_composite,
+                anomaly_count,
+            ) = self._summarize_results(subdir_results)
+
+            # Determine status class based on max difference
+            status_class = self._get_status_class(max_diff)
+
+            # Display name and link
+            display_name = _escape(subdir) if subdir else "Ungrouped"
+            subdir_link = _escape(_subdir_page_name(subdir))
+
+            # Format composite score cell
+            composite_cell = ""
+            if avg_composite is not None:
+                composite_cell = f"{avg_composite:.1f}"
+            else:
+                composite_cell = "N/A"
+
+            # Format anomaly cell
+            anomaly_cell = ""
+            if anomaly_count > 0:
+                anomaly_cell = f'<span class="anomaly-count">{anomaly_count}</span>'
+            else:
+                anomaly_cell = "0"
+
+            yield self._SUMMARY_ROW_FMT.format(
+                status=status_class,
+                idx=idx + 1,
+                link=subdir_link,
+                name=display_name,
+                count=image_count,
+                avg=avg_diff,
+                max=max_diff,
+                composite=composite_cell,
+                anomalies=anomaly_cell,
+            )
+            yield "\n"
+
+    @staticmethod
+    def _summarize_results(
+        results: List[ComparisonResult],
+    ) -> Tuple[int, float, float, Optional[float], int]:
+        """Compute summary statistics for a group of results in one pass.
+
+        Args:
+            results: Non-empty list of comparison results for one subdirectory
+
+        Returns:
+            Tuple of (image_count, avg_diff, max_diff, avg_composite, anomaly_count).
+            avg_composite is None when no result has a composite score.
+        """
+        total_diff = 0.0
+        max_diff = float("-inf")
+        composite_total = 0.0
+        composite_count = 0
+        anomaly_count = 0
+
+        for r in results:
+            diff = r.percent_different
+            total_diff += diff
+            if diff > max_diff:
+                max_diff = diff
+            score = r.composite_score
+            if score is not None:
+                composite_total += score
+                composite_count += 1
+            if r.is_anomaly:
+                anomaly_count += 1
+
+        image_count = len(results)
+        avg_composite = (
+            composite_total / composite_count if composite_count else None
+        )
+        return (
+            image_count,
+            total_diff / image_count,
+            max_diff,
+            avg_composite,
+            anomaly_count,
+        )
+
     def generate_subdirectory_index(
         self, subdirectory: str, results: List[ComparisonResult]
     ) -> None:
@@ -316,21 +726,18 @@ class ReportGenerator:
             results: List of comparison results for this subdirectory
         """
         # Determine output filename
-        if subdirectory:
-            # Create safe filename from subdirectory path
-            safe_subdir = subdirectory.replace("/", "_").replace("\\", "_")
-            output_filename = f"subdir_{safe_subdir}.html"
-            display_name = subdirectory
-        else:
-            output_filename = "subdir_root.html"
-            display_name = "Ungrouped"
+        output_filename = _subdir_page_name(subdirectory)
+        display_name = _escape(subdirectory) if subdirectory else "Ungrouped"
 
         output_path = self.config.html_path / output_filename
 
         try:
+            # Classify every result up front; the cards only index the table
+            status_classes = self._get_status_classes(results)
+
             # Generate comparison cards
             cards_html = []
-            for result in results:
+            for result, status_class in zip(results, status_classes):
                 # Get relative paths for images
                 new_img_rel = self._get_relative_path(result.new_image_path)
                 known_good_rel = self._get_relative_path(result.known_good_path)
@@ -338,24 +745,23 @@ class ReportGenerator:
                 annotated_rel = self._get_relative_path(result.annotated_image_path)
 
                 # Detail page link
-                detail_link = f"{result.filename}.html"
-
-                # Status class for styling
-                status_class = self._get_status_class(result.percent_different)
+                safe_filename = _escape(result.filename)
+                detail_link = f"{safe_filename}.html"
 
                 # Get anomaly badge if available
                 anomaly_badge = self._get_anomaly_badge_html(result)
 
                 # Composite score if available
                 composite_info = ""
-                if hasattr(result, 'composite_score') and result.composite_score is not None:
-                    composite_info = f'<div class="composite-info">Score: {result.composite_score:.1f}/100</div>'
+                composite_score = result.composite_score
+                if composite_score is not None:
+                    composite_info = f'<div class="composite-info">Score: {composite_score:.1f}/100</div>'
 
                 # Build card HTML
                 card = f"""
             <a href="{detail_link}" class="comparison-card {status_class}">
                 <div class="card-header">
-                    <div class="filename">{result.filename} {anomaly_badge}</div>
+                    <div class="filename">{safe_filename} {anomaly_badge}</div>
                     <div class="card-metrics">
                         <div class="diff-badge">{result.percent_different:.4f}% diff</div>
                         {composite_info}
@@ -383,18 +789,22 @@ class ReportGenerator:
             """
                 cards_html.append(card)
 
-            # Get template and replace placeholders
-            html = self._get_subdirectory_index_template()
-            html = html.replace("{{SUBDIRECTORY}}", display_name)
-            html = html.replace("{{SUBDIRECTORY_DISPLAY}}", display_name)
-            html = html.replace("{{BACK_TO_SUMMARY}}", "summary.html")
-            html = html.replace("{{IMAGE_COUNT}}", str(len(results)))
-            html = html.replace("{{PLURAL}}", "s" if len(results) != 1 else "")
-            html = html.replace("{{COMPARISON_CARDS}}", "\n".join(cards_html))
+            # Fill placeholders in a single pass over the pre-split template
+            segments = _fill_segments(
+                _SUBDIR_TEMPLATE_BYTES,
+                {
+                    "SUBDIRECTORY": display_name,
+                    "SUBDIRECTORY_DISPLAY": display_name,
+                    "BACK_TO_SUMMARY": "summary.html",
+                    "IMAGE_COUNT": str(len(results)),
+                    "PLURAL": "s" if len(results) != 1 else "",
+                    "COMPARISON_CARDS": "\n".join(cards_html),
+                },
+            )
 
             # Write file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html)
+            self._write_assets()
+            self._write_report_segments(output_path, segments)
 
             logger.info(f"Generated subdirectory index: {output_filename}")
 
@@ -423,7 +833,7 @@ class ReportGenerator:
         grouped = defaultdict(list)
 
         for result in results:
-            subdir = result.get_subdirectory(self.config.new_path)
+            subdir = self._get_subdirectory(result)
             grouped[subdir].append(result)
 
         # Sort each group by percent_different (descending)
@@ -432,92 +842,233 @@ class ReportGenerator:
 
         return dict(grouped)
 
+    def reset_assets(self) -> None:
+        """Mark shared assets as missing so the next page rewrites them.
+
+        Call after the reports directory has been deleted or cleaned.
+        """
+        self._assets_written = False
+
+    def close(self) -> None:
+        """Release the trend chart figure; it is recreated if charts are needed again."""
+        if self.chart_generator is not None:
+            self.chart_generator.close()
+
+    def _write_assets(self) -> None:
+        """Write static assets shared by all report pages (once per run).
+
+        Assets are written on first use rather than at construction because
+        the reports directory is cleaned at the start of each comparison run.
+        """
+        if self._assets_written:
+            return
+
+        try:
+            self.config.html_path.mkdir(parents=True, exist_ok=True)
+            for name, content in (
+                ("flip.js", _FLIP_JS),
+                ("styles.css", _DETAIL_CSS),
+                ("subdir_styles.css", _SUBDIR_CSS),
+                ("summary_styles.css", _SUMMARY_CSS),
+            ):
+                (self.config.html_path / name).write_bytes(content.encode("utf-8"))
+            self._assets_written = True
+        except Exception as e:
+            logger.warning(f"Failed to write report assets: {e}")
+
+    def _write_report_segments(
+        self, output_path: Path, segments: Iterable[Union[str, bytes]]
+    ) -> None:
+        """Stream an HTML page to disk segment by segment.
+
+        Segments are written one at a time through a large buffer, so the
+        full document is never joined into a single string. Text segments
+        are UTF-8 encoded; pre-encoded template literals are written as-is.
+        When config.gzip_reports is set, the page is written gzip-compressed
+        to <output_path>.gz instead.
+
+        Args:
+            output_path: Destination file path
+            segments: HTML fragments in document order
+        """
+        if self.config.gzip_reports:
+            output_path = output_path.with_name(output_path.name + ".gz")
+            f = gzip.open(output_path, "wb", compresslevel=self._GZIP_COMPRESSLEVEL)
+        else:
+            f = open(output_path, "wb", buffering=self._WRITE_BUFFER_SIZE)
+
+        with f:
+            for segment in segments:
+                if isinstance(segment, str):
+                    segment = segment.encode("utf-8")
+                f.write(segment)
+
+    def _write_histogram_image(self, result: ComparisonResult) -> str:
+        """Write a result's histogram PNG next to its detail page.
+
+        The histogram arrives base64-encoded; decoding it once and linking
+        the file keeps the largest payload out of the page itself. Data that
+        does not decode is embedded inline as before.
+
+        Args:
+            result: Comparison result with histogram_data
+
+        Returns:
+            Image src for the histogram
+        """
+        file_name = f"{result.filename}_hist.png"
+        try:
+            png = base64.b64decode(result.histogram_data, validate=True)
+            (self.config.html_path / file_name).write_bytes(png)
+        except (binascii.Error, ValueError, OSError) as e:
+            logger.debug("Embedding histogram for %s inline: %s", result.filename, e)
+            return f"data:image/png;base64,{result.histogram_data}"
+        return _escape(file_name)
+
+    def _get_subdirectory(self, result: ComparisonResult) -> str:
+        """Return the result's subdirectory, memoized on the result object.
+
+        The subdirectory is needed for grouping, breadcrumbs and history
+        lookups; caching it avoids repeating the relative path computation.
+
+        Args:
+            result: Comparison result
+
+        Returns:
+            Subdirectory path relative to the new images directory
+        """
+        new_path = self.config.new_path
+        cached = result.__dict__.get("_subdirectory_cache")
+        if cached is not None and cached[0] == new_path:
+            return cached[1]
+
+        # Many results share a subdirectory; interning lets the grouping and
+        # history dict lookups compare keys by identity
+        subdir = sys.intern(result.get_subdirectory(new_path))
+        result.__dict__["_subdirectory_cache"] = (new_path, subdir)
+        return subdir
+
     def _get_relative_path(self, path: Path) -> str:
-        """Get relative path from HTML directory to image."""
+        """Get relative path from HTML directory to image.
+
+        Images live in a handful of directories, so each parent directory's
+        relative path is computed once and cached; only the filename is
+        appended per call.
+        """
         try:
             # Compute path relative to the HTML output directory so links work
             # regardless of where images are stored under the project.
-            from os import path as _opath
-
-            rel = _opath.relpath(str(path), start=str(self.config.html_path))
-            return rel.replace("\\", "/")
+            parent, name = os.path.split(os.fspath(path))
+            rel_dir = self._relative_dirs.get(parent)
+            if rel_dir is None:
+                rel_dir = os.path.relpath(
+                    parent or os.curdir, start=str(self.config.html_path)
+                ).replace("\\", "/")
+                self._relative_dirs[parent] = rel_dir
+            return name if rel_dir == "." else f"{rel_dir}/{name}"
         except Exception:
             return str(path)
 
     def _format_metrics(self, metrics: dict) -> str:
         """Format metrics dictionary as HTML with togglable descriptions."""
-        html_parts = []
+        return "".join(self._iter_metrics_html(metrics))
 
-        for analyzer_name, analyzer_metrics in metrics.items():
-            # Generate unique ID for this metric group
-            group_id = analyzer_name.lower().replace(" ", "-")
-            description = self.METRIC_DESCRIPTIONS.get(analyzer_name, "")
+    def _iter_metrics_html(self, metrics: dict) -> Iterator[str]:
+        """Yield the HTML for each analyzer's metric group in order.
 
-            html_parts.append('<div class="metric-group">')
-            html_parts.append(
-                f'<div class="metric-header" onclick="toggleDescription(\'{group_id}\')">'
+        Args:
+            metrics: Mapping of analyzer name to its metrics dict
+
+        Yields:
+            HTML fragments for the metrics section
+        """
+        format_value = self._format_value
+        for analyzer_name, analyzer_metrics in metrics.items():
+            yield self._get_metric_group_header(analyzer_name)
+            yield "".join(
+                f"<dt>{_format_metric_key(key)}</dt><dd>{format_value(value)}</dd>"
+                for key, value in analyzer_metrics.items()
+                if key != "error"
             )
-            html_parts.append(f"<h3>{analyzer_name}</h3>")
-            if description:
-                html_parts.append(
-                    '<span class="metric-help-icon" title="Click to see description">?</span>'
-                )
-            html_parts.append("</div>")
+            yield "</dl></div>"
 
-            if description:
-                html_parts.append(
-                    f'<div class="metric-description" id="{group_id}-desc" style="display: none;">'
-                )
-                html_parts.append(f"<p>{description}</p>")
-                html_parts.append("</div>")
+    def _get_metric_group_header(self, analyzer_name: str) -> str:
+        """Return the opening HTML of an analyzer's metric group, built once.
 
-            html_parts.append("<dl>")
+        The header (title, help icon and description) depends only on the
+        analyzer name, so it is cached and reused across reports.
 
-            for key, value in analyzer_metrics.items():
-                if key != "error":
-                    formatted_value = self._format_value(value)
-                    html_parts.append(f"<dt>{self._format_key(key)}</dt>")
-                    html_parts.append(f"<dd>{formatted_value}</dd>")
+        Args:
+            analyzer_name: Analyzer name as used in the metrics dict
+
+        Returns:
+            HTML up to and including the opening <dl> tag
+        """
+        header = self._metric_headers.get(analyzer_name)
+        if header is not None:
+            return header
+
+        # Generate unique ID for this metric group
+        group_id = analyzer_name.lower().replace(" ", "-")
+        description = self.METRIC_DESCRIPTIONS.get(analyzer_name, "")
+
+        html_parts = [
+            '<div class="metric-group">',
+            f'<div class="metric-header" onclick="toggleDescription(\'{group_id}\')">',
+            f"<h3>{analyzer_name}</h3>",
+        ]
+        if description:
+            html_parts.append(
+                '<span class="metric-help-icon" title="Click to see description">?</span>'
+            )
+        html_parts.append("</div>")
 
-            html_parts.append("</dl>")
+        if description:
+            html_parts.append(
+                f'<div class="metric-description" id="{group_id}-desc" style="display: none;">'
+            )
+            html_parts.append(f"<p>{description}</p>")
             html_parts.append("</div>")
 
-        return "\n".join(html_parts)
+        html_parts.append("<dl>")
+
+        header = "".join(html_parts)
+        self._metric_headers[analyzer_name] = header
+        return header
 
     def _format_key(self, key: str) -> str:
         """Format metric key for display."""
-        return key.replace("_", " ").title()
+        return _format_metric_key(key)
 
     def _format_value(self, value) -> str:
         """Format metric value for display."""
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
         if isinstance(value, float):
-            return f"{value:.4f}"
-        elif isinstance(value, (tuple, list)):
-            return str(value)
-        else:
-            return str(value)
+            return _format_float(value)
+        return str(value)
 
     def _get_status_class(self, percent_diff: float) -> str:
         """Get CSS class based on difference percentage."""
-        if percent_diff < 0.1:
-            return "status-identical"
-        elif percent_diff < 1.0:
-            return "status-minor"
-        elif percent_diff < 5.0:
-            return "status-moderate"
-        else:
-            return "status-major"
+        return _STATUS_CLASSES[bisect.bisect_right(_STATUS_THRESHOLDS, percent_diff)]
+
+    @staticmethod
+    def _get_status_classes(results: List[ComparisonResult]) -> List[str]:
+        """Get the status class of each result, in order.
+
+        Args:
+            results: Comparison results to classify
+
+        Returns:
+            CSS status classes parallel to results
+        """
+        band = functools.partial(bisect.bisect_right, _STATUS_THRESHOLDS)
+        return [_STATUS_CLASSES[band(r.percent_different)] for r in results]
 
     def _get_status_text(self, percent_diff: float) -> str:
         """Get status text based on difference percentage."""
-        if percent_diff < 0.1:
-            return "Nearly Identical"
-        elif percent_diff < 1.0:
-            return "Minor Differences"
-        elif percent_diff < 5.0:
-            return "Moderate Differences"
-        else:
-            return "Major Differences"
+        return _STATUS_TEXTS[bisect.bisect_right(_STATUS_THRESHOLDS, percent_diff)]
 
     def _get_nav_link(self, direction: str, result: ComparisonResult) -> str:
         """Generate navigation link HTML - deprecated, kept for compatibility."""
@@ -612,31 +1163,13 @@ class ReportGenerator:
 
         html_parts.append('</div>')  # Close flip-colormap-tabs
 
-        # Add JavaScript for tab switching
-        html_parts.append('''
-        <script>
-        function showFlipTab(colormapName) {
-            // Hide all tab contents
-            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
-
-            // Remove active class from all buttons
-            document.querySelectorAll('.tab-button').forEach(btn => btn.classList.remove('active'));
-
-            // Show selected tab
-            const tabContent = document.getElementById('flip-tab-' + colormapName);
-            if (tabContent) {
-                tabContent.style.display = 'block';
-            }
-
-            // Add active class to clicked button
-            event.target.classList.add('active');
-        }
-        </script>
-        ''')
+        # Tab switching script is shared by all reports (see _write_assets)
+        html_parts.append('<script src="flip.js"></script>')
+        self._write_assets()
 
         html_parts.append('</div>')  # Close metrics flip-section
 
-        return '\n'.join(html_parts)
+        return ''.join(html_parts)
 
     def _generate_historical_section(
         self, result: ComparisonResult, historical_data: Optional[List[dict]] = None
@@ -651,7 +1184,8 @@ class ReportGenerator:
             HTML string for historical section, or empty string if no history
         """
         # Check if result has historical data
-        if not hasattr(result, 'composite_score') or result.composite_score is None:
+        composite_score = result.composite_score
+        if composite_score is None:
             return ""
 
         html_parts = []
@@ -664,66 +1198,52 @@ class ReportGenerator:
         html_parts.append('<dt>Composite Score</dt>')
 
         # Add anomaly badge if flagged
-        anomaly_badge = ""
-        if hasattr(result, 'is_anomaly') and result.is_anomaly:
-            anomaly_badge = ' <span class="anomaly-badge" title="Statistical anomaly detected">⚠️ ANOMALY</span>'
+        anomaly_badge = _ANOMALY_BADGES[bool(result.is_anomaly)]
 
-        html_parts.append(f'<dd class="composite-score">{result.composite_score:.2f}/100{anomaly_badge}</dd>')
+        html_parts.append(f'<dd class="composite-score">{composite_score:.2f}/100{anomaly_badge}</dd>')
         html_parts.append('</div>')
 
-        # Composite score explanation with weights
-        html_parts.append('<div class="composite-explanation">')
-        html_parts.append('<p class="explanation-text"><strong>Composite Score</strong> is a weighted combination of multiple metrics:</p>')
-        html_parts.append('<ul class="metric-weights">')
-
-        # Get weights from config (default: 0.25 each)
-        weights = getattr(self.config, 'composite_metric_weights', None)
-        if not weights:
-            weights = {
-                'pixel_diff': 0.25,
-                'ssim': 0.25,
-                'color_distance': 0.25,
-                'histogram': 0.25
-            }
-
-        html_parts.append(f'<li><strong>Pixel Difference:</strong> {weights.get("pixel_diff", 0.25) * 100:.0f}% weight</li>')
-        html_parts.append(f'<li><strong>SSIM (Structural Similarity):</strong> {weights.get("ssim", 0.25) * 100:.0f}% weight</li>')
-        html_parts.append(f'<li><strong>Color Distance:</strong> {weights.get("color_distance", 0.25) * 100:.0f}% weight</li>')
-        html_parts.append(f'<li><strong>Histogram Correlation:</strong> {weights.get("histogram", 0.25) * 100:.0f}% weight</li>')
-        html_parts.append('</ul>')
-        html_parts.append('<p class="explanation-text"><em>Lower scores indicate better similarity (0 = identical, 100 = completely different)</em></p>')
-        html_parts.append('</div>')
+        # Composite score explanation with weights (identical for every page)
+        html_parts.append(self._get_composite_explanation())
 
         # Historical statistics if available
-        if hasattr(result, 'historical_mean') and result.historical_mean is not None:
-            html_parts.append('<div class="history-stats">')
-            html_parts.append('<dl class="history-stats-grid">')
-
-            html_parts.append('<dt>Historical Mean</dt>')
-            html_parts.append(f'<dd>{result.historical_mean:.2f}</dd>')
-
-            if hasattr(result, 'historical_std_dev') and result.historical_std_dev is not None:
-                html_parts.append('<dt>Standard Deviation</dt>')
-                html_parts.append(f'<dd>{result.historical_std_dev:.2f}</dd>')
-
-            if hasattr(result, 'std_dev_from_mean') and result.std_dev_from_mean is not None:
-                html_parts.append('<dt>Deviation from Mean</dt>')
-                deviation_class = "deviation-high" if abs(result.std_dev_from_mean) > 2.0 else "deviation-normal"
-                html_parts.append(f'<dd class="{deviation_class}">{result.std_dev_from_mean:.2f}σ</dd>')
+        historical_mean = result.historical_mean
+        if historical_mean is not None:
+            historical_std_dev = result.historical_std_dev
+            std_dev_from_mean = result.std_dev_from_mean
+
+            # Format each statistic once up front
+            mean_str = format(historical_mean, ".2f")
+            std_dev_html = (
+                f'<dt>Standard Deviation</dt><dd>{format(historical_std_dev, ".2f")}</dd>'
+                if historical_std_dev is not None else ''
+            )
+            deviation_html = ''
+            if std_dev_from_mean is not None:
+                deviation_class = _DEVIATION_CLASSES[abs(std_dev_from_mean) > 2.0]
+                dev_str = format(std_dev_from_mean, ".2f")
+                deviation_html = (
+                    f'<dt>Deviation from Mean</dt>'
+                    f'<dd class="{deviation_class}">{dev_str}σ</dd>'
+                )
 
-            html_parts.append('</dl>')
-            html_parts.append('</div>')
+            html_parts.append(
+                f'<div class="history-stats"><dl class="history-stats-grid">'
+                f'<dt>Historical Mean</dt><dd>{mean_str}</dd>'
+                f'{std_dev_html}{deviation_html}</dl></div>'
+            )
 
         html_parts.append('</div>')
 
         # Generate trend chart if data available
-        if self.chart_generator and historical_data and len(historical_data) >= 2:
+        if (
+            self.chart_generator
+            and historical_data
+            and len(historical_data) >= 2
+            and self._wants_chart(result)
+        ):
             try:
-                chart_base64 = self.chart_generator.generate_trend_chart(
-                    historical_data=historical_data,
-                    filename=result.filename,
-                    title=f"Historical Trend: {result.filename}"
-                )
+                chart_base64 = self._get_trend_chart(result.filename, historical_data)
 
                 if chart_base64:
                     html_parts.append('<div class="trend-chart">')
@@ -731,11 +1251,169 @@ class ReportGenerator:
                     html_parts.append(f'<img src="data:image/png;base64,{chart_base64}" alt="Trend Chart" style="width: 100%; max-width: 900px;">')
                     html_parts.append('</div>')
             except Exception as e:
-                logger.debug(f"Failed to generate trend chart: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Failed to generate trend chart: %s", e)
 
         html_parts.append('</div>')
 
-        return "\n".join(html_parts)
+        return "".join(html_parts)
+
+    def _wants_chart(self, result: ComparisonResult) -> bool:
+        """Return True if the result's detail page should get a trend chart.
+
+        Under the "interesting" chart_generation_policy only anomalies and
+        results scoring above chart_score_threshold get a chart, so large
+        runs skip rendering charts for pages that are rarely opened.
+
+        Args:
+            result: Comparison result with history fields
+
+        Returns:
+            True if a trend chart should be rendered
+        """
+        if self.config.chart_generation_policy == "all":
+            return True
+        return bool(result.is_anomaly) or (
+            result.composite_score is not None
+            and result.composite_score > self.config.chart_score_threshold
+        )
+
+    @staticmethod
+    def _to_trend_data(history_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format history records for the trend chart.
+
+        Args:
+            history_records: History records as returned by HistoryManager
+
+        Returns:
+            List of dicts with 'timestamp' and 'composite_score'
+        """
+        return [
+            {
+                'timestamp': h['timestamp'],
+                'composite_score': h['composite_score']
+            }
+            for h in history_records
+            if h.get('composite_score') is not None
+        ]
+
+    def _precompute_charts(
+        self,
+        results: List[ComparisonResult],
+        history: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]],
+    ) -> None:
+        """Render trend charts for a batch of results ahead of HTML assembly.
+
+        Charts land in the chart cache, so building each detail page is a
+        cache lookup followed by pure string work. Rendering stays serial
+        within a process because pyplot keeps global figure state; batches
+        run concurrently across processes when config.enable_parallel is set.
+
+        Args:
+            results: Results whose detail pages are about to be generated
+            history: Pre-fetched history records keyed by (filename, subdirectory)
+        """
+        if not self.chart_generator:
+            return
+
+        for result in results:
+            if result.composite_score is None or not self._wants_chart(result):
+                continue
+            records = history.get((result.filename, self._get_subdirectory(result) or None))
+            if not records:
+                continue
+            historical_data = self._to_trend_data(records)
+            if len(historical_data) < 2:
+                continue
+            try:
+                self._get_trend_chart(result.filename, historical_data)
+            except Exception as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Failed to generate trend chart: %s", e)
+
+    def _get_composite_explanation(self) -> str:
+        """Return the composite score weights explanation, built once.
+
+        The weights come from the run configuration and do not vary per
+        result, so the block is formatted on first use and reused for every
+        detail page.
+
+        Returns:
+            HTML string for the composite score explanation
+        """
+        if self._composite_explanation is not None:
+            return self._composite_explanation
+
+        # Get weights from config (default: 0.25 each)
+        weights = getattr(self.config, 'composite_metric_weights', None)
+        if not weights:
+            weights = {
+                'pixel_diff': 0.25,
+                'ssim': 0.25,
+                'color_distance': 0.25,
+                'histogram': 0.25
+            }
+
+        self._composite_explanation = "".join([
+            '<div class="composite-explanation">',
+            '<p class="explanation-text"><strong>Composite Score</strong> is a weighted combination of multiple metrics:</p>',
+            '<ul class="metric-weights">',
+            f'<li><strong>Pixel Difference:</strong> {weights.get("pixel_diff", 0.25) * 100:.0f}% weight</li>',
+            f'<li><strong>SSIM (Structural Similarity):</strong> {weights.get("ssim", 0.25) * 100:.0f}% weight</li>',
+            f'<li><strong>Color Distance:</strong> {weights.get("color_distance", 0.25) * 100:.0f}% weight</li>',
+            f'<li><strong>Histogram Correlation:</strong> {weights.get("histogram", 0.25) * 100:.0f}% weight</li>',
+            '</ul>',
+            '<p class="explanation-text"><em>Lower scores indicate better similarity (0 = identical, 100 = completely different)</em></p>',
+            '</div>',
+        ])
+        return self._composite_explanation
+
+    def _get_trend_chart(
+        self, filename: str, historical_data: List[dict]
+    ) -> Optional[str]:
+        """Return a base64 trend chart, reusing previously rendered charts.
+
+        Charts are cached in memory for this generator, keyed by a digest of
+        the render version, figure size, filename and plotted points, so a
+        chart rendered by _precompute_charts is not re-rendered for its page.
+
+        Args:
+            filename: Image filename (used in the chart title)
+            historical_data: List of dicts with 'timestamp' and 'composite_score'
+
+        Returns:
+            Base64-encoded PNG string, or None if the chart could not be generated
+        """
+        digest = hashlib.sha1(
+            repr(
+                (
+                    self.CHART_RENDER_VERSION,
+                    getattr(self.chart_generator, "figsize", None),
+                    getattr(self.chart_generator, "dpi", None),
+                    filename,
+                    [(h["timestamp"], h["composite_score"]) for h in historical_data],
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+        chart_base64 = self._chart_cache.get(digest)
+        if chart_base64 is not None:
+            self._chart_cache.move_to_end(digest)
+            return chart_base64
+
+        chart_base64 = self.chart_generator.generate_trend_chart(
+            historical_data=historical_data,
+            filename=filename,
+            title=f"Historical Trend: {filename}"
+        )
+        if not chart_base64:
+            return None
+
+        self._chart_cache[digest] = chart_base64
+        if len(self._chart_cache) > self.CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+
+        return chart_base64
 
     def _get_anomaly_badge_html(self, result: ComparisonResult) -> str:
         """Generate anomaly badge HTML for summary tables.
@@ -746,7 +1424,7 @@ class ReportGenerator:
         Returns:
             HTML string with anomaly badge, or empty string
         """
-        if hasattr(result, 'is_anomaly') and result.is_anomaly:
+        if result.is_anomaly:
             return '<span class="anomaly-badge-small" title="Statistical anomaly">⚠️</span>'
         return ""
 
@@ -756,65 +1434,57 @@ class ReportGenerator:
         Returns:
             HTML string with configuration details
         """
-        html_parts = []
-        html_parts.append('<div class="config-section">')
-        html_parts.append('<h2>Run Configuration</h2>')
-        html_parts.append('<div class="config-grid">')
-
-        # Paths
-        html_parts.append('<div class="config-group">')
-        html_parts.append('<h3>Directories</h3>')
-        html_parts.append('<dl class="config-list">')
-        html_parts.append('<dt>Base Directory</dt>')
-        html_parts.append(f'<dd><code>{self.config.base_dir}</code></dd>')
-        html_parts.append('<dt>New Images</dt>')
-        html_parts.append(f'<dd><code>{self.config.new_dir}</code></dd>')
-        html_parts.append('<dt>Known Good Images</dt>')
-        html_parts.append(f'<dd><code>{self.config.known_good_dir}</code></dd>')
-        html_parts.append('</dl>')
-        html_parts.append('</div>')
-
-        # Comparison Settings
-        html_parts.append('<div class="config-group">')
-        html_parts.append('<h3>Comparison Settings</h3>')
-        html_parts.append('<dl class="config-list">')
-        html_parts.append('<dt>Pixel Diff Threshold</dt>')
-        html_parts.append(f'<dd>{self.config.pixel_diff_threshold}%</dd>')
-        html_parts.append('<dt>SSIM Threshold</dt>')
-        html_parts.append(f'<dd>{self.config.ssim_threshold}</dd>')
-        html_parts.append('<dt>Color Distance Threshold</dt>')
-        html_parts.append(f'<dd>{self.config.color_distance_threshold}</dd>')
-        html_parts.append('<dt>Histogram Equalization</dt>')
-        html_parts.append(f'<dd>{"Enabled" if self.config.use_histogram_equalization else "Disabled"}</dd>')
-        html_parts.append('</dl>')
-        html_parts.append('</div>')
-
-        # Features
-        html_parts.append('<div class="config-group">')
-        html_parts.append('<h3>Enabled Features</h3>')
-        html_parts.append('<dl class="config-list">')
-        html_parts.append('<dt>FLIP Analysis</dt>')
-        html_parts.append(f'<dd>{"Enabled" if self.config.enable_flip else "Disabled"}</dd>')
-        if self.config.enable_flip:
-            html_parts.append('<dt>FLIP Pixels Per Degree</dt>')
-            html_parts.append(f'<dd>{self.config.flip_pixels_per_degree}</dd>')
-        html_parts.append('<dt>Historical Tracking</dt>')
-        html_parts.append(f'<dd>{"Enabled" if self.config.enable_history else "Disabled"}</dd>')
-        if self.config.enable_history and self.config.build_number:
-            html_parts.append('<dt>Build Number</dt>')
-            html_parts.append(f'<dd><code>{self.config.build_number}</code></dd>')
-        html_parts.append('<dt>Parallel Processing</dt>')
-        html_parts.append(f'<dd>{"Enabled" if self.config.enable_parallel else "Disabled"}</dd>')
-        if self.config.enable_parallel:
-            html_parts.append('<dt>Max Workers</dt>')
-            html_parts.append(f'<dd>{self.config.max_workers}</dd>')
-        html_parts.append('</dl>')
-        html_parts.append('</div>')
-
-        html_parts.append('</div>')  # config-grid
-        html_parts.append('</div>')  # config-section
-
-        return '\n'.join(html_parts)
+        config = self.config
+
+        def enabled(flag: bool) -> str:
+            return "Enabled" if flag else "Disabled"
+
+        flip_row = (
+            f"<dt>FLIP Pixels Per Degree</dt><dd>{config.flip_pixels_per_degree}</dd>"
+            if config.enable_flip else ""
+        )
+        build_row = (
+            f"<dt>Build Number</dt><dd><code>{_escape(config.build_number)}</code></dd>"
+            if config.enable_history and config.build_number else ""
+        )
+        workers_row = (
+            f"<dt>Max Workers</dt><dd>{config.max_workers}</dd>"
+            if config.enable_parallel else ""
+        )
+
+        return f"""<div class="config-section">
+<h2>Run Configuration</h2>
+<div class="config-grid">
+<div class="config-group">
+<h3>Directories</h3>
+<dl class="config-list">
+<dt>Base Directory</dt><dd><code>{_escape(config.base_dir)}</code></dd>
+<dt>New Images</dt><dd><code>{_escape(config.new_dir)}</code></dd>
+<dt>Known Good Images</dt><dd><code>{_escape(config.known_good_dir)}</code></dd>
+</dl>
+</div>
+<div class="config-group">
+<h3>Comparison Settings</h3>
+<dl class="config-list">
+<dt>Pixel Diff Threshold</dt><dd>{config.pixel_diff_threshold}%</dd>
+<dt>SSIM Threshold</dt><dd>{config.ssim_threshold}</dd>
+<dt>Color Distance Threshold</dt><dd>{config.color_distance_threshold}</dd>
+<dt>Histogram Equalization</dt><dd>{enabled(config.use_histogram_equalization)}</dd>
+</dl>
+</div>
+<div class="config-group">
+<h3>Enabled Features</h3>
+<dl class="config-list">
+<dt>FLIP Analysis</dt><dd>{enabled(config.enable_flip)}</dd>
+{flip_row}
+<dt>Historical Tracking</dt><dd>{enabled(config.enable_history)}</dd>
+{build_row}
+<dt>Parallel Processing</dt><dd>{enabled(config.enable_parallel)}</dd>
+{workers_row}
+</dl>
+</div>
+</div>
+</div>"""
 
     def _get_subdirectory_index_template(self) -> str:
         """Return HTML template for subdirectory index page.
@@ -823,173 +1493,90 @@ class ReportGenerator:
         Each entry displays 4 thumbnails in a horizontal row: new, known_good,
         diff, and annotated_diff images.
         """
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{SUBDIRECTORY}} - Image Comparison</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
+        return _SUBDIR_TEMPLATE
 
-        /* Breadcrumb navigation */
-        .breadcrumb {
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .breadcrumb a {
-            color: #3498db;
-            text-decoration: none;
-        }
-        .breadcrumb a:hover {
-            text-decoration: underline;
-        }
-        .breadcrumb span {
-            color: #999;
-            margin: 0 8px;
-        }
+    def _get_html_template(self) -> str:
+        """Return HTML template for detail page."""
+        return _HTML_TEMPLATE
 
-        /* Header */
-        header {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        .summary-info {
-            color: #666;
-            font-size: 1.1em;
-        }
+    def _get_summary_template(self) -> str:
+        """Return HTML template for summary page."""
+        return _SUMMARY_TEMPLATE
 
-        /* Image comparison cards */
-        .comparison-grid {
-            display: grid;
-            gap: 20px;
-            margin-top: 20px;
-        }
-        .comparison-card {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-            cursor: pointer;
-            text-decoration: none;
-            color: inherit;
-            display: block;
-        }
-        .comparison-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }
 
-        /* Status-based left border coloring */
-        .comparison-card.status-identical { border-left: 4px solid #27ae60; }
-        .comparison-card.status-minor { border-left: 4px solid #f39c12; }
-        .comparison-card.status-moderate { border-left: 4px solid #e67e22; }
-        .comparison-card.status-major { border-left: 4px solid #e74c3c; }
-
-        .card-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #ecf0f1;
-        }
-        .filename {
-            font-weight: 600;
-            font-size: 1.1em;
-            color: #2c3e50;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .card-metrics {
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-            align-items: flex-end;
-        }
-        .diff-badge {
-            background: #e74c3c;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 4px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }
-        .composite-info {
-            background: #667eea;
-            color: white;
-            padding: 3px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: 600;
-        }
-        .anomaly-badge-small {
-            background: #e74c3c;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 3px;
-            font-size: 0.8em;
-            font-weight: bold;
-        }
+def _render_detail_chunk(
+    generator: ReportGenerator,
+    results: List[ComparisonResult],
+    indices: Iterable[int],
+    history: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]],
+) -> None:
+    """Render detail reports for results[i] for each i in indices.
 
-        /* Thumbnail grid - 4 images in a horizontal row */
-        .thumbnail-row {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 10px;
-        }
-        .thumbnail-item {
-            text-align: center;
-        }
-        .thumbnail-label {
-            font-size: 0.85em;
-            color: #666;
-            margin-bottom: 5px;
-            font-weight: 500;
-        }
-        .thumbnail-item img {
-            width: 100%;
-            height: 150px;
-            object-fit: cover;
-            border-radius: 4px;
-            border: 1px solid #ddd;
-        }
+    Trend charts for each batch of pages are rendered first, then the
+    batch's pages are assembled.
 
-        /* Responsive design */
-        @media (max-width: 1200px) {
-            .thumbnail-row {
-                grid-template-columns: repeat(2, 1fr);
-            }
-        }
-        @media (max-width: 600px) {
-            .thumbnail-row {
-                grid-template-columns: 1fr;
-            }
-        }
-    </style>
+    Args:
+        generator: Report generator to render with
+        results: All results of one subdirectory (for prev/next navigation)
+        indices: Positions in results to render
+        history: Pre-fetched history records keyed by (filename, subdirectory)
+    """
+    indices = list(indices)
+    # Batches no larger than the chart cache, so precomputed charts are
+    # still cached when their pages are assembled
+    batch_size = generator.CHART_CACHE_SIZE
+    for start in range(0, len(indices), batch_size):
+        batch = indices[start:start + batch_size]
+        generator._precompute_charts([results[i] for i in batch], history)
+
+        for i in batch:
+            result = results[i]
+            subdirectory = generator._get_subdirectory(result)
+            generator.generate_detail_report(
+                result,
+                results,
+                historical_data=history.get((result.filename, subdirectory or None)),
+                index=i,
+            )
+
+
+def _detail_report_worker(
+    args: Tuple[
+        Config,
+        List[ComparisonResult],
+        Iterable[int],
+        Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]],
+    ],
+) -> None:
+    """Worker entry point for parallel detail report generation.
+
+    Args:
+        args: Tuple of (config, results, indices, history)
+    """
+    config, results, indices, history = args
+
+    generator = ReportGenerator(config)
+    generator._assets_written = True  # written by the parent process
+    try:
+        _render_detail_chunk(generator, results, indices, history)
+    finally:
+        generator.close()
+
+
+# ---------------------------------------------------------------------------
+# HTML templates
+#
+# Built once at import time. Placeholders use the {{NAME}} syntax and are
+# filled by _fill_template() from the pre-split *_PARTS lists.
+# ---------------------------------------------------------------------------
+
+_SUBDIR_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{SUBDIRECTORY}} - Image Comparison</title>
+    <link rel="stylesheet" href="subdir_styles.css">
 </head>
 <body>
     <div class="container">
@@ -1016,479 +1603,13 @@ class ReportGenerator:
 </body>
 </html>"""
 
-    def _get_html_template(self) -> str:
-        """Return HTML template for detail page."""
-        return """<!DOCTYPE html>
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{TITLE}}</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        header {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        .diff-percentage {
-            font-size: 2em;
-            color: #e74c3c;
-            font-weight: bold;
-        }
-        .breadcrumb {
-            margin: 15px 0;
-            font-size: 0.95em;
-            color: #666;
-        }
-        .breadcrumb a {
-            color: #3498db;
-            text-decoration: none;
-        }
-        .breadcrumb a:hover {
-            text-decoration: underline;
-        }
-        .breadcrumb-separator {
-            margin: 0 8px;
-            color: #999;
-        }
-        .nav-buttons {
-            margin: 20px 0;
-            display: flex;
-            gap: 10px;
-            justify-content: space-between;
-            align-items: center;
-        }
-        .nav-left {
-            display: flex;
-            gap: 10px;
-        }
-        .nav-right {
-            display: flex;
-            gap: 10px;
-        }
-        .btn {
-            padding: 10px 20px;
-            background: #3498db;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-            display: inline-block;
-            min-width: 140px;
-            text-align: center;
-        }
-        .btn:hover { background: #2980b9; }
-        .btn-back {
-            background: #95a5a6;
-        }
-        .btn-back:hover {
-            background: #7f8c8d;
-        }
-        .image-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        .image-card {
-            background: white;
-            border-radius: 8px;
-            padding: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .image-card h2 {
-            margin-bottom: 10px;
-            color: #2c3e50;
-            font-size: 1.2em;
-        }
-        .image-card img {
-            width: 100%;
-            height: auto;
-            border-radius: 4px;
-            cursor: pointer;
-            transition: transform 0.2s;
-        }
-        .image-card img:hover {
-            transform: scale(1.02);
-        }
-        .metrics {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .metrics h2 {
-            margin-top: 0;
-            margin-bottom: 15px;
-            color: #2c3e50;
-            font-size: 1.3em;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-        }
-        /* Historical Analysis Styles */
-        .historical-section {
-            margin-bottom: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        .historical-section h2 {
-            border-bottom-color: rgba(255,255,255,0.3);
-            color: white;
-        }
-        .historical-section h3 {
-            color: white;
-            margin: 20px 0 10px 0;
-        }
-        .history-summary {
-            display: grid;
-            grid-template-columns: 1fr 2fr;
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        .history-metric {
-            background: rgba(255,255,255,0.1);
-            padding: 15px;
-            border-radius: 6px;
-        }
-        .history-metric dt {
-            color: rgba(255,255,255,0.8);
-            font-size: 0.9em;
-            margin-bottom: 5px;
-        }
-        .composite-score {
-            font-size: 2.5em;
-            font-weight: bold;
-            color: white;
-            line-height: 1.2;
-        }
-        .anomaly-badge {
-            display: inline-block;
-            background: #e74c3c;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 4px;
-            font-size: 0.4em;
-            font-weight: bold;
-            vertical-align: middle;
-            margin-left: 10px;
-            animation: pulse 2s infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.7; }
-        }
-        .anomaly-badge-small {
-            display: inline-block;
-            background: #e74c3c;
-            color: white;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 0.85em;
-            margin-left: 5px;
-        }
-        .history-stats {
-            background: rgba(255,255,255,0.1);
-            padding: 15px;
-            border-radius: 6px;
-        }
-        .history-stats-grid {
-            display: grid;
-            grid-template-columns: 150px 1fr;
-            gap: 10px;
-        }
-        .history-stats dt {
-            color: rgba(255,255,255,0.8);
-            font-weight: normal;
-        }
-        .history-stats dd {
-            color: white;
-            font-weight: bold;
-            font-size: 1.1em;
-        }
-        .composite-explanation {
-            background: rgba(255,255,255,0.15);
-            padding: 15px;
-            border-radius: 6px;
-            margin-top: 15px;
-            border-left: 4px solid rgba(255,255,255,0.4);
-        }
-        .explanation-text {
-            color: rgba(255,255,255,0.95);
-            margin: 0 0 10px 0;
-            line-height: 1.6;
-        }
-        .metric-weights {
-            list-style: none;
-            padding: 0;
-            margin: 15px 0;
-        }
-        .metric-weights li {
-            color: rgba(255,255,255,0.9);
-            padding: 8px 0;
-            border-bottom: 1px solid rgba(255,255,255,0.1);
-        }
-        .metric-weights li:last-child {
-            border-bottom: none;
-        }
-        .metric-weights strong {
-            color: white;
-        }
-        .deviation-high {
-            color: #e74c3c !important;
-            background: rgba(231,76,60,0.2);
-            padding: 2px 8px;
-            border-radius: 3px;
-        }
-        /* FLIP Section Styles */
-        .flip-section {
-            margin-bottom: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        .flip-section h2 {
-            border-bottom-color: rgba(255,255,255,0.3);
-            color: white;
-        }
-        .flip-summary {
-            margin-bottom: 20px;
-        }
-        .flip-metrics-table {
-            width: 100%;
-            background: rgba(255,255,255,0.1);
-            border-radius: 6px;
-            padding: 10px;
-        }
-        .flip-metrics-table th {
-            text-align: left;
-            color: rgba(255,255,255,0.8);
-            font-weight: normal;
-            padding: 8px 12px;
-            font-size: 0.9em;
-        }
-        .flip-metrics-table td {
-            text-align: left;
-            color: white;
-            font-weight: bold;
-            padding: 8px 12px;
-        }
-        .flip-colormap-tabs {
-            margin-top: 15px;
-        }
-        .tab-buttons {
-            display: flex;
-            gap: 5px;
-            margin-bottom: 15px;
-            background: rgba(255,255,255,0.1);
-            padding: 5px;
-            border-radius: 6px;
-        }
-        .tab-button {
-            flex: 1;
-            padding: 10px 20px;
-            border: none;
-            background: rgba(255,255,255,0.1);
-            color: white;
-            cursor: pointer;
-            border-radius: 4px;
-            font-size: 14px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-        .tab-button:hover {
-            background: rgba(255,255,255,0.2);
-            transform: translateY(-1px);
-        }
-        .tab-button.active {
-            background: rgba(255,255,255,0.3);
-            font-weight: bold;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        }
-        .tab-content {
-            background: rgba(255,255,255,0.95);
-            padding: 10px;
-            border-radius: 6px;
-        }
-        .deviation-normal {
-            color: #27ae60 !important;
-        }
-        .trend-chart {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid rgba(255,255,255,0.2);
-        }
-        .trend-chart img {
-            border-radius: 6px;
-            background: white;
-            padding: 10px;
-        }
-        .metric-group {
-            margin-bottom: 20px;
-        }
-        .metric-header {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            cursor: pointer;
-            user-select: none;
-        }
-        .metric-header h3 {
-            color: #2c3e50;
-            margin-bottom: 0;
-            padding-bottom: 5px;
-            border-bottom: 2px solid #3498db;
-            flex: 1;
-        }
-        .metric-help-icon {
-            display: inline-block;
-            width: 24px;
-            height: 24px;
-            margin-left: 10px;
-            background: #3498db;
-            color: white;
-            border-radius: 50%;
-            text-align: center;
-            line-height: 24px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.2s;
-            font-size: 14px;
-            flex-shrink: 0;
-        }
-        .metric-help-icon:hover {
-            background: #2980b9;
-            transform: scale(1.1);
-        }
-        .metric-description {
-            background: #ecf0f1;
-            border-left: 4px solid #3498db;
-            padding: 12px;
-            margin: 10px 0;
-            border-radius: 4px;
-            font-size: 0.95em;
-            color: #555;
-            line-height: 1.5;
-        }
-        .metric-description p {
-            margin: 0;
-        }
-        dl {
-            display: grid;
-            grid-template-columns: 200px 1fr;
-            gap: 10px;
-        }
-        dt {
-            font-weight: bold;
-            color: #555;
-        }
-        dd {
-            color: #333;
-        }
-        .overlay {
-            display: none;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0,0,0,0.9);
-            z-index: 1000;
-            justify-content: center;
-            align-items: center;
-        }
-        .overlay.active {
-            display: flex;
-        }
-        .overlay img {
-            max-width: 90%;
-            max-height: 90%;
-            object-fit: contain;
-        }
-        .close-overlay {
-            position: absolute;
-            top: 20px;
-            right: 30px;
-            background: rgba(255, 255, 255, 0.9);
-            color: #333;
-            border: none;
-            font-size: 36px;
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.2s;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.3);
-            line-height: 1;
-            padding: 0;
-        }
-        .close-overlay:hover {
-            background: white;
-            transform: scale(1.1);
-        }
-        .nav-overlay {
-            position: absolute;
-            top: 50%;
-            transform: translateY(-50%);
-            background: rgba(255, 255, 255, 0.8);
-            color: #333;
-            border: none;
-            font-size: 32px;
-            width: 50px;
-            height: 50px;
-            border-radius: 4px;
-            cursor: pointer;
-            user-select: none;
-            display: none;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.2s;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.3);
-            line-height: 1;
-            padding: 0;
-        }
-        #prev-btn {
-            left: 20px;
-        }
-        #next-btn {
-            right: 20px;
-        }
-        .nav-overlay:hover {
-            background: white;
-            transform: translateY(-50%) scale(1.1);
-        }
-        .overlay-counter {
-            position: absolute;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: rgba(0, 0, 0, 0.7);
-            color: white;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-size: 14px;
-            font-weight: 500;
-        }
-    </style>
+    <link rel="stylesheet" href="styles.css">
 </head>
 <body>
     <div class="container">
@@ -1639,141 +1760,13 @@ class ReportGenerator:
 </body>
 </html>"""
 
-    def _get_summary_template(self) -> str:
-        """Return HTML template for summary page."""
-        return """<!DOCTYPE html>
+_SUMMARY_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Image Comparison Summary</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            padding: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        .summary-info {
-            color: #666;
-            margin-bottom: 30px;
-            font-size: 1.1em;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }
-        th {
-            background: #3498db;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }
-        td {
-            padding: 12px;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        tr:hover {
-            background: #f8f9fa;
-        }
-        .status-identical { background: #d4edda; }
-        .status-minor { background: #fff3cd; }
-        .status-moderate { background: #ffe5d0; }
-        .status-major { background: #f8d7da; }
-        .btn-view {
-            background: #3498db;
-            color: white;
-            padding: 6px 12px;
-            text-decoration: none;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }
-        .btn-view:hover {
-            background: #2980b9;
-        }
-        a {
-            color: #3498db;
-            text-decoration: none;
-        }
-        a:hover {
-            text-decoration: underline;
-        }
-        .anomaly-count {
-            display: inline-block;
-            background: #e74c3c;
-            color: white;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }
-        /* Configuration Section Styles */
-        .config-section {
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            padding: 20px;
-            margin-bottom: 30px;
-        }
-        .config-section h2 {
-            color: #2c3e50;
-            margin-bottom: 15px;
-            font-size: 1.3em;
-        }
-        .config-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-        }
-        .config-group {
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            padding: 15px;
-        }
-        .config-group h3 {
-            color: #3498db;
-            font-size: 1.1em;
-            margin-bottom: 10px;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 5px;
-        }
-        .config-list {
-            display: grid;
-            grid-template-columns: auto 1fr;
-            gap: 8px 15px;
-        }
-        .config-list dt {
-            font-weight: 600;
-            color: #555;
-        }
-        .config-list dd {
-            color: #333;
-        }
-        .config-list code {
-            background: #f1f3f5;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-        }
-    </style>
+    <link rel="stylesheet" href="summary_styles.css">
 </head>
 <body>
     <div class="container">
@@ -1805,3 +1798,795 @@ class ReportGenerator:
     </div>
 </body>
 </html>"""
+
+_HTML_TEMPLATE_PARTS = _split_template(_HTML_TEMPLATE)
+_SUBDIR_TEMPLATE_PARTS = _split_template(_SUBDIR_TEMPLATE)
+_SUMMARY_TEMPLATE_PARTS = _split_template(_SUMMARY_TEMPLATE)
+_SUMMARY_ROWS_INDEX = _SUMMARY_TEMPLATE_PARTS.index("ROWS")
+
+# Literal text pre-encoded once, so writing a page only encodes dynamic values
+_HTML_TEMPLATE_BYTES = _encode_literals(_HTML_TEMPLATE_PARTS)
+_SUBDIR_TEMPLATE_BYTES = _encode_literals(_SUBDIR_TEMPLATE_PARTS)
+_SUMMARY_TEMPLATE_BYTES = _encode_literals(_SUMMARY_TEMPLATE_PARTS)
+
+# ---------------------------------------------------------------------------
+# Static assets, written once per run to the reports directory (see
+# ReportGenerator._write_assets)
+# ---------------------------------------------------------------------------
+
+# Tab switching for the FLIP colormap section
+_FLIP_JS = """function showFlipTab(colormapName) {
+    // Hide all tab contents
+    document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
+
+    // Remove active class from all buttons
+    document.querySelectorAll('.tab-button').forEach(btn => btn.classList.remove('active'));
+
+    // Show selected tab
+    const tabContent = document.getElementById('flip-tab-' + colormapName);
+    if (tabContent) {
+        tabContent.style.display = 'block';
+    }
+
+    // Add active class to clicked button
+    event.target.classList.add('active');
+}
+"""
+
+# Stylesheets for detail pages and subdirectory index pages (minified below)
+_DETAIL_CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+}
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    padding: 20px;
+}
+header {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+h1 {
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+.diff-percentage {
+    font-size: 2em;
+    color: #e74c3c;
+    font-weight: bold;
+}
+.breadcrumb {
+    margin: 15px 0;
+    font-size: 0.95em;
+    color: #666;
+}
+.breadcrumb a {
+    color: #3498db;
+    text-decoration: none;
+}
+.breadcrumb a:hover {
+    text-decoration: underline;
+}
+.breadcrumb-separator {
+    margin: 0 8px;
+    color: #999;
+}
+.nav-buttons {
+    margin: 20px 0;
+    display: flex;
+    gap: 10px;
+    justify-content: space-between;
+    align-items: center;
+}
+.nav-left {
+    display: flex;
+    gap: 10px;
+}
+.nav-right {
+    display: flex;
+    gap: 10px;
+}
+.btn {
+    padding: 10px 20px;
+    background: #3498db;
+    color: white;
+    text-decoration: none;
+    border-radius: 5px;
+    display: inline-block;
+    min-width: 140px;
+    text-align: center;
+}
+.btn:hover { background: #2980b9; }
+.btn-back {
+    background: #95a5a6;
+}
+.btn-back:hover {
+    background: #7f8c8d;
+}
+.image-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
+    gap: 20px;
+    margin-bottom: 20px;
+}
+.image-card {
+    background: white;
+    border-radius: 8px;
+    padding: 15px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.image-card h2 {
+    margin-bottom: 10px;
+    color: #2c3e50;
+    font-size: 1.2em;
+}
+.image-card img {
+    width: 100%;
+    height: auto;
+    border-radius: 4px;
+    cursor: pointer;
+    transition: transform 0.2s;
+}
+.image-card img:hover {
+    transform: scale(1.02);
+}
+.metrics {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.metrics h2 {
+    margin-top: 0;
+    margin-bottom: 15px;
+    color: #2c3e50;
+    font-size: 1.3em;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 10px;
+}
+/* Historical Analysis Styles */
+.historical-section {
+    margin-bottom: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+}
+.historical-section h2 {
+    border-bottom-color: rgba(255,255,255,0.3);
+    color: white;
+}
+.historical-section h3 {
+    color: white;
+    margin: 20px 0 10px 0;
+}
+.history-summary {
+    display: grid;
+    grid-template-columns: 1fr 2fr;
+    gap: 20px;
+    margin-bottom: 20px;
+}
+.history-metric {
+    background: rgba(255,255,255,0.1);
+    padding: 15px;
+    border-radius: 6px;
+}
+.history-metric dt {
+    color: rgba(255,255,255,0.8);
+    font-size: 0.9em;
+    margin-bottom: 5px;
+}
+.composite-score {
+    font-size: 2.5em;
+    font-weight: bold;
+    color: white;
+    line-height: 1.2;
+}
+.anomaly-badge {
+    display: inline-block;
+    background: #e74c3c;
+    color: white;
+    padding: 4px 12px;
+    border-radius: 4px;
+    font-size: 0.4em;
+    font-weight: bold;
+    vertical-align: middle;
+    margin-left: 10px;
+    animation: pulse 2s infinite;
+}
+@keyframes pulse {
+    0%, 100% { opacity: 1; }
+    50% { opacity: 0.7; }
+}
+.anomaly-badge-small {
+    display: inline-block;
+    background: #e74c3c;
+    color: white;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-size: 0.85em;
+    margin-left: 5px;
+}
+.history-stats {
+    background: rgba(255,255,255,0.1);
+    padding: 15px;
+    border-radius: 6px;
+}
+.history-stats-grid {
+    display: grid;
+    grid-template-columns: 150px 1fr;
+    gap: 10px;
+}
+.history-stats dt {
+    color: rgba(255,255,255,0.8);
+    font-weight: normal;
+}
+.history-stats dd {
+    color: white;
+    font-weight: bold;
+    font-size: 1.1em;
+}
+.composite-explanation {
+    background: rgba(255,255,255,0.15);
+    padding: 15px;
+    border-radius: 6px;
+    margin-top: 15px;
+    border-left: 4px solid rgba(255,255,255,0.4);
+}
+.explanation-text {
+    color: rgba(255,255,255,0.95);
+    margin: 0 0 10px 0;
+    line-height: 1.6;
+}
+.metric-weights {
+    list-style: none;
+    padding: 0;
+    margin: 15px 0;
+}
+.metric-weights li {
+    color: rgba(255,255,255,0.9);
+    padding: 8px 0;
+    border-bottom: 1px solid rgba(255,255,255,0.1);
+}
+.metric-weights li:last-child {
+    border-bottom: none;
+}
+.metric-weights strong {
+    color: white;
+}
+.deviation-high {
+    color: #e74c3c !important;
+    background: rgba(231,76,60,0.2);
+    padding: 2px 8px;
+    border-radius: 3px;
+}
+/* FLIP Section Styles */
+.flip-section {
+    margin-bottom: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+}
+.flip-section h2 {
+    border-bottom-color: rgba(255,255,255,0.3);
+    color: white;
+}
+.flip-summary {
+    margin-bottom: 20px;
+}
+.flip-metrics-table {
+    width: 100%;
+    background: rgba(255,255,255,0.1);
+    border-radius: 6px;
+    padding: 10px;
+}
+.flip-metrics-table th {
+    text-align: left;
+    color: rgba(255,255,255,0.8);
+    font-weight: normal;
+    padding: 8px 12px;
+    font-size: 0.9em;
+}
+.flip-metrics-table td {
+    text-align: left;
+    color: white;
+    font-weight: bold;
+    padding: 8px 12px;
+}
+.flip-colormap-tabs {
+    margin-top: 15px;
+}
+.tab-buttons {
+    display: flex;
+    gap: 5px;
+    margin-bottom: 15px;
+    background: rgba(255,255,255,0.1);
+    padding: 5px;
+    border-radius: 6px;
+}
+.tab-button {
+    flex: 1;
+    padding: 10px 20px;
+    border: none;
+    background: rgba(255,255,255,0.1);
+    color: white;
+    cursor: pointer;
+    border-radius: 4px;
+    font-size: 14px;
+    font-weight: 500;
+    transition: all 0.3s ease;
+}
+.tab-button:hover {
+    background: rgba(255,255,255,0.2);
+    transform: translateY(-1px);
+}
+.tab-button.active {
+    background: rgba(255,255,255,0.3);
+    font-weight: bold;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+}
+.tab-content {
+    background: rgba(255,255,255,0.95);
+    padding: 10px;
+    border-radius: 6px;
+}
+.deviation-normal {
+    color: #27ae60 !important;
+}
+.trend-chart {
+    margin-top: 20px;
+    padding-top: 20px;
+    border-top: 1px solid rgba(255,255,255,0.2);
+}
+.trend-chart img {
+    border-radius: 6px;
+    background: white;
+    padding: 10px;
+}
+.metric-group {
+    margin-bottom: 20px;
+}
+.metric-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    cursor: pointer;
+    user-select: none;
+}
+.metric-header h3 {
+    color: #2c3e50;
+    margin-bottom: 0;
+    padding-bottom: 5px;
+    border-bottom: 2px solid #3498db;
+    flex: 1;
+}
+.metric-help-icon {
+    display: inline-block;
+    width: 24px;
+    height: 24px;
+    margin-left: 10px;
+    background: #3498db;
+    color: white;
+    border-radius: 50%;
+    text-align: center;
+    line-height: 24px;
+    font-weight: bold;
+    cursor: pointer;
+    transition: all 0.2s;
+    font-size: 14px;
+    flex-shrink: 0;
+}
+.metric-help-icon:hover {
+    background: #2980b9;
+    transform: scale(1.1);
+}
+.metric-description {
+    background: #ecf0f1;
+    border-left: 4px solid #3498db;
+    padding: 12px;
+    margin: 10px 0;
+    border-radius: 4px;
+    font-size: 0.95em;
+    color: #555;
+    line-height: 1.5;
+}
+.metric-description p {
+    margin: 0;
+}
+dl {
+    display: grid;
+    grid-template-columns: 200px 1fr;
+    gap: 10px;
+}
+dt {
+    font-weight: bold;
+    color: #555;
+}
+dd {
+    color: #333;
+}
+.overlay {
+    display: none;
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0,0,0,0.9);
+    z-index: 1000;
+    justify-content: center;
+    align-items: center;
+}
+.overlay.active {
+    display: flex;
+}
+.overlay img {
+    max-width: 90%;
+    max-height: 90%;
+    object-fit: contain;
+}
+.close-overlay {
+    position: absolute;
+    top: 20px;
+    right: 30px;
+    background: rgba(255, 255, 255, 0.9);
+    color: #333;
+    border: none;
+    font-size: 36px;
+    width: 50px;
+    height: 50px;
+    border-radius: 50%;
+    cursor: pointer;
+    user-select: none;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    transition: all 0.2s;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.3);
+    line-height: 1;
+    padding: 0;
+}
+.close-overlay:hover {
+    background: white;
+    transform: scale(1.1);
+}
+.nav-overlay {
+    position: absolute;
+    top: 50%;
+    transform: translateY(-50%);
+    background: rgba(255, 255, 255, 0.8);
+    color: #333;
+    border: none;
+    font-size: 32px;
+    width: 50px;
+    height: 50px;
+    border-radius: 4px;
+    cursor: pointer;
+    user-select: none;
+    display: none;
+    align-items: center;
+    justify-content: center;
+    transition: all 0.2s;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.3);
+    line-height: 1;
+    padding: 0;
+}
+#prev-btn {
+    left: 20px;
+}
+#next-btn {
+    right: 20px;
+}
+.nav-overlay:hover {
+    background: white;
+    transform: translateY(-50%) scale(1.1);
+}
+.overlay-counter {
+    position: absolute;
+    bottom: 20px;
+    left: 50%;
+    transform: translateX(-50%);
+    background: rgba(0, 0, 0, 0.7);
+    color: white;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-size: 14px;
+    font-weight: 500;
+}
+"""
+
+_SUBDIR_CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+    padding: 20px;
+}
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+}
+
+/* Breadcrumb navigation */
+.breadcrumb {
+    background: white;
+    padding: 15px 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.breadcrumb a {
+    color: #3498db;
+    text-decoration: none;
+}
+.breadcrumb a:hover {
+    text-decoration: underline;
+}
+.breadcrumb span {
+    color: #999;
+    margin: 0 8px;
+}
+
+/* Header */
+header {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+h1 {
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+.summary-info {
+    color: #666;
+    font-size: 1.1em;
+}
+
+/* Image comparison cards */
+.comparison-grid {
+    display: grid;
+    gap: 20px;
+    margin-top: 20px;
+}
+.comparison-card {
+    background: white;
+    border-radius: 8px;
+    padding: 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: transform 0.2s, box-shadow 0.2s;
+    cursor: pointer;
+    text-decoration: none;
+    color: inherit;
+    display: block;
+}
+.comparison-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+}
+
+/* Status-based left border coloring */
+.comparison-card.status-identical { border-left: 4px solid #27ae60; }
+.comparison-card.status-minor { border-left: 4px solid #f39c12; }
+.comparison-card.status-moderate { border-left: 4px solid #e67e22; }
+.comparison-card.status-major { border-left: 4px solid #e74c3c; }
+
+.card-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 15px;
+    padding-bottom: 10px;
+    border-bottom: 2px solid #ecf0f1;
+}
+.filename {
+    font-weight: 600;
+    font-size: 1.1em;
+    color: #2c3e50;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+.card-metrics {
+    display: flex;
+    flex-direction: column;
+    gap: 5px;
+    align-items: flex-end;
+}
+.diff-badge {
+    background: #e74c3c;
+    color: white;
+    padding: 4px 12px;
+    border-radius: 4px;
+    font-weight: bold;
+    font-size: 0.9em;
+}
+.composite-info {
+    background: #667eea;
+    color: white;
+    padding: 3px 10px;
+    border-radius: 4px;
+    font-size: 0.85em;
+    font-weight: 600;
+}
+.anomaly-badge-small {
+    background: #e74c3c;
+    color: white;
+    padding: 2px 8px;
+    border-radius: 3px;
+    font-size: 0.8em;
+    font-weight: bold;
+}
+
+/* Thumbnail grid - 4 images in a horizontal row */
+.thumbnail-row {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 10px;
+}
+.thumbnail-item {
+    text-align: center;
+}
+.thumbnail-label {
+    font-size: 0.85em;
+    color: #666;
+    margin-bottom: 5px;
+    font-weight: 500;
+}
+.thumbnail-item img {
+    width: 100%;
+    height: 150px;
+    object-fit: cover;
+    border-radius: 4px;
+    border: 1px solid #ddd;
+}
+
+/* Responsive design */
+@media (max-width: 1200px) {
+    .thumbnail-row {
+        grid-template-columns: repeat(2, 1fr);
+    }
+}
+@media (max-width: 600px) {
+    .thumbnail-row {
+        grid-template-columns: 1fr;
+    }
+}
+"""
+
+_SUMMARY_CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+    padding: 20px;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 8px;
+    padding: 30px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+h1 {
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+.summary-info {
+    color: #666;
+    margin-bottom: 30px;
+    font-size: 1.1em;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-top: 20px;
+}
+th {
+    background: #3498db;
+    color: white;
+    padding: 12px;
+    text-align: left;
+    font-weight: 600;
+}
+td {
+    padding: 12px;
+    border-bottom: 1px solid #e0e0e0;
+}
+tr:hover {
+    background: #f8f9fa;
+}
+.status-identical { background: #d4edda; }
+.status-minor { background: #fff3cd; }
+.status-moderate { background: #ffe5d0; }
+.status-major { background: #f8d7da; }
+.btn-view {
+    background: #3498db;
+    color: white;
+    padding: 6px 12px;
+    text-decoration: none;
+    border-radius: 4px;
+    font-size: 0.9em;
+}
+.btn-view:hover {
+    background: #2980b9;
+}
+a {
+    color: #3498db;
+    text-decoration: none;
+}
+a:hover {
+    text-decoration: underline;
+}
+.anomaly-count {
+    display: inline-block;
+    background: #e74c3c;
+    color: white;
+    padding: 3px 10px;
+    border-radius: 12px;
+    font-weight: bold;
+    font-size: 0.9em;
+}
+/* Configuration Section Styles */
+.config-section {
+    background: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 6px;
+    padding: 20px;
+    margin-bottom: 30px;
+}
+.config-section h2 {
+    color: #2c3e50;
+    margin-bottom: 15px;
+    font-size: 1.3em;
+}
+.config-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 20px;
+}
+.config-group {
+    background: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    padding: 15px;
+}
+.config-group h3 {
+    color: #3498db;
+    font-size: 1.1em;
+    margin-bottom: 10px;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 5px;
+}
+.config-list {
+    display: grid;
+    grid-template-columns: auto 1fr;
+    gap: 8px 15px;
+}
+.config-list dt {
+    font-weight: 600;
+    color: #555;
+}
+.config-list dd {
+    color: #333;
+}
+.config-list code {
+    background: #f1f3f5;
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+    font-size: 0.9em;
+}
+"""
+
+_DETAIL_CSS = _minify_css(_DETAIL_CSS)
+_SUBDIR_CSS = _minify_css(_SUBDIR_CSS)
+_SUMMARY_CSS = _minify_css(_SUMMARY_CSS)
@@ -3,24 +3,102 @@ UI module for image comparison configuration.
 Uses tkinter for a simple GUI interface.
 """
 
+import functools
 import logging
+import re
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
+from concurrent.futures import Future
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 # Handle both package and direct module imports
 try:
-    from .config import Config
+    from .config import Config, HistogramConfig
 except ImportError:
-    from config import Config  # type: ignore
+    from config import Config, HistogramConfig  # type: ignore
 
 logger = logging.getLogger("ImageComparison")
 
+# "R,G,B" with up to three digits per component, whitespace allowed
+_COLOR_RE = re.compile(r"^\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*$")
+# Two-digit hex for every 8-bit channel value
+_HEX = [f"{i:02x}" for i in range(256)]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_rgb(color_str: str) -> Optional[Tuple[int, int, int]]:
+    """Parse "R,G,B" text into an RGB triple (cached per string).
+
+    Returns:
+        The (r, g, b) components, or None when the text is not a valid
+        RGB triple with every component in 0-255
+    """
+    match = _COLOR_RE.match(color_str)
+    if not match:
+        return None
+    r, g, b = map(int, match.groups())
+    if (r | g | b) > 255:
+        return None
+    return r, g, b
+
+
+# Marks a numeric field that must not be left empty
+_REQUIRED = object()
+
+
+def _is_int_text(text: str) -> bool:
+    """Entry validator: allow only empty text or a non-negative integer."""
+    return text == "" or text.isdecimal()
+
+
+def _is_float_text(text: str) -> bool:
+    """Entry validator: allow only empty text or a (partial) non-negative decimal."""
+    digits = text.replace(".", "", 1)
+    return digits == "" or digits.isdecimal()
+
+
+def _run_validation(config: Config, future: Future) -> None:
+    """Thread target: run config.validate() and store its outcome in future."""
+    try:
+        future.set_result(config.validate())
+    except Exception as e:
+        future.set_exception(e)
+
 
 class ComparisonUI:
     """GUI for configuring image comparison settings."""
 
+    # Label/Entry rows built by _add_entry_rows: (label, attribute, default).
+    # Numeric defaults are shown as text; _parse_numeric_fields converts them.
+    _PATH_ENTRIES = (
+        ("New Images (relative):", "new_dir_var", "new"),
+        ("Known Good (relative):", "known_good_var", "known_good"),
+        ("Diff Output (relative):", "diff_dir_var", "diffs"),
+        ("HTML Reports (relative):", "html_dir_var", "reports"),
+    )
+    _TOLERANCE_ENTRIES = (
+        ("Pixel Diff Threshold (%):", "pixel_diff_threshold_var", 0.01),
+        ("Min Pixel Change:", "pixel_change_threshold_var", 1),
+        ("SSIM Threshold (0-1):", "ssim_threshold_var", 0.95),
+        ("Color Distance Threshold:", "color_distance_var", 10.0),
+        ("Min Bounding Box Area:", "min_contour_var", 50),
+    )
+    _VISUAL_ENTRIES = (
+        ("Diff Enhancement Factor:", "diff_enhancement_var", 5.0),
+    )
+    _HISTOGRAM_ENTRIES = (
+        ("Histogram Bins (64-512):", "hist_bins_var", 256),
+        ("Figure Width (inches):", "hist_width_var", 16.0),
+        ("Figure Height (inches):", "hist_height_var", 6.0),
+        ("Grayscale Transparency (0-1):", "hist_gray_alpha_var", 0.7),
+        ("RGB Transparency (0-1):", "hist_rgb_alpha_var", 0.7),
+        ("Grayscale Line Width:", "hist_gray_lw_var", 2.0),
+        ("RGB Line Width:", "hist_rgb_lw_var", 1.5),
+    )
+
     def __init__(self) -> None:
         logger.debug("Initializing ComparisonUI")
         self.config: Optional[Config] = None
@@ -29,10 +107,54 @@ class ComparisonUI:
         self.root.geometry("1400x1050")  # Expanded width for historical tracking panel
         self.root.resizable(True, True)
 
+        # Set by Start/Cancel (or closing the window) to end run()
+        self._done = tk.IntVar(master=self.root, value=0)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        # Result of Config.validate, which runs on a daemon thread so slow
+        # directory scans neither block Tk nor keep the process alive after
+        # Cancel
+        self._pending_validation: Optional[Future] = None
+        self._validation_after_id: Optional[str] = None
+        # (base, new, known good) directory strings that last passed
+        # validation; Start with the same directories skips re-scanning them
+        self._validated_dirs: Optional[Tuple[str, str, str]] = None
+        self._pending_dirs: Optional[Tuple[str, str, str]] = None
+
+        # Pending debounced color preview update and the color last shown
+        self._color_after_id: Optional[str] = None
+        self._last_preview_color: Optional[str] = None
+
+        # Build the widget tree while the window is hidden so it is laid out
+        # and mapped once, instead of being drawn as widgets are added
+        self.root.withdraw()
         self._create_widgets()
+        self.root.deiconify()
+
+        # Initial field values, restored by reset()
+        self._defaults = [
+            (var, var.get())
+            for var in vars(self).values()
+            if isinstance(var, tk.Variable) and var is not self._done
+        ]
 
     def _create_widgets(self):
         """Create and layout UI widgets."""
+        # Fonts are created once and shared by every label that uses them
+        self._fonts = {
+            "title": tkfont.Font(root=self.root, family="Arial", size=16, weight="bold"),
+            "panel": tkfont.Font(root=self.root, family="Arial", size=14, weight="bold"),
+            "section": tkfont.Font(root=self.root, family="Arial", size=12, weight="bold"),
+            "note": tkfont.Font(root=self.root, family="Arial", size=8),
+        }
+
+        # Keystroke validators for the optional numeric entries
+        self._int_vcmd = (self.root.register(_is_int_text), "%P")
+        self._float_vcmd = (self.root.register(_is_float_text), "%P")
+
+        # Flat divider style used in place of ttk.Separator (see _add_divider)
+        ttk.Style(self.root).configure("Divider.TFrame", background="#888888")
+
         # Main container frame
         container = ttk.Frame(self.root, padding="20")
         container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -58,7 +180,7 @@ class ComparisonUI:
         title = ttk.Label(
             main_frame,
             text="Image Comparison Configuration",
-            font=("Arial", 16, "bold"),
+            font=self._fonts["title"],
         )
         title.grid(row=0, column=0, columnspan=3, pady=(0, 20))
 
@@ -75,117 +197,27 @@ class ComparisonUI:
             row=row, column=2
         )
 
-        # New Images Directory
-        row += 1
-        ttk.Label(main_frame, text="New Images (relative):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.new_dir_var = tk.StringVar(value="new")
-        ttk.Entry(main_frame, textvariable=self.new_dir_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Known Good Directory
-        row += 1
-        ttk.Label(main_frame, text="Known Good (relative):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.known_good_var = tk.StringVar(value="known_good")
-        ttk.Entry(main_frame, textvariable=self.known_good_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Diff Directory
-        row += 1
-        ttk.Label(main_frame, text="Diff Output (relative):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.diff_dir_var = tk.StringVar(value="diffs")
-        ttk.Entry(main_frame, textvariable=self.diff_dir_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # HTML Directory
-        row += 1
-        ttk.Label(main_frame, text="HTML Reports (relative):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.html_dir_var = tk.StringVar(value="reports")
-        ttk.Entry(main_frame, textvariable=self.html_dir_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
+        row = self._add_entry_rows(main_frame, row + 1, self._PATH_ENTRIES)
 
         # Separator for tolerances
         row += 1
-        ttk.Separator(main_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(main_frame, row)
 
         row += 1
         ttk.Label(
-            main_frame, text="Tolerances & Thresholds", font=("Arial", 12, "bold")
+            main_frame, text="Tolerances & Thresholds", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
-        # Pixel Difference Threshold
-        row += 1
-        ttk.Label(main_frame, text="Pixel Diff Threshold (%):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.pixel_diff_threshold_var = tk.StringVar(value="0.01")
-        ttk.Entry(
-            main_frame, textvariable=self.pixel_diff_threshold_var, width=50
-        ).grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5)
-
-        # Pixel Change Threshold
-        row += 1
-        ttk.Label(main_frame, text="Min Pixel Change:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.pixel_change_threshold_var = tk.StringVar(value="1")
-        ttk.Entry(
-            main_frame, textvariable=self.pixel_change_threshold_var, width=50
-        ).grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5)
-
-        # SSIM Threshold
-        row += 1
-        ttk.Label(main_frame, text="SSIM Threshold (0-1):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.ssim_threshold_var = tk.StringVar(value="0.95")
-        ttk.Entry(main_frame, textvariable=self.ssim_threshold_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Color Distance Threshold
-        row += 1
-        ttk.Label(main_frame, text="Color Distance Threshold:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.color_distance_var = tk.StringVar(value="10.0")
-        ttk.Entry(main_frame, textvariable=self.color_distance_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Min Contour Area
-        row += 1
-        ttk.Label(main_frame, text="Min Bounding Box Area:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.min_contour_var = tk.StringVar(value="50")
-        ttk.Entry(main_frame, textvariable=self.min_contour_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
+        row = self._add_entry_rows(main_frame, row + 1, self._TOLERANCE_ENTRIES)
 
         # Separator for visual settings
         row += 1
-        ttk.Separator(main_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(main_frame, row)
 
         row += 1
-        ttk.Label(main_frame, text="Visual Settings", font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=3, sticky=tk.W
-        )
+        ttk.Label(
+            main_frame, text="Visual Settings", font=self._fonts["section"]
+        ).grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
         # Histogram Equalization
         row += 1
@@ -211,98 +243,20 @@ class ComparisonUI:
             color_frame, width=30, height=20, bg="red", relief=tk.SUNKEN
         )
         self.color_preview.pack(side=tk.LEFT, padx=5)
-        self.highlight_color_var.trace("w", self._update_color_preview)
+        self.highlight_color_var.trace_add("write", self._schedule_color_preview)
 
-        # Diff Enhancement Factor
-        row += 1
-        ttk.Label(main_frame, text="Diff Enhancement Factor:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.diff_enhancement_var = tk.StringVar(value="5.0")
-        ttk.Entry(main_frame, textvariable=self.diff_enhancement_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
+        row = self._add_entry_rows(main_frame, row + 1, self._VISUAL_ENTRIES)
 
         # Separator for histogram settings
         row += 1
-        ttk.Separator(main_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(main_frame, row)
 
         row += 1
         ttk.Label(
-            main_frame, text="Histogram Visualization", font=("Arial", 12, "bold")
+            main_frame, text="Histogram Visualization", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
-        # Histogram Bins
-        row += 1
-        ttk.Label(main_frame, text="Histogram Bins (64-512):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_bins_var = tk.StringVar(value="256")
-        ttk.Entry(main_frame, textvariable=self.hist_bins_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Figure Width
-        row += 1
-        ttk.Label(main_frame, text="Figure Width (inches):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_width_var = tk.StringVar(value="16")
-        ttk.Entry(main_frame, textvariable=self.hist_width_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Figure Height
-        row += 1
-        ttk.Label(main_frame, text="Figure Height (inches):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_height_var = tk.StringVar(value="6")
-        ttk.Entry(main_frame, textvariable=self.hist_height_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Grayscale Alpha
-        row += 1
-        ttk.Label(main_frame, text="Grayscale Transparency (0-1):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_gray_alpha_var = tk.StringVar(value="0.7")
-        ttk.Entry(main_frame, textvariable=self.hist_gray_alpha_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # RGB Alpha
-        row += 1
-        ttk.Label(main_frame, text="RGB Transparency (0-1):").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_rgb_alpha_var = tk.StringVar(value="0.7")
-        ttk.Entry(main_frame, textvariable=self.hist_rgb_alpha_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # Grayscale Line Width
-        row += 1
-        ttk.Label(main_frame, text="Grayscale Line Width:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_gray_lw_var = tk.StringVar(value="2.0")
-        ttk.Entry(main_frame, textvariable=self.hist_gray_lw_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
-
-        # RGB Line Width
-        row += 1
-        ttk.Label(main_frame, text="RGB Line Width:").grid(
-            row=row, column=0, sticky=tk.W, pady=5
-        )
-        self.hist_rgb_lw_var = tk.StringVar(value="1.5")
-        ttk.Entry(main_frame, textvariable=self.hist_rgb_lw_var, width=50).grid(
-            row=row, column=1, sticky=(tk.W, tk.E), padx=5
-        )
+        row = self._add_entry_rows(main_frame, row + 1, self._HISTOGRAM_ENTRIES)
 
         # Show Grayscale
         row += 1
@@ -340,21 +294,157 @@ class ComparisonUI:
         button_frame = ttk.Frame(container)
         button_frame.grid(row=1, column=0, columnspan=2, pady=(20, 0))
 
-        ttk.Button(
+        self._start_button = ttk.Button(
             button_frame, text="Start Comparison", command=self._on_start, width=20
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self._start_button.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(button_frame, text="Cancel", command=self._on_cancel, width=20).pack(
             side=tk.LEFT, padx=5
         )
 
+    # Numeric fields parsed by _parse_numeric_fields:
+    # (name, label, converter, value when left empty). The field's text is
+    # read from the "<name>_var" StringVar and converted with int()/float(),
+    # so input such as "1.5" for an integer field is reported, not truncated.
+    _NUMERIC_FIELDS = (
+        ("pixel_diff_threshold", "Pixel Diff Threshold", float, _REQUIRED),
+        ("pixel_change_threshold", "Min Pixel Change", int, _REQUIRED),
+        ("ssim_threshold", "SSIM Threshold", float, _REQUIRED),
+        ("color_distance", "Color Distance Threshold", float, _REQUIRED),
+        ("min_contour", "Min Bounding Box Area", int, _REQUIRED),
+        ("diff_enhancement", "Diff Enhancement Factor", float, _REQUIRED),
+        ("hist_bins", "Histogram Bins", int, _REQUIRED),
+        ("hist_width", "Figure Width", float, _REQUIRED),
+        ("hist_height", "Figure Height", float, _REQUIRED),
+        ("hist_gray_alpha", "Grayscale Transparency", float, _REQUIRED),
+        ("hist_rgb_alpha", "RGB Transparency", float, _REQUIRED),
+        ("hist_gray_lw", "Grayscale Line Width", float, _REQUIRED),
+        ("hist_rgb_lw", "RGB Line Width", float, _REQUIRED),
+        ("max_workers", "Max Worker Processes", int, None),
+        ("anomaly_threshold", "Anomaly Threshold", float, 2.0),
+        ("max_runs", "Max Runs to Keep", int, None),
+        ("max_age_days", "Max Age (days)", int, None),
+        ("flip_ppd", "Pixels Per Degree", float, 67.0),
+    )
+
+    # Config/HistogramConfig keyword -> parsed numeric field name
+    _CONFIG_NUMERIC = {
+        "pixel_diff_threshold": "pixel_diff_threshold",
+        "pixel_change_threshold": "pixel_change_threshold",
+        "ssim_threshold": "ssim_threshold",
+        "color_distance_threshold": "color_distance",
+        "min_contour_area": "min_contour",
+        "diff_enhancement_factor": "diff_enhancement",
+        "max_workers": "max_workers",
+        "anomaly_threshold": "anomaly_threshold",
+        "retention_max_runs": "max_runs",
+        "retention_max_age_days": "max_age_days",
+        "flip_pixels_per_degree": "flip_ppd",
+    }
+    _HISTOGRAM_NUMERIC = {
+        "bins": "hist_bins",
+        "figure_width": "hist_width",
+        "figure_height": "hist_height",
+        "grayscale_alpha": "hist_gray_alpha",
+        "rgb_alpha": "hist_rgb_alpha",
+        "grayscale_linewidth": "hist_gray_lw",
+        "rgb_linewidth": "hist_rgb_lw",
+    }
+
+    # Config/HistogramConfig keyword -> "<name>_var" passed through unchanged
+    _CONFIG_VARS = {
+        "diff_dir": "diff_dir",
+        "html_dir": "html_dir",
+        "use_histogram_equalization": "use_histogram",
+        "enable_parallel": "enable_parallel",
+        "enable_history": "enable_history",
+        "retention_keep_all": "keep_all_runs",
+        "retention_keep_annotated": "keep_annotated",
+        "retention_keep_anomalies": "keep_anomalies",
+        "enable_flip": "enable_flip",
+        "flip_default_colormap": "flip_default_colormap",
+    }
+    _HISTOGRAM_VARS = {
+        "show_grayscale": "hist_show_gray",
+        "show_rgb": "hist_show_rgb",
+    }
+
+    # FLIP colormap checkboxes, in the order they are offered to Config
+    _FLIP_COLORMAPS = ("viridis", "jet", "turbo", "magma")
+
+    def _collect_kwargs(self, numeric, variables, values) -> Dict[str, Any]:
+        """Build constructor keywords from parsed numeric values and vars."""
+        kwargs = {kw: values[name] for kw, name in numeric.items()}
+        for kw, name in variables.items():
+            kwargs[kw] = getattr(self, f"{name}_var").get()
+        return kwargs
+
+    def _parse_numeric_fields(self) -> Dict[str, Any]:
+        """Read and convert every numeric field in one pass.
+
+        Returns:
+            Parsed values keyed by field name
+
+        Raises:
+            ValueError: Listing every field that failed to parse
+        """
+        values: Dict[str, Any] = {}
+        errors = []
+        for name, label, convert, default in self._NUMERIC_FIELDS:
+            raw = getattr(self, f"{name}_var").get().strip()
+            if not raw and default is not _REQUIRED:
+                values[name] = default
+                continue
+            try:
+                values[name] = convert(raw)
+            except ValueError:
+                errors.append(f"{label}: {raw!r}")
+
+        if errors:
+            raise ValueError("\n".join(errors))
+        return values
+
+    def _add_divider(self, frame, row) -> None:
+        """Add a full-width horizontal divider at the given grid row.
+
+        A 2px frame filled with one background color; unlike ttk.Separator,
+        it does not tile a theme image across the width on every resize.
+        """
+        ttk.Frame(frame, height=2, style="Divider.TFrame").grid(
+            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
+        )
+
+    def _add_entry_rows(self, frame, first_row, entries) -> int:
+        """Add a Label/Entry row per entry, binding each to a new StringVar.
+
+        Args:
+            frame: Parent frame laid out with grid
+            first_row: Grid row of the first entry
+            entries: (label, attribute, default) tuples; the StringVar,
+                holding the default as text, is stored on self under the
+                attribute name
+
+        Returns:
+            Grid row of the last entry added
+        """
+        row = first_row - 1
+        for row, (label, attr, default) in enumerate(entries, start=first_row):
+            var = tk.StringVar(value=str(default))
+            setattr(self, attr, var)
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+            ttk.Entry(frame, textvariable=var, width=50).grid(
+                row=row, column=1, sticky=(tk.W, tk.E), padx=5
+            )
+        return row
+
     def _create_history_widgets(self, parent_frame):
         """Create historical tracking configuration widgets."""
         row = 0
 
         # Historical Metrics Tracking
         ttk.Label(
-            parent_frame, text="Historical Metrics Tracking", font=("Arial", 14, "bold")
+            parent_frame, text="Historical Metrics Tracking", font=self._fonts["panel"]
         ).grid(row=row, column=0, columnspan=3, pady=(0, 15), sticky=tk.W)
 
         # Enable History
@@ -397,7 +487,7 @@ class ComparisonUI:
             parent_frame,
             text="(Optional - Git commit SHA for exact reproducibility)",
             foreground="gray",
-            font=("Arial", 8),
+            font=self._fonts["note"],
         ).grid(row=row + 1, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
 
         # History Database Path
@@ -417,19 +507,17 @@ class ComparisonUI:
             parent_frame,
             text="(Optional - default: <base-dir>/.imgcomp_history/)",
             foreground="gray",
-            font=("Arial", 8),
+            font=self._fonts["note"],
         ).grid(row=row + 1, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
 
         # Separator
         row += 2
-        ttk.Separator(parent_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(parent_frame, row)
 
         # Anomaly Detection
         row += 1
         ttk.Label(
-            parent_frame, text="Anomaly Detection", font=("Arial", 12, "bold")
+            parent_frame, text="Anomaly Detection", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
 
         row += 1
@@ -438,7 +526,11 @@ class ComparisonUI:
         )
         self.anomaly_threshold_var = tk.StringVar(value="2.0")
         self.anomaly_threshold_entry = ttk.Entry(
-            parent_frame, textvariable=self.anomaly_threshold_var, width=10
+            parent_frame,
+            textvariable=self.anomaly_threshold_var,
+            width=10,
+            validate="key",
+            validatecommand=self._float_vcmd,
         )
         self.anomaly_threshold_entry.grid(row=row, column=1, sticky=tk.W, padx=5)
 
@@ -446,19 +538,17 @@ class ComparisonUI:
             parent_frame,
             text="(standard deviations)",
             foreground="gray",
-            font=("Arial", 8),
+            font=self._fonts["note"],
         ).grid(row=row, column=2, sticky=tk.W)
 
         # Separator
         row += 1
-        ttk.Separator(parent_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(parent_frame, row)
 
         # Data Retention
         row += 1
         ttk.Label(
-            parent_frame, text="Data Retention (Cleanup)", font=("Arial", 12, "bold")
+            parent_frame, text="Data Retention (Cleanup)", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
 
         # Keep all runs
@@ -478,7 +568,12 @@ class ComparisonUI:
         )
         self.max_runs_var = tk.StringVar()
         self.max_runs_entry = ttk.Entry(
-            parent_frame, textvariable=self.max_runs_var, width=10, state="disabled"
+            parent_frame,
+            textvariable=self.max_runs_var,
+            width=10,
+            state="disabled",
+            validate="key",
+            validatecommand=self._int_vcmd,
         )
         self.max_runs_entry.grid(row=row, column=1, sticky=tk.W, padx=5)
 
@@ -489,7 +584,12 @@ class ComparisonUI:
         )
         self.max_age_days_var = tk.StringVar()
         self.max_age_days_entry = ttk.Entry(
-            parent_frame, textvariable=self.max_age_days_var, width=10, state="disabled"
+            parent_frame,
+            textvariable=self.max_age_days_var,
+            width=10,
+            state="disabled",
+            validate="key",
+            validatecommand=self._int_vcmd,
         )
         self.max_age_days_entry.grid(row=row, column=1, sticky=tk.W, padx=5)
 
@@ -521,13 +621,11 @@ class ComparisonUI:
 
         # Separator for FLIP settings
         row += 1
-        ttk.Separator(parent_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(parent_frame, row)
 
         row += 1
         ttk.Label(
-            parent_frame, text="FLIP Perceptual Metric (Optional)", font=("Arial", 12, "bold")
+            parent_frame, text="FLIP Perceptual Metric (Optional)", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
         # Enable FLIP
@@ -547,7 +645,12 @@ class ComparisonUI:
         )
         self.flip_ppd_var = tk.StringVar(value="67.0")
         self.flip_ppd_entry = ttk.Entry(
-            parent_frame, textvariable=self.flip_ppd_var, width=50, state="disabled"
+            parent_frame,
+            textvariable=self.flip_ppd_var,
+            width=50,
+            state="disabled",
+            validate="key",
+            validatecommand=self._float_vcmd,
         )
         self.flip_ppd_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5)
 
@@ -555,7 +658,7 @@ class ComparisonUI:
             parent_frame,
             text="(67.0 = 0.7m viewing distance on 24\" 1080p display)",
             foreground="gray",
-            font=("Arial", 8),
+            font=self._fonts["note"],
         ).grid(row=row + 1, column=0, columnspan=3, sticky=tk.W, pady=(0, 5))
 
         # FLIP Colormaps
@@ -609,13 +712,11 @@ class ComparisonUI:
 
         # Separator for Parallel Processing
         row += 1
-        ttk.Separator(parent_frame, orient="horizontal").grid(
-            row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15
-        )
+        self._add_divider(parent_frame, row)
 
         row += 1
         ttk.Label(
-            parent_frame, text="Parallel Processing (Optional)", font=("Arial", 12, "bold")
+            parent_frame, text="Parallel Processing (Optional)", font=self._fonts["section"]
         ).grid(row=row, column=0, columnspan=3, sticky=tk.W)
 
         # Enable Parallel
@@ -635,7 +736,12 @@ class ComparisonUI:
         )
         self.max_workers_var = tk.StringVar()
         self.max_workers_entry = ttk.Entry(
-            parent_frame, textvariable=self.max_workers_var, width=10, state="disabled"
+            parent_frame,
+            textvariable=self.max_workers_var,
+            width=10,
+            state="disabled",
+            validate="key",
+            validatecommand=self._int_vcmd,
         )
         self.max_workers_entry.grid(row=row, column=1, sticky=tk.W, padx=5)
 
@@ -643,7 +749,7 @@ class ComparisonUI:
             parent_frame,
             text="(leave empty to use CPU count)",
             foreground="gray",
-            font=("Arial", 8),
+            font=self._fonts["note"],
         ).grid(row=row, column=2, sticky=tk.W)
 
         # Info text
@@ -688,21 +794,44 @@ class ComparisonUI:
         self.keep_annotated_check.config(state=state)
         self.keep_anomalies_check.config(state=state)
 
+    # Delay (ms) after the last keystroke before the color preview is redrawn
+    COLOR_PREVIEW_DELAY_MS = 50
+
+    def _schedule_color_preview(self, *args):
+        """Debounce color preview updates while the user is typing."""
+        if self._color_after_id is not None:
+            self.root.after_cancel(self._color_after_id)
+        self._color_after_id = self.root.after(
+            self.COLOR_PREVIEW_DELAY_MS, self._update_color_preview
+        )
+
     def _update_color_preview(self, *args):
         """Update the color preview box."""
-        try:
-            color_str = self.highlight_color_var.get()
-            parts = [int(x.strip()) for x in color_str.split(",")]
-            if len(parts) == 3 and all(0 <= p <= 255 for p in parts):
-                hex_color = f"#{parts[0]:02x}{parts[1]:02x}{parts[2]:02x}"
-                self.color_preview.configure(bg=hex_color)
-        except (ValueError, AttributeError):
-            logger.debug(f"Invalid color format provided: {color_str}")
-            pass
+        self._color_after_id = None
+        color_str = self.highlight_color_var.get()
+        rgb = _parse_rgb(color_str)
+        if rgb is None:
+            logger.debug("Invalid color format provided: %s", color_str)
+            return
+
+        r, g, b = rgb
+        hex_color = f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}"
+        if hex_color != self._last_preview_color:
+            self.color_preview.configure(bg=hex_color)
+            self._last_preview_color = hex_color
 
     def _browse_base_dir(self) -> None:
-        """Open directory browser for base directory."""
-        directory = filedialog.askdirectory(title="Select Base Directory")
+        """Open directory browser for base directory.
+
+        Tk widgets may only be used from the main thread, so the dialog runs
+        here; it is modal to the config window and services its event loop
+        while open.
+        """
+        directory = filedialog.askdirectory(
+            parent=self.root,
+            title="Select Base Directory",
+            initialdir=self.base_dir_var.get() or None,
+        )
         if directory:
             self.base_dir_var.set(directory)
 
@@ -711,167 +840,143 @@ class ComparisonUI:
         logger.debug("Starting comparison from UI")
         try:
             # Validate inputs
-            if not self.base_dir_var.get():
+            base_dir = self.base_dir_var.get()
+            new_dir = self.new_dir_var.get()
+            known_good_dir = self.known_good_var.get()
+
+            if not base_dir:
                 logger.warning("Base directory not selected")
                 messagebox.showerror("Error", "Please select a base directory")
                 return
 
-            if not self.new_dir_var.get():
+            if not new_dir:
                 logger.warning("New images directory not specified")
                 messagebox.showerror("Error", "Please specify new images directory")
                 return
 
-            if not self.known_good_var.get():
+            if not known_good_dir:
                 messagebox.showerror("Error", "Please specify known good directory")
                 return
 
-            # Create config
-            pixel_diff_threshold: float = float(self.pixel_diff_threshold_var.get())
-            pixel_change_threshold: int = int(self.pixel_change_threshold_var.get())
-            ssim_threshold: float = float(self.ssim_threshold_var.get())
-            color_distance: float = float(self.color_distance_var.get())
-            min_contour: int = int(self.min_contour_var.get())
-            diff_enhancement: float = float(self.diff_enhancement_var.get())
+            # Parse all numeric fields, reporting every invalid one at once
+            values = self._parse_numeric_fields()
 
             # Parse highlight color
-            color_parts: list = [
-                int(x.strip()) for x in self.highlight_color_var.get().split(",")
-            ]
-            if len(color_parts) != 3 or not all(0 <= p <= 255 for p in color_parts):
+            highlight_color = _parse_rgb(self.highlight_color_var.get())
+            if highlight_color is None:
                 raise ValueError("Invalid color format")
-            highlight_color: Tuple[int, int, int] = tuple(color_parts)
-
-            # Create histogram config
-            from config import HistogramConfig
 
             hist_config = HistogramConfig(
-                bins=int(self.hist_bins_var.get()),
-                figure_width=float(self.hist_width_var.get()),
-                figure_height=float(self.hist_height_var.get()),
-                grayscale_alpha=float(self.hist_gray_alpha_var.get()),
-                rgb_alpha=float(self.hist_rgb_alpha_var.get()),
-                grayscale_linewidth=float(self.hist_gray_lw_var.get()),
-                rgb_linewidth=float(self.hist_rgb_lw_var.get()),
-                show_grayscale=self.hist_show_gray_var.get(),
-                show_rgb=self.hist_show_rgb_var.get(),
-            )
-
-            # Parse parallel processing settings
-            enable_parallel = self.enable_parallel_var.get()
-            max_workers = (
-                int(self.max_workers_var.get()) if self.max_workers_var.get() else None
-            )
-
-            # Parse historical tracking settings
-            enable_history = self.enable_history_var.get()
-            build_number = (
-                self.build_number_var.get() if self.build_number_var.get() else None
-            )
-            history_db_path = (
-                Path(self.history_db_var.get()) if self.history_db_var.get() else None
+                **self._collect_kwargs(
+                    self._HISTOGRAM_NUMERIC, self._HISTOGRAM_VARS, values
+                )
             )
-            anomaly_threshold = (
-                float(self.anomaly_threshold_var.get())
-                if self.anomaly_threshold_var.get()
-                else 2.0
-            )
-
-            # Parse retention settings
-            retention_keep_all = self.keep_all_runs_var.get()
-            retention_max_runs = (
-                int(self.max_runs_var.get()) if self.max_runs_var.get() else None
-            )
-            retention_max_age = (
-                int(self.max_age_days_var.get())
-                if self.max_age_days_var.get()
-                else None
-            )
-            retention_keep_annotated = self.keep_annotated_var.get()
-            retention_keep_anomalies = self.keep_anomalies_var.get()
-
-            # Get commit hash (optional)
-            commit_hash = self.commit_hash_var.get().strip() or None
 
-            # Parse FLIP settings
-            enable_flip = self.enable_flip_var.get()
-            flip_pixels_per_degree = (
-                float(self.flip_ppd_var.get()) if self.flip_ppd_var.get() else 67.0
-            )
-
-            # Build FLIP colormaps list from checkboxes
-            flip_colormaps = []
-            if self.flip_viridis_var.get():
-                flip_colormaps.append("viridis")
-            if self.flip_jet_var.get():
-                flip_colormaps.append("jet")
-            if self.flip_turbo_var.get():
-                flip_colormaps.append("turbo")
-            if self.flip_magma_var.get():
-                flip_colormaps.append("magma")
-
-            # Default to viridis if none selected
-            if not flip_colormaps:
-                flip_colormaps = ["viridis"]
-
-            flip_default_colormap = self.flip_default_colormap_var.get()
+            history_db = self.history_db_var.get()
+            flip_colormaps = [
+                name
+                for name in self._FLIP_COLORMAPS
+                if getattr(self, f"flip_{name}_var").get()
+            ]
 
             self.config = Config(
-                base_dir=Path(self.base_dir_var.get()),
-                new_dir=self.new_dir_var.get(),
-                known_good_dir=self.known_good_var.get(),
-                diff_dir=self.diff_dir_var.get(),
-                html_dir=self.html_dir_var.get(),
-                pixel_diff_threshold=pixel_diff_threshold,
-                pixel_change_threshold=pixel_change_threshold,
-                ssim_threshold=ssim_threshold,
-                color_distance_threshold=color_distance,
-                min_contour_area=min_contour,
-                use_histogram_equalization=self.use_histogram_var.get(),
+                base_dir=Path(base_dir),
+                new_dir=new_dir,
+                known_good_dir=known_good_dir,
                 highlight_color=highlight_color,
-                diff_enhancement_factor=diff_enhancement,
                 histogram_config=hist_config,
-                # Parallel processing settings
-                enable_parallel=enable_parallel,
-                max_workers=max_workers,
-                # Historical tracking settings
-                enable_history=enable_history,
-                build_number=build_number,
-                commit_hash=commit_hash,
-                history_db_path=history_db_path,
-                anomaly_threshold=anomaly_threshold,
-                # Retention policy settings
-                retention_keep_all=retention_keep_all,
-                retention_max_runs=retention_max_runs,
-                retention_max_age_days=retention_max_age,
-                retention_keep_annotated=retention_keep_annotated,
-                retention_keep_anomalies=retention_keep_anomalies,
-                # FLIP settings
-                enable_flip=enable_flip,
-                flip_pixels_per_degree=flip_pixels_per_degree,
-                flip_colormaps=flip_colormaps,
-                flip_default_colormap=flip_default_colormap,
+                build_number=self.build_number_var.get() or None,
+                commit_hash=self.commit_hash_var.get().strip() or None,
+                history_db_path=Path(history_db) if history_db else None,
+                # Default to viridis if none selected
+                flip_colormaps=flip_colormaps or ["viridis"],
+                **self._collect_kwargs(self._CONFIG_NUMERIC, self._CONFIG_VARS, values),
             )
 
-            # Validate config
-            is_valid, error_msg = self.config.validate()
-            if not is_valid:
-                messagebox.showerror("Validation Error", error_msg)
+            # Validate config in the background; directory scans can be slow
+            # on large or network trees and the window should stay responsive
+            dirs = (base_dir, new_dir, known_good_dir)
+            if dirs == self._validated_dirs:
+                self._done.set(1)
                 return
-
-            self.root.quit()
+            self._start_button.config(state="disabled")
+            self._pending_validation = Future()
+            threading.Thread(
+                target=_run_validation,
+                args=(self.config, self._pending_validation),
+                name="config-validate",
+                daemon=True,
+            ).start()
+            self._pending_dirs = dirs
+            self._validation_after_id = self.root.after(
+                self.VALIDATION_POLL_MS, self._finish_start
+            )
 
         except ValueError as e:
-            messagebox.showerror("Error", f"Invalid value: {str(e)}")
+            messagebox.showerror("Error", f"Invalid value:\n{e}")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    # Poll interval (ms) while Config.validate runs in the background
+    VALIDATION_POLL_MS = 20
+
+    def _finish_start(self) -> None:
+        """Close the dialog once background validation has passed."""
+        future = self._pending_validation
+        if not future.done():
+            self._validation_after_id = self.root.after(
+                self.VALIDATION_POLL_MS, self._finish_start
+            )
+            return
+
+        self._pending_validation = None
+        self._validation_after_id = None
+        self._start_button.config(state="normal")
+        try:
+            is_valid, error_msg = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return
+
+        if not is_valid:
+            messagebox.showerror("Validation Error", error_msg)
+            return
+
+        self._validated_dirs = self._pending_dirs
+        self._done.set(1)
+
     def _on_cancel(self):
         """Cancel and close UI."""
+        if self._validation_after_id is not None:
+            self.root.after_cancel(self._validation_after_id)
+            self._validation_after_id = None
+            self._pending_validation = None
+            self._start_button.config(state="normal")
+        self.config = None
+        self._done.set(1)
+
+    def reset(self) -> None:
+        """Restore every field to its default so the dialog can be shown again."""
+        for var, default in self._defaults:
+            var.set(default)
+        self._toggle_flip_fields()
+        self._toggle_parallel_fields()
+        self._toggle_history_fields()
+        self._toggle_retention_fields()
         self.config = None
-        self.root.quit()
 
-    def run(self) -> Optional[Config]:
-        """Run the UI and return the configuration."""
-        self.root.mainloop()
-        self.root.destroy()
+    def run(self, close: bool = True) -> Optional[Config]:
+        """Run the UI and return the configuration.
+
+        Args:
+            close: Destroy the window when the dialog ends. Pass False to
+                keep the widget tree; the window is hidden and can be shown
+                again by calling run() (optionally after reset()).
+        """
+        self.root.deiconify()
+        self.root.wait_variable(self._done)
+        if close:
+            self.root.destroy()
+        else:
+            self.root.withdraw()
         return self.config
@@ -2,16 +2,51 @@
 """
 Installation verification script.
 Tests all dependencies and core functionality.
+
+Runs headless: matplotlib uses the Agg backend and no Tk root window is
+ever created, so it works in CI containers without a display.
 """
 
 import sys
 import os
 import logging
+import functools
+import importlib.util
+import traceback
 
 # Setup logging - verify.py is user-facing so we use print for output
 logger = logging.getLogger("ImageComparison")
 
 
+# Print full tracebacks for failed checks only when asked (-v/--verbose);
+# otherwise each failure is reported as a single line
+VERBOSE = "-v" in sys.argv or "--verbose" in sys.argv
+
+# Stop at the first failed check (--fail-fast); on a broken install the
+# later checks would only fail again importing the same dependencies
+FAIL_FAST = "--fail-fast" in sys.argv
+
+# Side length of the synthetic RGB image shared by the functional checks
+_TEST_IMAGE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _test_image():
+    """Return a seeded random RGB test image (created once, read-only).
+
+    numpy is imported here rather than at module level so a missing install
+    is reported by the checks instead of crashing the script.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    img = rng.integers(
+        0, 255, (_TEST_IMAGE_SIZE, _TEST_IMAGE_SIZE, 3), dtype=np.uint8
+    )
+    img.setflags(write=False)
+    return img
+
+
 def print_header(text):
     """Print a formatted header."""
     print("\n" + "=" * 70)
@@ -26,28 +61,42 @@ def print_section(text):
 
 
 def test_imports():
-    """Test that all required modules can be imported."""
+    """Test that all required modules are installed.
+
+    Modules are located with importlib.util.find_spec rather than imported,
+    so heavy packages (matplotlib, cv2, skimage) are not initialized just to
+    print a check mark; test_basic_functionality imports and exercises them.
+    """
     print_section("Testing Module Imports")
     logger.debug("Starting module import tests")
 
+    # module name -> (description, module whose presence is checked)
     modules = {
-        "PIL": "Pillow (image processing)",
-        "numpy": "NumPy (array operations)",
-        "cv2": "OpenCV (computer vision)",
-        "skimage": "scikit-image (SSIM calculation)",
-        "matplotlib": "Matplotlib (histogram visualization)",
-        "tkinter": "tkinter (GUI - optional for CLI usage)",
+        "PIL": ("Pillow (image processing)", "PIL"),
+        "numpy": ("NumPy (array operations)", "numpy"),
+        "cv2": ("OpenCV (computer vision)", "cv2"),
+        "skimage": ("scikit-image (SSIM calculation)", "skimage"),
+        "matplotlib": ("Matplotlib (histogram visualization)", "matplotlib"),
+        # The tkinter package ships with Python; the Tk bindings may not
+        "tkinter": ("tkinter (GUI - optional for CLI usage)", "_tkinter"),
     }
 
     all_success = True
-    for module, description in modules.items():
-        try:
-            __import__(module)
+    for module, (description, spec_name) in modules.items():
+        # Already imported (e.g. verification re-run in the same process)
+        found = spec_name in sys.modules
+        if not found:
+            try:
+                found = importlib.util.find_spec(spec_name) is not None
+            except (ImportError, ValueError) as e:
+                logger.debug("find_spec failed for %s: %s", spec_name, e)
+
+        if found:
             print(f"✓ {module:15s} - {description}")
-            logger.debug(f"✓ {module} imported successfully")
-        except ImportError as e:
-            print(f"✗ {module:15s} - FAILED: {e}")
-            logger.warning(f"Failed to import {module}: {e}")
+            logger.debug("✓ %s found", module)
+        else:
+            print(f"✗ {module:15s} - FAILED: No module named '{spec_name}'")
+            logger.warning(f"Module not found: {module}")
             all_success = False
 
     logger.info(f"Module import tests {'passed' if all_success else 'failed'}")
@@ -74,7 +123,7 @@ def test_core_modules():
         try:
             __import__(module)
             print(f"✓ {module}.py")
-            logger.debug(f"✓ {module} module imported successfully")
+            logger.debug("✓ %s module imported successfully", module)
         except ImportError as e:
             print(f"✗ {module}.py - FAILED: {e}")
             logger.error(f"Failed to import {module}: {e}")
@@ -100,7 +149,7 @@ def test_basic_functionality():
 
         # Test 1: Create test image
         print("Creating test image...", end=" ")
-        test_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        test_img = _test_image()
         img = Image.fromarray(test_img)
         print("✓")
         logger.debug("Test image created successfully")
@@ -108,7 +157,7 @@ def test_basic_functionality():
         # Test 2: Image operations
         print("Testing image operations...", end=" ")
         gray = cv2.cvtColor(test_img, cv2.COLOR_RGB2GRAY)
-        assert gray.shape == (100, 100)
+        assert gray.shape == (_TEST_IMAGE_SIZE, _TEST_IMAGE_SIZE)
         print("✓")
         logger.debug("Image operations test passed")
 
@@ -133,7 +182,7 @@ def test_basic_functionality():
         print("Testing matplotlib (non-interactive)...", end=" ")
         import matplotlib
 
-        matplotlib.use("Agg")
+        matplotlib.use("Agg", force=True)
         import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots()
@@ -189,18 +238,17 @@ def test_analyzers():
     logger.debug("Starting analyzer registry tests")
 
     try:
-        import numpy as np
         from analyzers import AnalyzerRegistry
 
         print("Creating AnalyzerRegistry...", end=" ")
         registry = AnalyzerRegistry()
         print("✓")
         logger.debug(
-            f"AnalyzerRegistry created with {len(registry.analyzers)} analyzers"
+            "AnalyzerRegistry created with %d analyzers", len(registry.analyzers)
         )
 
         print("Testing analyzers on sample images...", end=" ")
-        img1 = np.random.randint(0, 255, (50, 50, 3), dtype=np.uint8)
+        img1 = _test_image()
         img2 = img1.copy()
         results = registry.analyze_all(img1, img2)
 
@@ -213,7 +261,7 @@ def test_analyzers():
         print(f"Registered analyzers: {len(registry.analyzers)}")
         for analyzer in registry.analyzers:
             print(f"  - {analyzer.name}")
-            logger.debug(f"Analyzer registered: {analyzer.name}")
+            logger.debug("Analyzer registered: %s", analyzer.name)
 
         logger.info("Analyzer tests passed")
         return True
@@ -221,9 +269,8 @@ def test_analyzers():
     except Exception as e:
         print(f"\n✗ Analyzer test failed: {e}")
         logger.error(f"Analyzer test failed: {e}", exc_info=True)
-        import traceback
-
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 
@@ -232,10 +279,14 @@ def main():
     print_header("Image Comparison Tool - INSTALLATION VERIFICATION")
     logger.info("Starting installation verification")
 
+    # Pick the non-interactive backend before any check imports matplotlib
+    # (project modules such as processor import it at load time)
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
     print("\nPython version:", sys.version)
     print("Platform:", sys.platform)
-    logger.debug(f"Python version: {sys.version}")
-    logger.debug(f"Platform: {sys.platform}")
+    logger.debug("Python version: %s", sys.version)
+    logger.debug("Platform: %s", sys.platform)
 
     # Run all tests
     tests = [
@@ -254,10 +305,17 @@ def main():
         except Exception as e:
             print(f"\n✗ {test_name} test crashed: {e}")
             logger.error(f"{test_name} test crashed: {e}", exc_info=True)
-            import traceback
-
-            traceback.print_exc()
+            if VERBOSE:
+                traceback.print_exc()
             results.append((test_name, False))
+            success = False
+
+        if not success and FAIL_FAST:
+            skipped = len(tests) - len(results)
+            if skipped:
+                print(f"\nStopping after first failure ({skipped} checks skipped)")
+                logger.info("Fail-fast: skipped %d remaining checks", skipped)
+            break
 
     # Print summary
     print_header("VERIFICATION SUMMARY")
@@ -283,6 +341,8 @@ def main():
         print("\nPlease check the errors above and ensure all dependencies")
         print("are properly installed. Run 'python dependencies.py' for")
         print("detailed dependency information.")
+        if not VERBOSE:
+            print("Re-run with -v to print full tracebacks.")
         logger.warning("✗ Some verification tests failed")
         return 1
 
@@ -5,10 +5,15 @@ Generates matplotlib charts showing composite score trends over time and anomaly
 """
 
 import logging
-import base64
+import binascii
+import sys
+import warnings
 from io import BytesIO
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Sequence, Union
+from datetime import datetime, timezone
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +21,90 @@ logger = logging.getLogger(__name__)
 try:
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
     logger.warning("matplotlib not available - chart generation disabled")
 
+# ISO 8601 parser for timestamps numpy cannot convert directly. ciso8601 is
+# an optional C parser; datetime.fromisoformat only accepts a trailing 'Z'
+# from Python 3.11 on.
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _parse_timestamp(value: Any) -> np.datetime64:
+    """Convert one ISO string or datetime to datetime64 (NaT if invalid)."""
+    try:
+        if isinstance(value, str):
+            value = _parse_iso(value)
+        if value.tzinfo is not None:
+            # matplotlib plots aware datetimes in UTC; match that here
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(value, 'us')
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.debug("Skipping invalid timestamp %r: %s", value, e)
+        return np.datetime64('NaT', 'us')
+
+
+def _parse_timestamps(values: Sequence[Any]) -> np.ndarray:
+    """
+    Convert ISO timestamp strings (or datetimes) to a datetime64[us] array.
+
+    Naive ISO strings, as stored by the history database, are parsed by
+    numpy in a single call. Inputs numpy cannot take whole (timezone
+    offsets, invalid entries, aware datetimes) fall back to parsing each
+    value; invalid values become NaT.
+    """
+    try:
+        with warnings.catch_warnings():
+            # numpy only warns (deprecated) on timezone offsets; treat those
+            # as unparseable so the fallback converts them explicitly
+            warnings.simplefilter('error', DeprecationWarning)
+            return np.array(values, dtype='datetime64[us]')
+    except (ValueError, TypeError, DeprecationWarning):
+        return np.array([_parse_timestamp(v) for v in values], dtype='datetime64[us]')
+
+
+def _m4_indices(timestamps: np.ndarray, values: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Select the points needed to draw a series at ``buckets`` pixel columns.
+
+    The time range is split into equal-width buckets and, per bucket, only
+    the first, last, minimum and maximum points are kept (M4 aggregation),
+    so a line through them looks the same as one through every point.
+
+    Returns:
+        Indices into ``timestamps``/``values``, in time order
+    """
+    order = np.argsort(timestamps, kind='stable')
+    t = timestamps[order].astype(np.int64)
+    span = t[-1] - t[0]
+    if span <= 0:
+        bucket = np.zeros(len(t), dtype=np.int64)
+    else:
+        bucket = np.minimum(((t - t[0]) / span * buckets).astype(np.int64), buckets - 1)
+
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(t)] - 1
+    # Within each bucket, sort by value: bucket start/end are then min/max
+    by_value = np.lexsort((values[order], bucket))
+    keep = np.unique(np.concatenate((starts, ends, by_value[starts], by_value[ends])))
+    return order[keep]
+
+
+# Formats the generate_* methods can return (see TrendChartGenerator._render)
+_CHART_OUTPUTS = ('base64', 'bytes', 'path')
+
 
 class TrendChartGenerator:
     """
@@ -45,16 +127,101 @@ class TrendChartGenerator:
         """
         self.figsize = figsize
         self.dpi = dpi
+        # Figure/Axes shared by every chart this generator renders; created
+        # on first use and cleared between charts (see _get_axes)
+        self._fig = None
+        self._ax = None
+        # PNG output buffer, rewound and reused for every chart
+        self._buffer = BytesIO()
 
         if not MATPLOTLIB_AVAILABLE:
             logger.warning("TrendChartGenerator initialized but matplotlib not available")
 
+    def _get_axes(self):
+        """
+        Return the shared (figure, axes), reset for a new chart.
+
+        The figure is a plain Agg Figure, not registered with pyplot, so it
+        is freed with the generator. Each chart starts from a cleared figure
+        with default subplot parameters, so tight_layout/autofmt_xdate from
+        the previous chart cannot change the next one's layout.
+        """
+        if self._fig is None:
+            self._fig = Figure(figsize=self.figsize, dpi=self.dpi)
+            FigureCanvasAgg(self._fig)
+        else:
+            self._fig.clf()
+        self._fig.subplots_adjust(**{
+            name: matplotlib.rcParams[f'figure.subplot.{name}']
+            for name in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
+        self._ax = self._fig.add_subplot()
+        return self._fig, self._ax
+
+    def _render(
+        self,
+        fig,
+        output: str = 'base64',
+        path: Optional[Union[str, Path]] = None
+    ) -> Union[str, bytes, Path]:
+        """Lay out the figure, save it as PNG and return it per ``output``."""
+        return self._emit(self._png_bytes(fig), output, path)
+
+    def _png_bytes(self, fig) -> bytes:
+        """Lay out the figure and return it as PNG bytes."""
+        fig.tight_layout()
+        buffer = self._buffer
+        buffer.seek(0)
+        buffer.truncate()
+        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight')
+        return buffer.getvalue()
+
+    @staticmethod
+    def _emit(
+        png: bytes,
+        output: str = 'base64',
+        path: Optional[Union[str, Path]] = None
+    ) -> Union[str, bytes, Path]:
+        """
+        Return a rendered PNG in the requested form.
+
+        Args:
+            png: PNG image bytes
+            output: 'base64' for an inline-embeddable string, 'bytes' for the
+                raw PNG, or 'path' to write the PNG to ``path``
+            path: Destination file when output is 'path'
+
+        Returns:
+            Base64 string, PNG bytes, or the written path, per ``output``
+        """
+        if output not in _CHART_OUTPUTS:
+            raise ValueError(f"Unknown chart output: {output!r}")
+        if output == 'path':
+            if path is None:
+                raise ValueError("output='path' requires a path")
+            path = Path(path)
+            path.write_bytes(png)
+            return path
+        if output == 'bytes':
+            return png
+        # base64 output is 7-bit clean, so the ASCII decoder suffices
+        return binascii.b2a_base64(png, newline=False).decode('ascii')
+
+    def close(self) -> None:
+        """Release the shared matplotlib figure."""
+        if self._fig is not None:
+            self._fig.clf()
+            self._fig = None
+            self._ax = None
+
     def generate_trend_chart(
         self,
         historical_data: List[Dict[str, Any]],
         filename: str,
-        title: Optional[str] = None
-    ) -> Optional[str]:
+        title: Optional[str] = None,
+        output: str = 'base64',
+        path: Optional[Union[str, Path]] = None
+    ) -> Optional[Union[str, bytes, Path]]:
         """
         Generate line chart showing composite score trend over time.
 
@@ -62,9 +229,12 @@ class TrendChartGenerator:
             historical_data: List of dicts with 'timestamp', 'composite_score', 'is_anomaly'
             filename: Image filename for chart title
             title: Optional custom title
+            output: 'base64' (default), 'bytes', or 'path' to write to ``path``
+            path: Destination PNG file when output is 'path'
 
         Returns:
-            Base64-encoded PNG image string, or None if generation fails
+            Base64-encoded PNG string (or PNG bytes / the written path, per
+            ``output``), or None if generation fails
 
         Example:
             >>> data = [
@@ -82,61 +252,61 @@ class TrendChartGenerator:
             return None
 
         try:
-            # Extract data
-            timestamps = []
-            scores = []
-            anomalies = []
-
-            for entry in historical_data:
-                try:
-                    # Parse timestamp
-                    ts_str = entry.get('timestamp')
-                    if ts_str:
-                        # Handle both ISO format and datetime objects
-                        if isinstance(ts_str, str):
-                            ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                        else:
-                            ts = ts_str
-                        timestamps.append(ts)
-                        scores.append(entry.get('composite_score', 0))
-                        anomalies.append(entry.get('is_anomaly', False))
-                except (ValueError, AttributeError) as e:
-                    logger.debug(f"Skipping invalid entry: {e}")
-                    continue
+            # Extract data into preallocated arrays, then parse all
+            # timestamps in one pass
+            n = len(historical_data)
+            scores = np.empty(n, dtype=np.float64)
+            anomalies = np.empty(n, dtype=bool)
+            has_timestamp = np.zeros(n, dtype=bool)
+            raw_timestamps = []
+            for i, entry in enumerate(historical_data):
+                ts = entry.get('timestamp')
+                if ts:
+                    has_timestamp[i] = True
+                    raw_timestamps.append(ts)
+                    scores[i] = entry.get('composite_score', 0)
+                    anomalies[i] = entry.get('is_anomaly', False)
+
+            timestamps = _parse_timestamps(raw_timestamps)
+            valid = ~np.isnat(timestamps)
+            timestamps = timestamps[valid]
+            scores = scores[has_timestamp][valid]
+            anomalies = anomalies[has_timestamp][valid]
 
             if len(timestamps) < 2:
                 logger.debug("Not enough valid data points after parsing")
                 return None
 
-            # Create figure
-            fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            if not title:
+                title = f'Historical Trend: {filename}'
 
-            # Plot trend line
-            ax.plot(timestamps, scores, marker='o', linestyle='-', linewidth=2,
+            fig, ax = self._get_axes()
+
+            # Plot trend line; long histories are reduced to what the figure
+            # can show (a few points per pixel column)
+            line_ts, line_scores = timestamps, scores
+            max_points = int(self.figsize[0] * self.dpi)
+            if len(timestamps) > 4 * max_points:
+                keep = _m4_indices(timestamps, scores, max_points)
+                line_ts, line_scores = timestamps[keep], scores[keep]
+            ax.plot(line_ts, line_scores, marker='o', linestyle='-', linewidth=2,
                    markersize=6, color='#2E86AB', label='Composite Score')
 
             # Highlight anomalies
-            anomaly_timestamps = [ts for ts, is_anom in zip(timestamps, anomalies) if is_anom]
-            anomaly_scores = [score for score, is_anom in zip(scores, anomalies) if is_anom]
-
-            if anomaly_timestamps:
-                ax.scatter(anomaly_timestamps, anomaly_scores, color='#E63946',
+            if anomalies.any():
+                ax.scatter(timestamps[anomalies], scores[anomalies], color='#E63946',
                           s=150, marker='X', zorder=5, label='Anomalies', edgecolors='black')
 
             # Calculate mean line
-            if scores:
-                mean_score = sum(scores) / len(scores)
-                ax.axhline(y=mean_score, color='#06A77D', linestyle='--',
-                          linewidth=1.5, alpha=0.7, label=f'Mean: {mean_score:.1f}')
+            mean_score = scores.mean()
+            ax.axhline(y=mean_score, color='#06A77D', linestyle='--',
+                      linewidth=1.5, alpha=0.7, label=f'Mean: {mean_score:.1f}')
 
             # Formatting
             ax.set_xlabel('Date', fontsize=11, fontweight='bold')
             ax.set_ylabel('Composite Score', fontsize=11, fontweight='bold')
 
-            if title:
-                ax.set_title(title, fontsize=13, fontweight='bold', pad=15)
-            else:
-                ax.set_title(f'Historical Trend: {filename}', fontsize=13, fontweight='bold', pad=15)
+            ax.set_title(title, fontsize=13, fontweight='bold', pad=15)
 
             # Format x-axis dates
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
@@ -147,18 +317,10 @@ class TrendChartGenerator:
             ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
             ax.legend(loc='best', framealpha=0.9)
 
-            # Tight layout
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-            plt.close(fig)
+            image = self._render(fig, output, path)
 
             logger.debug(f"Generated trend chart for {filename}: {len(timestamps)} data points")
-            return image_base64
+            return image
 
         except Exception as e:
             logger.error(f"Failed to generate trend chart: {e}")
@@ -167,17 +329,22 @@ class TrendChartGenerator:
     def generate_anomaly_scatter(
         self,
         results: List[Any],
-        title: str = "Anomaly Detection Overview"
-    ) -> Optional[str]:
+        title: str = "Anomaly Detection Overview",
+        output: str = 'base64',
+        path: Optional[Union[str, Path]] = None
+    ) -> Optional[Union[str, bytes, Path]]:
         """
         Generate scatter plot showing all results with anomalies highlighted.
 
         Args:
             results: List of ComparisonResult objects with composite_score and is_anomaly
             title: Chart title
+            output: 'base64' (default), 'bytes', or 'path' to write to ``path``
+            path: Destination PNG file when output is 'path'
 
         Returns:
-            Base64-encoded PNG image string, or None if generation fails
+            Base64-encoded PNG string (or PNG bytes / the written path, per
+            ``output``), or None if generation fails
 
         Example:
             >>> chart = generator.generate_anomaly_scatter(results, "Current Run Anomalies")
@@ -191,55 +358,48 @@ class TrendChartGenerator:
             return None
 
         try:
-            # Extract data
-            normal_scores = []
-            normal_names = []
-            anomaly_scores = []
-            anomaly_names = []
-
+            # Extract data for results that have a score
+            indices = []
+            scores = []
+            anomalies = []
             for idx, result in enumerate(results):
-                if not hasattr(result, 'composite_score') or result.composite_score is None:
-                    continue
-
-                score = result.composite_score
-                name = result.filename if hasattr(result, 'filename') else f"Image {idx}"
-                is_anom = getattr(result, 'is_anomaly', False)
-
-                if is_anom:
-                    anomaly_scores.append((idx, score))
-                    anomaly_names.append(name)
-                else:
-                    normal_scores.append((idx, score))
-                    normal_names.append(name)
+                score = getattr(result, 'composite_score', None)
+                if score is not None:
+                    indices.append(idx)
+                    scores.append(score)
+                    anomalies.append(bool(getattr(result, 'is_anomaly', False)))
 
-            if not normal_scores and not anomaly_scores:
+            if not indices:
                 logger.debug("No valid data for scatter plot")
                 return None
 
-            # Create figure
-            fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            indices = np.asarray(indices)
+            scores = np.asarray(scores, dtype=np.float64)
+            anomalies = np.asarray(anomalies, dtype=bool)
+            normal = ~anomalies
+            anomaly_count = int(anomalies.sum())
+            normal_count = len(indices) - anomaly_count
+
+            fig, ax = self._get_axes()
 
             # Plot normal results
-            if normal_scores:
-                indices, scores = zip(*normal_scores)
-                ax.scatter(indices, scores, color='#2E86AB', s=60, alpha=0.6,
-                          label=f'Normal ({len(normal_scores)})', edgecolors='black', linewidth=0.5)
+            if normal_count:
+                ax.scatter(indices[normal], scores[normal], color='#2E86AB', s=60, alpha=0.6,
+                          label=f'Normal ({normal_count})', edgecolors='black', linewidth=0.5)
 
             # Plot anomalies
-            if anomaly_scores:
-                indices, scores = zip(*anomaly_scores)
-                ax.scatter(indices, scores, color='#E63946', s=150, marker='X',
-                          label=f'Anomalies ({len(anomaly_scores)})', edgecolors='black', linewidth=1.5, zorder=5)
+            if anomaly_count:
+                ax.scatter(indices[anomalies], scores[anomalies], color='#E63946', s=150, marker='X',
+                          label=f'Anomalies ({anomaly_count})', edgecolors='black', linewidth=1.5, zorder=5)
 
             # Calculate thresholds if we have anomalies with historical data
-            all_with_stats = [r for r in results
-                            if hasattr(r, 'historical_mean') and r.historical_mean is not None]
+            # Use first result's historical stats (same for all images from same run)
+            sample = next((r for r in results
+                           if getattr(r, 'historical_mean', None) is not None), None)
 
-            if all_with_stats:
-                # Use first result's historical stats (same for all images from same run)
-                sample = all_with_stats[0]
+            if sample is not None:
                 mean = sample.historical_mean
-                std = sample.historical_std_dev
+                std = getattr(sample, 'historical_std_dev', None)
 
                 if mean is not None and std is not None:
                     threshold = 2.0  # Default anomaly threshold
@@ -263,18 +423,10 @@ class TrendChartGenerator:
             ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
             ax.legend(loc='best', framealpha=0.9, fontsize=9)
 
-            # Tight layout
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-            plt.close(fig)
+            image = self._render(fig, output, path)
 
             logger.debug(f"Generated anomaly scatter plot: {len(results)} results")
-            return image_base64
+            return image
 
         except Exception as e:
             logger.error(f"Failed to generate anomaly scatter: {e}")
@@ -283,17 +435,22 @@ class TrendChartGenerator:
     def generate_summary_histogram(
         self,
         results: List[Any],
-        title: str = "Composite Score Distribution"
-    ) -> Optional[str]:
+        title: str = "Composite Score Distribution",
+        output: str = 'base64',
+        path: Optional[Union[str, Path]] = None
+    ) -> Optional[Union[str, bytes, Path]]:
         """
         Generate histogram showing distribution of composite scores.
 
         Args:
             results: List of ComparisonResult objects with composite_score
             title: Chart title
+            output: 'base64' (default), 'bytes', or 'path' to write to ``path``
+            path: Destination PNG file when output is 'path'
 
         Returns:
-            Base64-encoded PNG image string, or None if generation fails
+            Base64-encoded PNG string (or PNG bytes / the written path, per
+            ``output``), or None if generation fails
         """
         if not MATPLOTLIB_AVAILABLE:
             logger.debug("Skipping histogram - matplotlib not available")
@@ -304,35 +461,39 @@ class TrendChartGenerator:
             return None
 
         try:
-            # Extract scores
-            scores = [r.composite_score for r in results
-                     if hasattr(r, 'composite_score') and r.composite_score is not None]
+            # Extract scores and anomaly flags in one pass
+            scores = []
+            anomalies = []
+            for result in results:
+                score = getattr(result, 'composite_score', None)
+                if score is not None:
+                    scores.append(score)
+                    anomalies.append(bool(getattr(result, 'is_anomaly', False)))
 
             if len(scores) < 3:
                 logger.debug("Not enough scores for histogram")
                 return None
 
-            # Create figure
-            fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            scores = np.asarray(scores, dtype=np.float64)
+            anomalies = np.asarray(anomalies, dtype=bool)
+
+            fig, ax = self._get_axes()
 
             # Create histogram
             n, bins, patches = ax.hist(scores, bins=20, color='#2E86AB',
                                       alpha=0.7, edgecolor='black', linewidth=1)
 
-            # Color anomalies differently
-            anomaly_threshold = 2.0
-            for result in results:
-                if (hasattr(result, 'is_anomaly') and result.is_anomaly and
-                    hasattr(result, 'composite_score') and result.composite_score is not None):
-                    score = result.composite_score
-                    # Find which bin this falls into
-                    for i, (bin_start, bin_end) in enumerate(zip(bins[:-1], bins[1:])):
-                        if bin_start <= score < bin_end:
-                            patches[i].set_facecolor('#E63946')
-                            break
+            # Color bins containing anomalies differently; the last bin is
+            # closed on the right, so the maximum score maps to it as well
+            if anomalies.any():
+                bin_indices = np.clip(
+                    np.digitize(scores[anomalies], bins) - 1, 0, len(patches) - 1
+                )
+                for i in np.unique(bin_indices):
+                    patches[i].set_facecolor('#E63946')
 
             # Add mean line
-            mean_score = sum(scores) / len(scores)
+            mean_score = scores.mean()
             ax.axvline(x=mean_score, color='#06A77D', linestyle='--',
                       linewidth=2, label=f'Mean: {mean_score:.1f}')
 
@@ -345,18 +506,10 @@ class TrendChartGenerator:
             ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.5, axis='y')
             ax.legend(loc='best', framealpha=0.9)
 
-            # Tight layout
-            plt.tight_layout()
-
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-            plt.close(fig)
+            image = self._render(fig, output, path)
 
             logger.debug(f"Generated histogram: {len(scores)} scores")
-            return image_base64
+            return image
 
         except Exception as e:
             logger.error(f"Failed to generate histogram: {e}")
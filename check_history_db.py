@@ -1,6 +1,7 @@
 """
 Check if history database exists and show its location.
 """
+import os
 import sys
 from pathlib import Path
 
@@ -8,8 +9,53 @@ print("=" * 70)
 print("History Database Checker")
 print("=" * 70)
 
-# Search for all comparison_history.db files
-print("\nSearching for history databases...")
+DB_NAME = "comparison_history.db"
+HISTORY_DIR_NAME = ".imgcomp_history"
+
+# Directory names whose trees never hold a history database
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "site-packages"}
+
+
+def _walk(root, maxdepth=6, skip=SKIP_DIRS, seen=None):
+    """Yield database files and history directories under root.
+
+    One os.scandir pass finds both, descending at most maxdepth levels
+    without following symlinks. Directories in skip are not entered.
+    seen (shared between calls) maps each scanned directory's real path to
+    the shallowest depth it was scanned at: a directory is only scanned
+    again when reached at a shallower depth, where more of its subtree is
+    within maxdepth, and its own entries are not reported twice.
+    """
+    if seen is None:
+        seen = {}
+    stack = [(str(root), 0)]
+    while stack:
+        path, depth = stack.pop()
+        real = os.path.realpath(path)
+        previous = seen.get(real)
+        if previous is not None and previous <= depth:
+            continue
+        seen[real] = depth
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name == HISTORY_DIR_NAME and previous is None:
+                                yield Path(entry.path)
+                            if depth < maxdepth and entry.name not in skip:
+                                stack.append((entry.path, depth + 1))
+                        elif entry.name == DB_NAME and previous is None:
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Skip directories we can't read (permissions, vanished, ...)
+            continue
+
+
+# Search for comparison_history.db files and .imgcomp_history directories
+print("\nSearching for history databases and .imgcomp_history directories...")
 
 # Search common locations
 search_paths = [
@@ -19,37 +65,31 @@ search_paths = [
 ]
 
 found_databases = []
-
-for search_path in search_paths:
-    try:
-        # Search recursively for comparison_history.db
-        for db_file in search_path.rglob("comparison_history.db"):
-            found_databases.append(db_file)
-            print(f"  Found: {db_file}")
-    except PermissionError:
-        # Skip directories we don't have permission to read
-        pass
-
-# Also search for .imgcomp_history directories
-print("\nSearching for .imgcomp_history directories...")
 found_dirs = []
+seen_dirs = {}
 
 for search_path in search_paths:
-    try:
-        for history_dir in search_path.rglob(".imgcomp_history"):
-            if history_dir.is_dir():
-                found_dirs.append(history_dir)
-                print(f"  Found: {history_dir}")
-
-                # Check if it has a database file
-                db_file = history_dir / "comparison_history.db"
-                if db_file.exists():
-                    print(f"    ✓ Database exists: {db_file}")
-                    print(f"    Size: {db_file.stat().st_size} bytes")
-                else:
-                    print(f"    ✗ No database file found")
-    except PermissionError:
-        pass
+    for found in _walk(search_path, seen=seen_dirs):
+        if found.name == DB_NAME:
+            found_databases.append(found)
+        else:
+            found_dirs.append(found)
+
+print("\nHistory databases:")
+for db_file in found_databases:
+    print(f"  Found: {db_file}")
+
+print("\n.imgcomp_history directories:")
+for history_dir in found_dirs:
+    print(f"  Found: {history_dir}")
+
+    # Check if it has a database file
+    db_file = history_dir / DB_NAME
+    if db_file.exists():
+        print(f"    ✓ Database exists: {db_file}")
+        print(f"    Size: {db_file.stat().st_size} bytes")
+    else:
+        print(f"    ✗ No database file found")
 
 print("\n" + "=" * 70)
 print("Summary:")
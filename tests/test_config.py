@@ -261,6 +261,21 @@ class TestConfig:
         assert "must be one of flip_colormaps" in str(exc_info.value)
         logger.info("✓ Config default colormap validation test passed")
 
+    def test_config_invalid_chart_policy_raises_error(self, temp_image_dir):
+        """Config should reject unknown trend chart policies."""
+        logger.debug("Testing Config with invalid chart policy")
+
+        with pytest.raises(ValueError) as exc_info:
+            Config(
+                base_dir=temp_image_dir,
+                new_dir="new",
+                known_good_dir="known_good",
+                chart_generation_policy="some",
+            )
+
+        assert "chart_generation_policy" in str(exc_info.value)
+        logger.info("✓ Config chart policy validation test passed")
+
     def test_config_flip_validation_skipped_when_disabled(self, temp_image_dir):
         """Config should skip FLIP validation when FLIP is disabled."""
         logger.debug("Testing Config skips FLIP validation when disabled")
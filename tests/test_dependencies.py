@@ -2,6 +2,7 @@
 Unit tests for dependencies module.
 """
 
+import logging
 import pytest
 from dependencies import DependencyChecker, Dependency
 
@@ -79,6 +80,15 @@ class TestDependencyChecker:
             assert "dependency" in result_data
             assert isinstance(result_data["installed"], bool)
 
+    def test_check_all_reports_optional_dependencies(self, caplog):
+        """check_all should list optional packages without requiring them."""
+        with caplog.at_level(logging.INFO):
+            all_satisfied, results = DependencyChecker.check_all(verbose=True)
+
+        for dep in DependencyChecker.OPTIONAL_DEPENDENCIES:
+            assert dep.package_name in caplog.text
+            assert dep.package_name not in results
+
     def test_critical_dependencies_installed(self):
         """Critical dependencies should be installed."""
         critical_packages = ["numpy", "PIL", "cv2", "skimage"]
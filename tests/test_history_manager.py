@@ -307,6 +307,70 @@ class TestQueryResults:
         assert len(history) == 1
         assert history[0]["subdirectory"] == "renders/scene1"
 
+    def test_get_history_for_images_batch(self, temp_history_manager):
+        """Test batch history lookup matches per-image queries."""
+        results = [
+            create_mock_result("image.png", 10.0, "renders/scene1"),
+            create_mock_result("image.png", 20.0, "renders/scene2"),
+            create_mock_result("other.png", 5.0),
+        ]
+        builds = [f"build-{1100 + i}" for i in range(5)]
+        for build in builds:
+            config = MockConfig(base_dir=Path("/test/base"), build_number=build)
+            temp_history_manager.save_run(results, config)
+
+        keys = [
+            ("image.png", "renders/scene1"),
+            ("image.png", None),
+            ("other.png", None),
+            ("missing.png", None),
+        ]
+        history = temp_history_manager.get_history_for_images(keys, limit=10)
+
+        assert set(history) == set(keys)
+        for filename, subdirectory in keys:
+            expected = temp_history_manager.get_history_for_image(
+                filename, subdirectory=subdirectory, limit=10
+            )
+            batch = history[(filename, subdirectory)]
+            assert [h["result_id"] for h in batch] == [
+                h["result_id"] for h in expected
+            ]
+
+        assert len(history[("image.png", "renders/scene1")]) == 5
+        assert len(history[("image.png", None)]) == 10
+        assert len(history[("other.png", None)]) == 5
+        assert history[("missing.png", None)] == []
+
+        # Limit applies per image in SQL, keeping the newest entries
+        returned_rows = []
+        execute_query = temp_history_manager.db.execute_query
+
+        def counting_execute_query(query, params=None):
+            rows = execute_query(query, params)
+            returned_rows.extend(rows)
+            return rows
+
+        temp_history_manager.db.execute_query = counting_execute_query
+        limited = temp_history_manager.get_history_for_images(
+            [("image.png", "renders/scene1"), ("other.png", None)], limit=2
+        )
+
+        scene1 = limited[("image.png", "renders/scene1")]
+        assert [h["build_number"] for h in scene1] == ["build-1104", "build-1103"]
+        assert all(h["subdirectory"] == "renders/scene1" for h in scene1)
+        assert [h["build_number"] for h in limited[("other.png", None)]] == [
+            "build-1104",
+            "build-1103",
+        ]
+        # At most two rows per (filename, subdirectory), however many runs
+        # are stored: image.png in two subdirectories plus other.png
+        assert len(returned_rows) == 6
+
+    def test_get_history_for_images_empty(self, temp_history_manager):
+        """Test batch history lookup with no images."""
+        assert temp_history_manager.get_history_for_images([]) == {}
+
 
 class TestDeleteRun:
     """Test deleting runs."""
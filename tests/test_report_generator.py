@@ -2,11 +2,14 @@
 Unit tests for ReportGenerator class.
 """
 
+import base64
+import gzip
 import pytest
 import logging
 from pathlib import Path
 from PIL import Image
 import numpy as np
+from unittest.mock import MagicMock, patch
 from report_generator import ReportGenerator
 from config import Config
 from models import ComparisonResult
@@ -151,6 +154,17 @@ class TestReportGenerator:
         assert ".." in rel_path or "diffs" in rel_path
         assert rel_path.replace("\\", "/").endswith("test.png")
 
+        # Cached parent directories give the same answer as os.path.relpath
+        import os
+
+        for path in (
+            valid_config.diff_path / "other.png",
+            valid_config.new_path / "ui" / "a.png",
+            valid_config.html_path / "inline.png",
+        ):
+            expected = os.path.relpath(path, valid_config.html_path).replace("\\", "/")
+            assert generator._get_relative_path(path) == expected
+
         logger.info("✓ Relative path calculation test passed")
 
     def test_format_metrics(self, valid_config):
@@ -209,6 +223,15 @@ class TestReportGenerator:
         assert generator._format_value(100) == "100"
         assert generator._format_value("test") == "test"
         assert generator._format_value((1, 2, 3)) == "(1, 2, 3)"
+        assert generator._format_value(True) == "True"
+
+        # numpy and other float subclasses format like floats
+        assert generator._format_value(np.float64(0.123456)) == "0.1235"
+
+        class Ratio(float):
+            pass
+
+        assert generator._format_value(Ratio(2.5)) == "2.5000"
 
         logger.info("✓ Value formatting test passed")
 
@@ -223,6 +246,18 @@ class TestReportGenerator:
         assert generator._get_status_class(2.5) == "status-moderate"
         assert generator._get_status_class(10.0) == "status-major"
 
+        # Thresholds are exclusive upper bounds
+        assert generator._get_status_class(0.1) == "status-minor"
+        assert generator._get_status_class(1.0) == "status-moderate"
+        assert generator._get_status_class(5.0) == "status-major"
+
+        # Batch classification matches the per-value lookup
+        values = [0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0]
+        results = [MagicMock(percent_different=v) for v in values]
+        assert generator._get_status_classes(results) == [
+            generator._get_status_class(v) for v in values
+        ]
+
         logger.info("✓ Status class test passed")
 
     def test_get_status_text(self, valid_config):
@@ -263,6 +298,271 @@ class TestReportGenerator:
 
         logger.info("✓ HTML template test passed")
 
+    def test_fill_template_single_pass(self):
+        """_fill_template should substitute all placeholders in one pass."""
+        logger.debug("Testing pre-split template filling")
+
+        from report_generator import _fill_template, _split_template
+
+        parts = _split_template("<h1>{{TITLE}}</h1><p>{{BODY}}</p>{{UNKNOWN}}")
+        html = _fill_template(parts, {"TITLE": "A", "BODY": "{{TITLE}}"})
+
+        # Values are not re-scanned and unknown placeholders are kept
+        assert html == "<h1>A</h1><p>{{TITLE}}</p>{{UNKNOWN}}"
+
+        # The template parts themselves are left untouched for reuse
+        assert parts[1::2] == ["TITLE", "BODY", "UNKNOWN"]
+
+        logger.info("✓ Template filling test passed")
+
+    def test_stylesheets_written_as_shared_assets(self, valid_config):
+        """Static CSS should be minified and written once as external files."""
+        logger.debug("Testing shared stylesheet assets")
+
+        from report_generator import _minify_css
+
+        assert _minify_css("a { color: red; } /* note */ b > i { margin: 0 auto; }") == (
+            "a{color:red}b>i{margin:0 auto}"
+        )
+
+        generator = ReportGenerator(valid_config)
+        assert "<style>" not in generator._get_html_template()
+        assert '<link rel="stylesheet" href="styles.css">' in generator._get_html_template()
+        assert "<style>" not in generator._get_summary_template()
+        assert (
+            '<link rel="stylesheet" href="summary_styles.css">'
+            in generator._get_summary_template()
+        )
+
+        generator._write_assets()
+        for name in ("styles.css", "subdir_styles.css", "summary_styles.css"):
+            css = (valid_config.html_path / name).read_text(encoding="utf-8")
+            assert "/*" not in css
+            assert "\n" not in css
+
+        logger.info("✓ Stylesheet assets test passed")
+
+    def test_subdir_page_name(self):
+        """_subdir_page_name should map subdirectories to index page names."""
+        from report_generator import _subdir_page_name
+
+        assert _subdir_page_name("") == "subdir_root.html"
+        assert _subdir_page_name("ui/buttons") == "subdir_ui_buttons.html"
+        assert _subdir_page_name("ui\\icons") == "subdir_ui_icons.html"
+
+    def test_generate_config_section(self, valid_config):
+        """_generate_config_section should list settings and optional rows."""
+        logger.debug("Testing run configuration section")
+
+        valid_config.enable_parallel = True
+        valid_config.max_workers = 4
+        valid_config.build_number = "build-<1>"
+
+        generator = ReportGenerator(valid_config)
+        section = generator._generate_config_section()
+
+        assert "Run Configuration" in section
+        assert "<dt>Max Workers</dt><dd>4</dd>" in section
+        assert "build-&lt;1&gt;" in section
+        assert "FLIP Pixels Per Degree" not in section  # FLIP disabled by default
+
+        logger.info("✓ Config section test passed")
+
+    def test_generate_historical_section(self, valid_config):
+        """_generate_historical_section should render historical statistics."""
+        logger.debug("Testing historical section generation")
+
+        result = ComparisonResult(
+            filename="test.png",
+            new_image_path=Path("/new.png"),
+            known_good_path=Path("/known.png"),
+            diff_image_path=Path("/diff.png"),
+            annotated_image_path=Path("/annotated.png"),
+            metrics={},
+            percent_different=1.0,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+
+        # No composite score means no history section
+        assert generator._generate_historical_section(result) == ""
+
+        result.composite_score = 42.0
+        result.historical_mean = 40.0
+        result.historical_std_dev = 0.5
+        result.std_dev_from_mean = 4.0
+        result.is_anomaly = True
+
+        section = generator._generate_historical_section(result)
+        assert "42.00/100" in section
+        assert "ANOMALY" in section
+        assert "<dt>Historical Mean</dt><dd>40.00</dd>" in section
+        assert "<dt>Standard Deviation</dt><dd>0.50</dd>" in section
+        assert '<dd class="deviation-high">4.00σ</dd>' in section
+        assert "<strong>SSIM (Structural Similarity):</strong> 25% weight" in section
+
+        result.std_dev_from_mean = -1.5
+        result.is_anomaly = False
+        section = generator._generate_historical_section(result)
+        assert '<dd class="deviation-normal">-1.50σ</dd>' in section
+        assert "ANOMALY" not in section
+
+        # Optional statistics are omitted when missing
+        result.historical_std_dev = None
+        result.std_dev_from_mean = None
+        section = generator._generate_historical_section(result)
+        assert "Standard Deviation" not in section
+        assert "Deviation from Mean" not in section
+
+        logger.info("✓ Historical section test passed")
+
+    def test_trend_chart_cache(self, valid_config):
+        """_get_trend_chart should reuse charts from a bounded memory cache."""
+        logger.debug("Testing trend chart caching")
+
+        data = [
+            {"timestamp": "2025-01-01T10:00:00", "composite_score": 10.0},
+            {"timestamp": "2025-01-02T10:00:00", "composite_score": 12.0},
+        ]
+
+        generator = ReportGenerator(valid_config)
+        generator.chart_generator = MagicMock()
+        generator.chart_generator.generate_trend_chart.return_value = "Q0hBUlQ="
+
+        assert generator._get_trend_chart("test.png", data) == "Q0hBUlQ="
+        assert generator._get_trend_chart("test.png", data) == "Q0hBUlQ="
+        assert generator.chart_generator.generate_trend_chart.call_count == 1
+
+        # Different data must not hit the cache
+        changed = data + [
+            {"timestamp": "2025-01-03T10:00:00", "composite_score": 14.0}
+        ]
+        generator.chart_generator.generate_trend_chart.return_value = "TkVX"
+        assert generator._get_trend_chart("test.png", changed) == "TkVX"
+
+        # The cache is bounded; the least recently used chart is evicted
+        generator.CHART_CACHE_SIZE = 2
+        generator._get_trend_chart("other.png", data)
+        assert len(generator._chart_cache) == 2
+        calls = generator.chart_generator.generate_trend_chart.call_count
+        generator._get_trend_chart("test.png", data)
+        assert generator.chart_generator.generate_trend_chart.call_count == calls + 1
+
+        logger.info("✓ Trend chart cache test passed")
+
+    def test_reset_assets_rewrites_assets(self, valid_config):
+        """reset_assets() should make the next _write_assets() write again."""
+        logger.debug("Testing ReportGenerator.reset_assets")
+
+        generator = ReportGenerator(valid_config)
+        generator._write_assets()
+        styles = valid_config.html_path / "styles.css"
+        styles.unlink()
+
+        generator._write_assets()
+        assert not styles.exists()
+
+        generator.reset_assets()
+        generator._write_assets()
+        assert styles.exists()
+
+        logger.info("✓ Report asset reset test passed")
+
+    def test_close_releases_chart_figure(self, valid_config):
+        """close() should release the chart generator's figure."""
+        logger.debug("Testing ReportGenerator.close")
+
+        generator = ReportGenerator(valid_config)
+        generator.chart_generator = MagicMock()
+        generator.close()
+        generator.chart_generator.close.assert_called_once_with()
+
+        logger.info("✓ Report generator close test passed")
+
+    def test_precompute_charts(self, valid_config):
+        """_precompute_charts should render charts before page assembly."""
+        logger.debug("Testing trend chart precomputation")
+
+        records = [
+            {"timestamp": "2025-01-01T10:00:00", "composite_score": 10.0},
+            {"timestamp": "2025-01-02T10:00:00", "composite_score": None},
+            {"timestamp": "2025-01-03T10:00:00", "composite_score": 12.0},
+        ]
+        results = []
+        for i in range(3):
+            result = ComparisonResult(
+                filename=f"test{i}.png",
+                new_image_path=valid_config.new_path / f"test{i}.png",
+                known_good_path=Path("/known.png"),
+                diff_image_path=Path("/diff.png"),
+                annotated_image_path=Path("/annotated.png"),
+                metrics={},
+                percent_different=1.0,
+                histogram_data="",
+            )
+            result.composite_score = 15.0
+            results.append(result)
+        results[2].composite_score = None  # no history section, no chart
+
+        history = {(r.filename, None): records for r in results}
+
+        generator = ReportGenerator(valid_config)
+        generator.chart_generator = MagicMock()
+        generator.chart_generator.generate_trend_chart.return_value = "Q0hBUlQ="
+
+        generator._precompute_charts(results, history)
+        assert generator.chart_generator.generate_trend_chart.call_count == 2
+
+        # Page assembly is now a cache hit
+        section = generator._generate_historical_section(
+            results[0], historical_data=generator._to_trend_data(records)
+        )
+        assert "data:image/png;base64,Q0hBUlQ=" in section
+        assert generator.chart_generator.generate_trend_chart.call_count == 2
+
+        logger.info("✓ Trend chart precompute test passed")
+
+    def test_chart_policy_interesting(self, valid_config):
+        """Only anomalies and high scores get charts under the 'interesting' policy."""
+        logger.debug("Testing trend chart generation policy")
+
+        valid_config.chart_generation_policy = "interesting"
+        valid_config.chart_score_threshold = 50.0
+        data = [
+            {"timestamp": "2025-01-01T10:00:00", "composite_score": 10.0},
+            {"timestamp": "2025-01-02T10:00:00", "composite_score": 12.0},
+        ]
+        result = ComparisonResult(
+            filename="test.png",
+            new_image_path=Path("/new.png"),
+            known_good_path=Path("/known.png"),
+            diff_image_path=Path("/diff.png"),
+            annotated_image_path=Path("/annotated.png"),
+            metrics={},
+            percent_different=1.0,
+            histogram_data="",
+        )
+        result.composite_score = 12.0
+
+        generator = ReportGenerator(valid_config)
+        generator.chart_generator = MagicMock()
+        generator.chart_generator.generate_trend_chart.return_value = "Q0hBUlQ="
+
+        section = generator._generate_historical_section(result, historical_data=data)
+        assert "trend-chart" not in section
+        generator.chart_generator.generate_trend_chart.assert_not_called()
+
+        result.is_anomaly = True
+        section = generator._generate_historical_section(result, historical_data=data)
+        assert "trend-chart" in section
+
+        result.is_anomaly = False
+        result.composite_score = 75.0
+        assert generator._wants_chart(result)
+
+        logger.info("✓ Chart policy test passed")
+
     def test_summary_template_has_placeholders(self, valid_config):
         """_get_summary_template should return valid template."""
         logger.debug("Testing summary template")
@@ -275,6 +575,11 @@ class TestReportGenerator:
         assert "<!DOCTYPE html>" in template
         assert "Image Comparison Summary" in template
 
+        # Templates are built once at import and shared by every generator
+        other = ReportGenerator(valid_config)
+        assert other._get_summary_template() is template
+        assert other._get_html_template() is generator._get_html_template()
+
         logger.info("✓ Summary template test passed")
 
     def test_navigation_links_in_detail_report(self, valid_config, simple_test_image):
@@ -325,6 +630,43 @@ class TestReportGenerator:
 
         logger.info("✓ Navigation links test passed")
 
+    def test_reports_do_not_call_template_getters(self, valid_config, simple_test_image):
+        """Rendering should read the module-level templates, not the shim methods."""
+        logger.debug("Testing template getters are off the render path")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        new_path = valid_config.new_path / "test.png"
+        known_path = valid_config.known_good_path / "test.png"
+        simple_test_image.save(new_path)
+        simple_test_image.save(known_path)
+
+        result = ComparisonResult(
+            filename="test.png",
+            new_image_path=new_path,
+            known_good_path=known_path,
+            diff_image_path=valid_config.diff_path / "diff_test.png",
+            annotated_image_path=valid_config.diff_path / "annotated_test.png",
+            metrics={"Pixel Difference": {"percent_different": 1.0}},
+            percent_different=1.0,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        with patch.object(
+            ReportGenerator, "_get_html_template", side_effect=AssertionError
+        ), patch.object(
+            ReportGenerator, "_get_summary_template", side_effect=AssertionError
+        ):
+            generator.generate_detail_report(result, [result])
+            generator.generate_summary_report([result])
+
+        assert (valid_config.html_path / "test.png.html").exists()
+        assert (valid_config.html_path / "summary.html").exists()
+
+        logger.info("✓ Template getter test passed")
+
     def test_detail_report_without_navigation(self, valid_config, simple_test_image):
         """Detail report with single result should not have nav links."""
         logger.debug("Testing detail report without navigation")
@@ -424,6 +766,78 @@ class TestReportGenerator:
 
         logger.info("✓ Report with missing histogram data test passed")
 
+    def test_detail_report_rerendered_when_inputs_older(
+        self, valid_config, simple_test_image
+    ):
+        """Existing pages newer than their images are still re-rendered."""
+        logger.debug("Testing detail report regeneration")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        new_path = valid_config.new_path / "rerender.png"
+        simple_test_image.save(new_path)
+
+        result = ComparisonResult(
+            filename="rerender.png",
+            new_image_path=new_path,
+            known_good_path=new_path,
+            diff_image_path=new_path,
+            annotated_image_path=new_path,
+            metrics={"Pixel Difference": {"percent_different": 1.0}},
+            percent_different=1.0,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_detail_report(result)
+
+        # Page content also depends on metrics, history and config, so an
+        # up-to-date mtime must not short-circuit rendering
+        result.metrics = {"Pixel Difference": {"percent_different": 7.25}}
+        generator.generate_detail_report(result)
+
+        content = (valid_config.html_path / "rerender.png.html").read_text(
+            encoding="utf-8"
+        )
+        assert "7.2500" in content
+
+        logger.info("✓ Detail report regeneration test passed")
+
+    def test_histogram_written_as_sibling_png(self, valid_config, simple_test_image):
+        """Decodable histograms should be linked as a PNG file, not inlined."""
+        logger.debug("Testing histogram PNG file output")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        new_path = valid_config.new_path / "hist.png"
+        simple_test_image.save(new_path)
+        png_bytes = b"\x89PNG\r\n\x1a\nfake"
+
+        result = ComparisonResult(
+            filename="hist.png",
+            new_image_path=new_path,
+            known_good_path=new_path,
+            diff_image_path=new_path,
+            annotated_image_path=new_path,
+            metrics={},
+            percent_different=1.0,
+            histogram_data=base64.b64encode(png_bytes).decode("ascii"),
+        )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_detail_report(result)
+
+        hist_path = valid_config.html_path / "hist.png_hist.png"
+        assert hist_path.read_bytes() == png_bytes
+
+        content = (valid_config.html_path / "hist.png.html").read_text(encoding="utf-8")
+        assert 'src="hist.png_hist.png"' in content
+        assert "data:image/png;base64" not in content
+
+        logger.info("✓ Histogram PNG file test passed")
+
     def test_group_by_subdirectory(self, valid_config, simple_test_image):
         """_group_by_subdirectory should group results correctly."""
         logger.debug("Testing subdirectory grouping")
@@ -481,6 +895,91 @@ class TestReportGenerator:
 
         logger.info("✓ Subdirectory grouping test passed")
 
+    def test_get_subdirectory_is_memoized(self, valid_config):
+        """_get_subdirectory should compute each result's subdirectory once."""
+        logger.debug("Testing subdirectory memoization")
+
+        result = ComparisonResult(
+            filename="ui0.png",
+            new_image_path=valid_config.new_path / "ui" / "ui0.png",
+            known_good_path=Path("/known.png"),
+            diff_image_path=Path("/diff.png"),
+            annotated_image_path=Path("/annotated.png"),
+            metrics={},
+            percent_different=0.0,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        with patch.object(
+            ComparisonResult, "get_subdirectory", autospec=True, return_value="ui"
+        ) as mock_get:
+            assert generator._get_subdirectory(result) == "ui"
+            assert generator._get_subdirectory(result) == "ui"
+            generator._group_by_subdirectory([result])
+        assert mock_get.call_count == 1
+
+        # The cache must not leak into serialized output
+        assert "_subdirectory_cache" not in result.to_dict()
+
+        # Results in the same subdirectory share one interned string
+        others = [
+            ComparisonResult(
+                filename=f"deep{i}.png",
+                new_image_path=valid_config.new_path / "ui" / "deep" / f"deep{i}.png",
+                known_good_path=Path("/known.png"),
+                diff_image_path=Path("/diff.png"),
+                annotated_image_path=Path("/annotated.png"),
+                metrics={},
+                percent_different=0.0,
+                histogram_data="",
+            )
+            for i in range(2)
+        ]
+        first, second = (generator._get_subdirectory(r) for r in others)
+        assert first == "ui/deep"
+        assert first is second
+
+        logger.info("✓ Subdirectory memoization test passed")
+
+    def test_summarize_results(self):
+        """_summarize_results should compute group statistics in one pass."""
+        logger.debug("Testing per-subdirectory summary statistics")
+
+        results = []
+        for i, (diff, score, anomaly) in enumerate(
+            [(1.0, 80.0, False), (3.0, None, True), (2.0, 60.0, True)]
+        ):
+            result = ComparisonResult(
+                filename=f"img{i}.png",
+                new_image_path=Path("/new.png"),
+                known_good_path=Path("/known.png"),
+                diff_image_path=Path("/diff.png"),
+                annotated_image_path=Path("/annotated.png"),
+                metrics={},
+                percent_different=diff,
+                histogram_data="",
+            )
+            result.composite_score = score
+            result.is_anomaly = anomaly
+            results.append(result)
+
+        count, avg_diff, max_diff, avg_composite, anomalies = (
+            ReportGenerator._summarize_results(results)
+        )
+        assert count == 3
+        assert avg_diff == pytest.approx(2.0)
+        assert max_diff == 3.0
+        assert avg_composite == pytest.approx(70.0)
+        assert anomalies == 2
+
+        # No composite scores at all yields None
+        for r in results:
+            r.composite_score = None
+        assert ReportGenerator._summarize_results(results)[3] is None
+
+        logger.info("✓ Summary statistics test passed")
+
     def test_generate_subdirectory_index(self, valid_config, simple_test_image):
         """generate_subdirectory_index should create subdirectory index page."""
         logger.debug("Testing subdirectory index generation")
@@ -532,6 +1031,7 @@ class TestReportGenerator:
         assert "test1.png" in content
         assert "thumbnail-row" in content  # CSS class for thumbnails
         assert "summary.html" in content  # Breadcrumb link to summary
+        assert "{{" not in content  # All placeholders filled
 
         logger.info("✓ Subdirectory index generation test passed")
 
@@ -640,9 +1140,88 @@ class TestReportGenerator:
         assert "Images" in content  # Column header
         assert "subdir_root.html" in content  # Link to root index
         assert "subdir_ui.html" in content  # Link to ui index
+        assert "{{" not in content  # All placeholders filled
 
         logger.info("✓ Summary report with subdirectories test passed")
 
+    def test_summary_report_gzip(self, valid_config):
+        """Reports should be written gzip-compressed when gzip_reports is set."""
+        logger.debug("Testing gzip-compressed report output")
+
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+        valid_config.gzip_reports = True
+
+        result = ComparisonResult(
+            filename="test.png",
+            new_image_path=valid_config.new_path / "test.png",
+            known_good_path=valid_config.known_good_path / "test.png",
+            diff_image_path=valid_config.diff_path / "diff_test.png",
+            annotated_image_path=valid_config.diff_path / "annotated_test.png",
+            metrics={},
+            percent_different=1.0,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_summary_report([result])
+
+        output_path = valid_config.html_path / "summary.html.gz"
+        assert output_path.exists()
+        assert not (valid_config.html_path / "summary.html").exists()
+        content = gzip.decompress(output_path.read_bytes()).decode("utf-8")
+        assert "Image Comparison Summary" in content
+
+        logger.info("✓ Gzip report output test passed")
+
+    def test_summary_report_not_truncated_on_row_error(self, valid_config):
+        """A failing summary row should not leave a partial summary.html."""
+        logger.debug("Testing summary report row failure")
+
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+        generator = ReportGenerator(valid_config)
+
+        def failing_rows(grouped):
+            yield "<tr><td>ok</td></tr>"
+            raise RuntimeError("row failed")
+
+        with patch.object(generator, "_iter_summary_rows", side_effect=failing_rows):
+            generator.generate_summary_report([])
+
+        assert not (valid_config.html_path / "summary.html").exists()
+
+        logger.info("✓ Summary row failure test passed")
+
+    def test_detail_report_gzip(self, valid_config, simple_test_image):
+        """Detail pages should be written as .html.gz when gzip_reports is set."""
+        logger.debug("Testing gzip detail report output")
+
+        valid_config.gzip_reports = True
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+        new_path = valid_config.new_path / "test.png"
+        simple_test_image.save(new_path)
+
+        result = ComparisonResult(
+            filename="test.png",
+            new_image_path=new_path,
+            known_good_path=new_path,
+            diff_image_path=new_path,
+            annotated_image_path=new_path,
+            metrics={},
+            percent_different=1.5,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_detail_report(result)
+
+        output_path = valid_config.html_path / "test.png.html.gz"
+        assert output_path.exists()
+        assert not (valid_config.html_path / "test.png.html").exists()
+        content = gzip.decompress(output_path.read_bytes()).decode("utf-8")
+        assert "Comparison: test.png" in content
+
+        logger.info("✓ Gzip detail report output test passed")
+
     def test_detail_report_has_breadcrumb(self, valid_config, simple_test_image):
         """Detail report should include breadcrumb navigation."""
         logger.debug("Testing detail report breadcrumb")
@@ -690,6 +1269,7 @@ class TestReportGenerator:
         assert "test.png" in content
         assert "subdir_ui.html" in content  # Link back to subdirectory
         assert "Back to Directory" in content
+        assert "{{" not in content  # All placeholders filled
 
         logger.info("✓ Detail report breadcrumb test passed")
 
@@ -754,6 +1334,174 @@ class TestReportGenerator:
 
         logger.info("✓ Detail report image navigation test passed")
 
+    def test_dynamic_values_are_html_escaped(self, valid_config, simple_test_image):
+        """Filenames containing markup characters should be escaped in reports."""
+        logger.debug("Testing HTML escaping of dynamic values")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        new_path = valid_config.new_path / "test.png"
+        known_path = valid_config.known_good_path / "test.png"
+        diff_path = valid_config.diff_path / "diff_test.png"
+        annotated_path = valid_config.diff_path / "annotated_test.png"
+
+        simple_test_image.save(new_path)
+        simple_test_image.save(known_path)
+        simple_test_image.save(diff_path)
+        simple_test_image.save(annotated_path)
+
+        result = ComparisonResult(
+            filename="<b>a&b</b>.png",
+            new_image_path=new_path,
+            known_good_path=known_path,
+            diff_image_path=diff_path,
+            annotated_image_path=annotated_path,
+            metrics={},
+            percent_different=1.5,
+            histogram_data="",
+        )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_subdirectory_index("", [result])
+
+        content = (valid_config.html_path / "subdir_root.html").read_text(
+            encoding="utf-8"
+        )
+        assert "&lt;b&gt;a&amp;b&lt;/b&gt;.png" in content
+        assert "<b>a&b</b>" not in content
+
+        logger.info("✓ HTML escaping test passed")
+
+    def test_generate_all_detail_reports_logs_once(
+        self, valid_config, simple_test_image, caplog
+    ):
+        """Per-page progress should be debug-only with one info summary."""
+        logger.debug("Testing detail report progress logging")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        results = []
+        for i in range(3):
+            new_path = valid_config.new_path / f"test{i}.png"
+            simple_test_image.save(new_path)
+            results.append(
+                ComparisonResult(
+                    filename=f"test{i}.png",
+                    new_image_path=new_path,
+                    known_good_path=new_path,
+                    diff_image_path=new_path,
+                    annotated_image_path=new_path,
+                    metrics={},
+                    percent_different=float(i),
+                    histogram_data="",
+                )
+            )
+
+        generator = ReportGenerator(valid_config)
+        with caplog.at_level(logging.INFO, logger="ImageComparison"):
+            generator.generate_all_detail_reports(results)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert not any(m.startswith("Generated report:") for m in messages)
+        assert "Finished 3 detail reports in 1 directories" in messages
+
+        logger.info("✓ Detail report progress logging test passed")
+
+    def test_generate_all_detail_reports_batches_history(
+        self, valid_config, simple_test_image
+    ):
+        """generate_all_detail_reports should query history once for all images."""
+        logger.debug("Testing batched history lookup for detail reports")
+
+        valid_config.diff_path.mkdir(parents=True, exist_ok=True)
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+
+        results = []
+        for i in range(3):
+            new_path = valid_config.new_path / f"test{i}.png"
+            simple_test_image.save(new_path)
+            result = ComparisonResult(
+                filename=f"test{i}.png",
+                new_image_path=new_path,
+                known_good_path=new_path,
+                diff_image_path=new_path,
+                annotated_image_path=new_path,
+                metrics={},
+                percent_different=float(i),
+                histogram_data="",
+            )
+            result.composite_score = 10.0 * i
+            results.append(result)
+
+        history_manager = MagicMock()
+        history_manager.get_history_for_images.return_value = {
+            (r.filename, None): [] for r in results
+        }
+
+        generator = ReportGenerator(valid_config, history_manager=history_manager)
+        generator.generate_all_detail_reports(results)
+
+        history_manager.get_history_for_images.assert_called_once()
+        history_manager.get_history_for_image.assert_not_called()
+        keys = history_manager.get_history_for_images.call_args[0][0]
+        assert sorted(keys) == [(r.filename, None) for r in results]
+
+        for r in results:
+            assert (valid_config.html_path / f"{r.filename}.html").exists()
+
+        logger.info("✓ Batched history lookup test passed")
+
+    def test_generate_all_detail_reports_parallel(self, valid_config, simple_test_image):
+        """generate_all_detail_reports should render pages in worker processes."""
+        logger.debug("Testing parallel detail report generation")
+
+        valid_config.html_path.mkdir(parents=True, exist_ok=True)
+        valid_config.enable_parallel = True
+        valid_config.max_workers = 2
+
+        results = []
+        for i in range(6):
+            new_path = valid_config.new_path / f"test{i}.png"
+            simple_test_image.save(new_path)
+            results.append(
+                ComparisonResult(
+                    filename=f"test{i}.png",
+                    new_image_path=new_path,
+                    known_good_path=new_path,
+                    diff_image_path=new_path,
+                    annotated_image_path=new_path,
+                    metrics={},
+                    percent_different=float(i),
+                    histogram_data="",
+                )
+            )
+
+        generator = ReportGenerator(valid_config)
+        generator.generate_all_detail_reports(results)
+
+        assert (valid_config.html_path / "styles.css").exists()
+        for r in results:
+            content = (valid_config.html_path / f"{r.filename}.html").read_text(
+                encoding="utf-8"
+            )
+            assert r.filename in content
+
+        # Navigation still spans the whole subdirectory across chunk borders
+        # (results are sorted by percent_different, descending)
+        for name, prev_name, next_name in (
+            ("test3.png", "test4.png", "test2.png"),
+            ("test2.png", "test3.png", "test1.png"),
+        ):
+            content = (valid_config.html_path / f"{name}.html").read_text(
+                encoding="utf-8"
+            )
+            assert f"{prev_name}.html" in content
+            assert f"{next_name}.html" in content
+
+        logger.info("✓ Parallel detail report test passed")
+
 
 @pytest.mark.unit
 class TestFLIPReportGeneration:
@@ -870,6 +1618,13 @@ class TestFLIPReportGeneration:
         # Verify default colormap is active
         assert 'class="tab-button active"' in flip_section or "active" in flip_section
 
+        # Tab script is shared via flip.js rather than inlined per page
+        assert '<script src="flip.js"></script>' in flip_section
+        assert "function showFlipTab" not in flip_section
+        flip_js = valid_config.html_path / "flip.js"
+        assert flip_js.exists()
+        assert "function showFlipTab" in flip_js.read_text(encoding="utf-8")
+
         logger.info("✓ FLIP section with multiple colormaps test passed")
 
     def test_flip_section_not_generated_when_disabled(self, valid_config):